@@ -0,0 +1 @@
+# Benchmarks for events_grasp_service
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Storage Cleanup Benchmark
+
+Fills the local fake OpenAI server with N files (spread over M vector
+stores) and deletes them three ways: one blocking files.delete per file,
+as storage_cleanup used to; with the concurrent DeletionEngine; and with
+an engine run that is interrupted half way and then resumed from its
+deletion journal. Reports API calls, objects deleted and deletions/sec.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/cleanup_bench.py --files 1000 --latency 0.05
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+from backend.microservices.events_grasp_service.benchmarks.fake_openai import FakeOpenAI
+from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.deletion_engine import (
+    DEFAULT_DELETE_CONCURRENCY, DeletionEngine
+)
+from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.inventory import (
+    FILES, VECTOR_STORES
+)
+from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.request_scheduler import (
+    OpenAIRequestScheduler
+)
+
+
+def populate(server: FakeOpenAI, files: int, stores: int):
+    with server._lock:
+        store_ids = [server.route('POST', '/v1/vector_stores', {}, json.dumps({'name': f'store-{i}'}).encode())[1]['id']
+                     for i in range(stores)]
+        for i in range(files):
+            file_id = server.route('POST', '/v1/files', {}, b'filename="page-%05d.txt"\r\n\r\nbody' % i)[1]['id']
+            if store_ids:
+                server.attachments[store_ids[i % len(store_ids)]][file_id] = (0.0, False)
+
+
+def interrupting(client, after: int):
+    """The client, with files.delete raising KeyboardInterrupt after `after` calls (a Ctrl-C mid-run)."""
+    lock = threading.Lock()
+    calls = [0]
+
+    def delete(file_id):
+        with lock:
+            calls[0] += 1
+            if calls[0] > after:
+                raise KeyboardInterrupt
+        return client.files.delete(file_id)
+
+    return SimpleNamespace(files=SimpleNamespace(delete=delete), vector_stores=client.vector_stores)
+
+
+def stores_plan(engine: DeletionEngine, client):
+    def plan():
+        store_ids = [store.id for store in client.vector_stores.list(limit=100)]
+        file_ids = [i for attached in engine.list_store_files(store_ids).values() for i in attached]
+        return [(FILES, i) for i in file_ids] + [(VECTOR_STORES, i) for i in store_ids]
+    return plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Storage cleanup benchmark')
+    parser.add_argument('--files', type=int, default=1000, help='Files in the fake account')
+    parser.add_argument('--stores', type=int, default=20, help='Vector stores the files are attached to')
+    parser.add_argument('--latency', type=float, default=0.05, help='Fake API latency per request in seconds')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_DELETE_CONCURRENCY, help='Deletions in flight')
+    parser.add_argument('--max-rps', type=float, default=1000.0, help='Request scheduler rate cap')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    results = []
+    with FakeOpenAI(latency=args.latency) as server, tempfile.TemporaryDirectory() as tmp:
+        client = OpenAIRequestScheduler(max_rate=args.max_rps).client(api_key='sk-benchmark',
+                                                                       base_url=server.base_url)
+
+        def measure(mode: str, run) -> dict:
+            server.requests.clear()
+            objects = len(server.files) + len(server.vector_stores)
+            started = time.monotonic()
+            run()
+            seconds = time.monotonic() - started
+            deleted = objects - len(server.files) - len(server.vector_stores)
+            result = {'mode': mode, 'api_calls': sum(server.requests.values()), 'deleted': deleted,
+                      'left': len(server.files) + len(server.vector_stores), 'seconds': round(seconds, 3),
+                      'per_sec': round(deleted / seconds, 1)}
+            results.append(result)
+            return result
+
+        populate(server, args.files, 0)
+        measure('one file at a time (old)',
+                lambda: [client.files.delete(f.id) for f in client.files.list(limit=10000)])
+
+        populate(server, args.files, 0)
+        engine = DeletionEngine(client, concurrency=args.concurrency, journal_dir=Path(tmp))
+        measure(f'engine x{args.concurrency}',
+                lambda: engine.run('bench-files', lambda: [(FILES, f.id) for f in client.files.list(limit=10000)]))
+
+        populate(server, args.files, args.stores)
+        stopped = DeletionEngine(interrupting(client, args.files // 2), concurrency=args.concurrency,
+                                 journal_dir=Path(tmp))
+
+        def interrupted():
+            try:
+                stopped.run('bench-stores', stores_plan(stopped, client))
+            except KeyboardInterrupt:
+                pass
+        measure('stores + files, interrupted', interrupted)
+        measure('  resumed from journal', lambda: engine.run('bench-stores', stores_plan(engine, client)))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\n{args.files} files, {args.latency}s per request")
+    print("-" * 78)
+    print(f"{'mode':<28} {'API calls':>10} {'deleted':>8} {'left':>6} {'seconds':>9} {'deleted/s':>10}")
+    for r in results:
+        print(f"{r['mode']:<28} {r['api_calls']:>10} {r['deleted']:>8} {r['left']:>6} "
+              f"{r['seconds']:>9.2f} {r['per_sec']:>10}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Crawl Throughput Benchmark
+
+Crawls a local fixture site twice - once with the serial recursive
+scrape_page path and once with the concurrent CrawlEngine - and reports
+pages/sec for each.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/crawl_throughput.py --fanout 20 --latency 0.05
+"""
+
+import sys
+import json
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+from backend.microservices.events_grasp_service.benchmarks.fixture_site import FixtureSite, build_pages
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.aws_reinvent_2025.scraper import (
+    AWSReInventScraper
+)
+
+
+def run_once(base_url: str, serial: bool, concurrency: int, per_host_limit: int) -> dict:
+    """Run a single crawl against the fixture site and return its result summary."""
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = AWSReInventScraper(
+            output_dir=Path(tmp),
+            max_depth=2,
+            root_url=f"{base_url}/blogs/",
+            allowed_domain='127.0.0.1',
+            concurrency=concurrency,
+            per_host_limit=per_host_limit,
+            # Measure the engine itself, not the per-host pacing
+            max_host_rate=None
+        )
+        result = scraper.run(clear_existing=True, serial=serial)
+
+    pages = result['total_pages']
+    elapsed = result['elapsed_seconds']
+    return {
+        'mode': 'serial' if serial else f'concurrent (workers={concurrency}, per_host={per_host_limit})',
+        'pages': pages,
+        'elapsed_seconds': elapsed,
+        'pages_per_second': round(pages / elapsed, 2) if elapsed else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Crawl throughput benchmark')
+    parser.add_argument('--fanout', type=int, default=20, help='Posts linked from the root page')
+    parser.add_argument('--children', type=int, default=5, help='Posts linked from each first-level post')
+    parser.add_argument('--latency', type=float, default=0.05, help='Artificial server latency in seconds')
+    parser.add_argument('--concurrency', type=int, default=16, help='CrawlEngine worker count')
+    parser.add_argument('--per-host-limit', type=int, default=16, help='CrawlEngine per-host limit')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    pages = build_pages(fanout=args.fanout, children=args.children)
+    with FixtureSite(pages, latency=args.latency) as site:
+        results = [
+            run_once(site.base_url, serial=True, concurrency=1, per_host_limit=1),
+            run_once(site.base_url, serial=False, concurrency=args.concurrency,
+                     per_host_limit=args.per_host_limit)
+        ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"\nFixture site: {len(pages)} pages, {args.latency * 1000:.0f} ms latency")
+    print("-" * 72)
+    for r in results:
+        print(f"{r['mode']:<45} {r['pages']:>5} pages  {r['elapsed_seconds']:>7.2f}s  "
+              f"{r['pages_per_second']:>8.2f} pages/s")
+    serial, concurrent = results
+    if concurrent['elapsed_seconds']:
+        print(f"\nSpeedup: {serial['elapsed_seconds'] / concurrent['elapsed_seconds']:.1f}x")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+HTML Extraction Micro-Benchmark
+
+Runs every extraction backend over a corpus of saved pages and reports
+pages/sec and peak memory. Each backend runs in a fresh worker process so
+peak RSS is not polluted by the previous run; the Python heap peak is
+measured with tracemalloc (which does not see libxml2's C allocations, hence
+both numbers).
+
+The corpus is a directory of saved *.html files; without --corpus the
+synthetic fixture blog is used.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/extraction_bench.py --corpus ~/saved-pages
+"""
+
+import sys
+import json
+import time
+import resource
+import argparse
+import tracemalloc
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from backend.microservices.events_grasp_service.benchmarks.fixture_site import build_pages
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.extraction import (
+    EXTRACTION_BACKENDS, extract_page
+)
+
+FIXTURE_BASE_URL = "https://aws.amazon.com"
+
+
+def load_corpus(corpus_dir: str = None, paragraphs: int = 30) -> List[Tuple[str, bytes]]:
+    """
+    Load (url, html) pairs from a directory of saved pages, or build the fixture blog.
+
+    Args:
+        corpus_dir: Directory searched recursively for *.html / *.htm files
+        paragraphs: Body paragraphs per synthetic page
+
+    Returns:
+        List of (base_url, content) pairs
+    """
+    if corpus_dir is None:
+        pages = build_pages(paragraphs=paragraphs)
+        return [(FIXTURE_BASE_URL + path, body) for path, body in pages.items()]
+
+    root = Path(corpus_dir).expanduser()
+    files = sorted(p for p in root.rglob('*') if p.suffix.lower() in ('.html', '.htm'))
+    return [(p.resolve().as_uri(), p.read_bytes()) for p in files]
+
+
+def _max_rss_kb() -> int:
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def run_backend(backend: str, corpus_dir: str, paragraphs: int, repeat: int) -> Dict:
+    """Extract the whole corpus `repeat` times with one backend (runs in a worker process)."""
+    corpus = load_corpus(corpus_dir, paragraphs)
+    total_bytes = sum(len(content) for _, content in corpus)
+
+    # Warm up imports and parser state before measuring
+    extract_page(corpus[0][1], corpus[0][0], backend)
+    rss_before = _max_rss_kb()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    text_chars = 0
+    links = 0
+    for _ in range(repeat):
+        for url, content in corpus:
+            page = extract_page(content, url, backend)
+            text_chars += len(page.text)
+            links += len(page.links)
+    elapsed = time.perf_counter() - started
+    _, heap_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    pages = len(corpus) * repeat
+    return {
+        'backend': backend,
+        'pages': pages,
+        'input_mb': round(total_bytes * repeat / 1024 / 1024, 2),
+        'elapsed_seconds': round(elapsed, 3),
+        'pages_per_second': round(pages / elapsed, 2) if elapsed else 0.0,
+        'peak_rss_growth_mb': round((_max_rss_kb() - rss_before) / 1024, 2),
+        'peak_python_heap_mb': round(heap_peak / 1024 / 1024, 2),
+        'text_chars_per_page': text_chars // pages if pages else 0,
+        'links_per_page': round(links / pages, 1) if pages else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML extraction micro-benchmark')
+    parser.add_argument('--corpus', type=str, help='Directory of saved *.html pages (default: synthetic fixture blog)')
+    parser.add_argument('--paragraphs', type=int, default=30, help='Body paragraphs per synthetic page')
+    parser.add_argument('--repeat', type=int, default=3, help='Passes over the corpus per backend')
+    parser.add_argument('--backends', nargs='+', choices=sorted(EXTRACTION_BACKENDS),
+                        default=['bs4', 'lxml'], help='Backends to compare')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    corpus_size = len(load_corpus(args.corpus, args.paragraphs))
+    if not corpus_size:
+        print(f"No *.html files found in {args.corpus}")
+        return 1
+
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for backend in args.backends:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results.append(pool.submit(run_backend, backend, args.corpus, args.paragraphs, args.repeat).result())
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\nCorpus: {corpus_size} pages ({args.corpus or 'synthetic fixture blog'}), {args.repeat} passes")
+    print("-" * 84)
+    print(f"{'backend':<8} {'pages/s':>10} {'elapsed':>9} {'peak RSS +MB':>13} {'peak heap MB':>13} "
+          f"{'chars/page':>11} {'links/page':>11}")
+    for r in results:
+        print(f"{r['backend']:<8} {r['pages_per_second']:>10.1f} {r['elapsed_seconds']:>8.2f}s "
+              f"{r['peak_rss_growth_mb']:>13.2f} {r['peak_python_heap_mb']:>13.2f} "
+              f"{r['text_chars_per_page']:>11} {r['links_per_page']:>11}")
+
+    by_backend = {r['backend']: r for r in results}
+    if 'bs4' in by_backend and 'lxml' in by_backend and by_backend['bs4']['pages_per_second']:
+        speedup = by_backend['lxml']['pages_per_second'] / by_backend['bs4']['pages_per_second']
+        print(f"\nlxml speedup over bs4: {speedup:.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""
+Local fake OpenAI API server for upload benchmarks.
+
+Implements the Files and Vector Stores endpoints the vector store manager
+uses (files, vector stores, vector store files and file batches, with
+cursor pagination) in memory, with artificial per-request latency and a
+per-file processing time, so upload throughput can be measured without an
+API key or network access. An optional requests-per-window limit answers
+the excess with 429s and the API's rate-limit headers. Point the SDK at it with
+OpenAI(api_key=..., base_url=server.base_url).
+"""
+
+import re
+import json
+import time
+import threading
+from urllib.parse import parse_qs, urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+_FILENAME = re.compile(rb'filename="([^"]*)"')
+
+
+class _FakeServer(ThreadingHTTPServer):
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class FakeOpenAI:
+    """Threaded in-memory OpenAI Files / Vector Stores API."""
+
+    def __init__(self, latency: float = 0.05, processing_seconds: float = 0.2,
+                 poll_after_ms: int = 100, fail_every: int = 0, rate_limit: int = 0,
+                 rate_window: float = 1.0):
+        """
+        Args:
+            latency: Artificial latency per request in seconds
+            processing_seconds: Time a file spends in_progress after being attached
+            poll_after_ms: openai-poll-after-ms hint sent to the SDK's pollers
+            fail_every: Make every n-th attached file fail processing (0 = never)
+            rate_limit: Requests allowed per rate_window; the rest get 429 (0 = unlimited)
+            rate_window: Rate limit window in seconds
+        """
+        self.latency = latency
+        self.processing_seconds = processing_seconds
+        self.poll_after_ms = poll_after_ms
+        self.fail_every = fail_every
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.rate_limited = 0
+        self._window_start = 0.0
+        self._window_count = 0
+        self.files: Dict[str, Dict] = {}
+        self.vector_stores: Dict[str, Dict] = {}
+        # vector_store_id -> file_id -> (ready_at, failed)
+        self.attachments: Dict[str, Dict[str, tuple]] = {}
+        self.batches: Dict[str, Dict] = {}
+        self.requests: Dict[str, int] = {}
+        self._ids = 0
+        self._attached = 0
+        self._lock = threading.Lock()
+        self._server = _FakeServer(('127.0.0.1', 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _admit(self) -> Optional[float]:
+        """Count a request against the rate limit; returns seconds to the window reset."""
+        if not self.rate_limit:
+            return None
+        now = time.monotonic()
+        if now - self._window_start >= self.rate_window:
+            self._window_start, self._window_count = now, 0
+        self._window_count += 1
+        return self._window_start + self.rate_window - now
+
+    def _next_id(self, prefix: str) -> str:
+        self._ids += 1
+        return f"{prefix}-{self._ids:08d}"
+
+    # -- state (called with the lock held) ---------------------------------
+
+    def _attach(self, vector_store_id: str, file_id: str):
+        self._attached += 1
+        failed = bool(self.fail_every) and self._attached % self.fail_every == 0
+        self.attachments[vector_store_id][file_id] = (time.monotonic() + self.processing_seconds, failed)
+
+    def _file_status(self, vector_store_id: str, file_id: str) -> str:
+        ready_at, failed = self.attachments[vector_store_id][file_id]
+        if time.monotonic() < ready_at:
+            return 'in_progress'
+        return 'failed' if failed else 'completed'
+
+    def _vs_file(self, vector_store_id: str, file_id: str) -> Dict:
+        status = self._file_status(vector_store_id, file_id)
+        return {
+            'id': file_id, 'object': 'vector_store.file', 'created_at': int(time.time()),
+            'vector_store_id': vector_store_id, 'status': status, 'usage_bytes': self.files[file_id]['bytes'],
+            'last_error': {'code': 'server_error', 'message': 'Simulated failure'} if status == 'failed' else None
+        }
+
+    def _counts(self, vector_store_id: str, file_ids: List[str]) -> Dict:
+        counts = {'in_progress': 0, 'completed': 0, 'failed': 0, 'cancelled': 0, 'total': len(file_ids)}
+        for file_id in file_ids:
+            counts[self._file_status(vector_store_id, file_id)] += 1
+        return counts
+
+    def _vector_store(self, vector_store_id: str) -> Dict:
+        store = dict(self.vector_stores[vector_store_id])
+        store['file_counts'] = self._counts(vector_store_id, list(self.attachments[vector_store_id]))
+        return store
+
+    def _batch(self, batch_id: str) -> Dict:
+        batch = dict(self.batches[batch_id])
+        counts = self._counts(batch['vector_store_id'], batch.pop('file_ids'))
+        batch['file_counts'] = counts
+        batch['status'] = 'in_progress' if counts['in_progress'] else 'completed'
+        return batch
+
+    @staticmethod
+    def _page(items: List[Dict], query: Dict, default_limit: int) -> Dict:
+        limit = int(query.get('limit', [default_limit])[0])
+        after = query.get('after', [None])[0]
+        # Newest first unless asked otherwise, as the API does
+        if query.get('order', ['desc'])[0] == 'desc':
+            items = items[::-1]
+        start = 0
+        if after is not None:
+            start = next((i + 1 for i, item in enumerate(items) if item['id'] == after), len(items))
+        data = items[start:start + limit]
+        return {
+            'object': 'list', 'data': data, 'has_more': start + limit < len(items),
+            'first_id': data[0]['id'] if data else None, 'last_id': data[-1]['id'] if data else None
+        }
+
+    def route(self, method: str, path: str, query: Dict, body: bytes) -> Optional[tuple]:
+        """Handle one API call; returns (status, payload) or None for unknown routes."""
+        parts = path.strip('/').split('/')[1:]  # drop 'v1'
+        payload = json.loads(body) if body and body[:1] == b'{' else {}
+
+        if parts == ['files'] and method == 'POST':
+            match = _FILENAME.search(body)
+            file_id = self._next_id('file')
+            self.files[file_id] = {
+                'id': file_id, 'object': 'file', 'bytes': len(body), 'created_at': int(time.time()),
+                'filename': match.group(1).decode('utf-8') if match else 'upload', 'purpose': 'assistants',
+                'status': 'processed'
+            }
+            return 200, self.files[file_id]
+        if parts == ['files'] and method == 'GET':
+            return 200, self._page(list(self.files.values()), query, 10000)
+        if len(parts) == 2 and parts[0] == 'files':
+            if parts[1] not in self.files:
+                return 404, {'error': {'message': 'No such file', 'type': 'invalid_request_error'}}
+            if method == 'DELETE':
+                del self.files[parts[1]]
+                return 200, {'id': parts[1], 'object': 'file', 'deleted': True}
+            return 200, self.files[parts[1]]
+
+        if parts == ['vector_stores'] and method == 'POST':
+            store_id = self._next_id('vs')
+            self.vector_stores[store_id] = {
+                'id': store_id, 'object': 'vector_store', 'name': payload.get('name'), 'created_at': int(time.time()),
+                'last_active_at': int(time.time()), 'metadata': {}, 'status': 'completed', 'usage_bytes': 0
+            }
+            self.attachments[store_id] = {}
+            return 200, self._vector_store(store_id)
+        if parts == ['vector_stores'] and method == 'GET':
+            return 200, self._page([self._vector_store(i) for i in self.vector_stores], query, 20)
+        if len(parts) < 2 or parts[0] != 'vector_stores' or parts[1] not in self.vector_stores:
+            return None
+        store_id = parts[1]
+
+        if len(parts) == 2:
+            if method == 'DELETE':
+                del self.vector_stores[store_id]
+                del self.attachments[store_id]
+                return 200, {'id': store_id, 'object': 'vector_store.deleted', 'deleted': True}
+            return 200, self._vector_store(store_id)
+
+        if parts[2] == 'files':
+            if len(parts) == 3 and method == 'POST':
+                self._attach(store_id, payload['file_id'])
+                return 200, self._vs_file(store_id, payload['file_id'])
+            if len(parts) == 3:
+                return 200, self._page([self._vs_file(store_id, i) for i in self.attachments[store_id]], query, 20)
+            if parts[3] not in self.attachments[store_id]:
+                return 404, {'error': {'message': 'No such vector store file', 'type': 'invalid_request_error'}}
+            if method == 'DELETE':
+                del self.attachments[store_id][parts[3]]
+                return 200, {'id': parts[3], 'object': 'vector_store.file.deleted', 'deleted': True}
+            return 200, self._vs_file(store_id, parts[3])
+
+        if parts[2] == 'file_batches':
+            if len(parts) == 3 and method == 'POST':
+                batch_id = self._next_id('vsfb')
+                for file_id in payload['file_ids']:
+                    self._attach(store_id, file_id)
+                self.batches[batch_id] = {
+                    'id': batch_id, 'object': 'vector_store.files_batch', 'created_at': int(time.time()),
+                    'vector_store_id': store_id, 'file_ids': list(payload['file_ids'])
+                }
+                return 200, self._batch(batch_id)
+            if len(parts) >= 4 and parts[3] in self.batches:
+                if len(parts) == 4:
+                    return 200, self._batch(parts[3])
+                files = [self._vs_file(store_id, i) for i in self.batches[parts[3]]['file_ids']]
+                status = query.get('filter', [None])[0]
+                if status:
+                    files = [f for f in files if f['status'] == status]
+                return 200, self._page(files, query, 20)
+        return None
+
+    def _make_handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _handle(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                if api.latency:
+                    time.sleep(api.latency)
+                url = urlparse(self.path)
+                headers = {}
+                with api._lock:
+                    reset = api._admit()
+                    if reset is not None:
+                        remaining = max(0, api.rate_limit - api._window_count)
+                        headers = {
+                            'x-ratelimit-limit-requests': str(api.rate_limit),
+                            'x-ratelimit-remaining-requests': str(remaining),
+                            'x-ratelimit-reset-requests': f"{int(reset * 1000)}ms"
+                        }
+                    if reset is not None and api._window_count > api.rate_limit:
+                        api.rate_limited += 1
+                        headers['retry-after-ms'] = str(int(reset * 1000))
+                        result = 429, {'error': {'message': 'Rate limit reached for requests',
+                                                 'type': 'requests', 'code': 'rate_limit_exceeded'}}
+                    else:
+                        key = f"{self.command} {re.sub(r'/[a-z]+-[0-9]+', '/{id}', url.path)}"
+                        api.requests[key] = api.requests.get(key, 0) + 1
+                        result = api.route(self.command, url.path, parse_qs(url.query), body)
+                status, payload = result or (404, {'error': {'message': 'Unknown route', 'type': 'invalid_request_error'}})
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.send_header('openai-poll-after-ms', str(api.poll_after_ms))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
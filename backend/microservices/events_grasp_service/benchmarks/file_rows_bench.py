@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Vector Store File Rows Benchmark
+
+Records N uploaded-then-attached files in vector_store_files of a temporary
+SQLite database, the way an upload run does from its worker threads, and
+compares a commit per row change with BuildCheckpoint's buffered bulk
+upserts (one executemany transaction per flush). Reports transactions,
+seconds and row changes per second.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/file_rows_bench.py --files 2000
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.microservices.events_grasp_service.modules.core.integrations import migrator
+from backend.microservices.events_grasp_service.modules.core.integrations.db import DBManager
+from backend.microservices.events_grasp_service.modules.core.dao.impl.vector_store_file_dao import (
+    VectorStoreFileDAO
+)
+from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.build_checkpoint import (
+    BuildCheckpoint, COMPLETED, PROVIDER, UPLOADED, FLUSH_ROWS
+)
+
+
+def open_dao(db_path: Path) -> VectorStoreFileDAO:
+    # The migrator writes to its module-level path; point it at the temporary database
+    migrator.DB_PATH = db_path
+    migrator.apply_migrations()
+    return VectorStoreFileDAO(DBManager(f"sqlite:///{db_path}"))
+
+
+def file_row(i: int, status: str) -> dict:
+    return {
+        'content_hash': f"{i:064x}",
+        'file_name': f"session-{i:05d}.txt",
+        'status': status,
+        'source_file_location': f"/data/session-{i:05d}.txt",
+        'source_location_type': 'local_file',
+        'file_size_bytes': 4096,
+        'metadata': {'openai_file_id': f"file-{i:08d}"}
+    }
+
+
+def run_per_row(dao: VectorStoreFileDAO, store_id: int, files: int, threads: int) -> dict:
+    def record(i):
+        dao.upsert_files(store_id, [file_row(i, UPLOADED)])
+        dao.upsert_files(store_id, [file_row(i, COMPLETED)])
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(record, range(files)))
+    return {'mode': 'commit per row', 'transactions': 2 * files, 'seconds': time.monotonic() - started}
+
+
+def run_bulk(dao: VectorStoreFileDAO, store_id: int, files: int, threads: int, flush_rows: int) -> dict:
+    checkpoint = BuildCheckpoint(dao, store_id, 'vs-benchmark', flush_rows=flush_rows)
+
+    def record(i):
+        row = file_row(i, UPLOADED)
+        checkpoint.file_uploaded(Path(row['source_file_location']), row['content_hash'],
+                                 row['metadata']['openai_file_id'], row['file_size_bytes'])
+        checkpoint.files_attached([{
+            'file_id': row['metadata']['openai_file_id'],
+            'filename': row['file_name'],
+            'filepath': row['source_file_location'],
+            'status': COMPLETED,
+            'content_hash': row['content_hash']
+        }])
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(record, range(files)))
+    checkpoint.flush()
+    return {'mode': f'bulk, flush every {flush_rows}', 'transactions': checkpoint.flushes,
+            'seconds': time.monotonic() - started}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='vector_store_files write benchmark')
+    parser.add_argument('--files', type=int, default=2000, help='Files recorded per run')
+    parser.add_argument('--threads', type=int, default=8, help='Recording threads (upload workers)')
+    parser.add_argument('--flush-rows', type=int, default=FLUSH_ROWS, help='Buffered rows per bulk flush')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode, run in (('per_row', run_per_row), ('bulk', run_bulk)):
+            dao = open_dao(Path(tmp) / f"{mode}.db")
+            store_id = dao.create_store(PROVIDER, f"bench-{mode}", 'vs-benchmark')
+            extra = (args.flush_rows,) if run is run_bulk else ()
+            result = run(dao, store_id, args.files, args.threads, *extra)
+            rows = dao.list_files(store_id)
+            result.update({
+                'rows': len(rows),
+                'completed': sum(1 for row in rows if row['status'] == COMPLETED),
+                'row_changes_per_sec': round(2 * args.files / result['seconds'], 1),
+                'seconds': round(result['seconds'], 3)
+            })
+            results.append(result)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\n{args.files} files recorded as uploaded, then completed, from {args.threads} threads")
+    print("-" * 78)
+    print(f"{'mode':<24} {'transactions':>12} {'rows':>7} {'completed':>10} {'seconds':>9} {'changes/s':>11}")
+    for r in results:
+        print(f"{r['mode']:<24} {r['transactions']:>12} {r['rows']:>7} {r['completed']:>10} "
+              f"{r['seconds']:>9.3f} {r['row_changes_per_sec']:>11}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
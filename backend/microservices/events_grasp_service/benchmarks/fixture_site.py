@@ -0,0 +1,197 @@
+"""
+Local fixture HTTP server for scraper benchmarks.
+
+Serves a synthetic blog under /blogs/ with a configurable fan-out and
+artificial per-request latency, so crawl throughput can be measured
+without touching the network. Every page carries an ETag and honours
+If-None-Match, so incremental re-scrapes can be exercised too. An optional
+server-side rate limit answers excess requests with 429 and Retry-After, to
+exercise the scraper's rate controller. build_sitemaps() adds a gzip
+sitemap index for the pages, for sitemap discovery.
+"""
+
+import gzip
+import time
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+PARAGRAPH = (
+    "AWS announced a new capability that lets builders ship faster with less "
+    "operational overhead. The feature is available today in all commercial regions. "
+)
+
+
+def build_pages(fanout: int = 20, children: int = 5, paragraphs: int = 30) -> Dict[str, bytes]:
+    """
+    Build a two-level tree of blog pages.
+
+    Args:
+        fanout: Number of posts linked from the root page
+        children: Number of posts linked from every first-level post
+        paragraphs: Body paragraphs per page
+
+    Returns:
+        Dictionary mapping URL path to HTML body
+    """
+    def render(title: str, links) -> bytes:
+        anchors = ''.join(f'<li><a href="{href}">{href}</a></li>' for href in links)
+        body = ''.join(f'<p>{PARAGRAPH}</p>' for _ in range(paragraphs))
+        return (
+            f'<html><head><title>{title}</title></head><body>'
+            f'<nav><a href="/blogs/">Home</a></nav>'
+            f'<article><h1>{title}</h1>{body}<ul>{anchors}</ul></article>'
+            f'<footer>Copyright</footer></body></html>'
+        ).encode('utf-8')
+
+    pages = {}
+    level1 = [f'/blogs/post-{i}/' for i in range(fanout)]
+    pages['/blogs/'] = render('Fixture Blog', level1)
+    for i, path in enumerate(level1):
+        level2 = [f'/blogs/post-{i}-{j}/' for j in range(children)]
+        pages[path] = render(f'Post {i}', level2)
+        for j, child in enumerate(level2):
+            pages[child] = render(f'Post {i}-{j}', [])
+    return pages
+
+
+def build_sitemaps(paths: List[str], base_url: str, lastmod: str = '2025-01-01',
+                   per_file: int = 50000) -> Dict[str, bytes]:
+    """
+    Build a sitemap index at /sitemap.xml and gzip-compressed child sitemaps.
+
+    Args:
+        paths: Page paths to list
+        base_url: Site URL the <loc> entries are absolute to
+        lastmod: <lastmod> of every page
+        per_file: URLs per child sitemap
+
+    Returns:
+        Dictionary mapping URL path to body, to merge into the site's pages
+    """
+    files = {}
+    children = []
+    for start in range(0, len(paths), per_file):
+        path = f'/sitemap-{start // per_file}.xml.gz'
+        urls = ''.join(f'<url><loc>{base_url}{page}</loc><lastmod>{lastmod}</lastmod></url>'
+                       for page in paths[start:start + per_file])
+        files[path] = gzip.compress(
+            f'<?xml version="1.0" encoding="UTF-8"?>'
+            f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'.encode('utf-8')
+        )
+        children.append(path)
+    entries = ''.join(f'<sitemap><loc>{base_url}{path}</loc></sitemap>' for path in children)
+    files['/sitemap.xml'] = (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</sitemapindex>'
+    ).encode('utf-8')
+    return files
+
+
+class _FixtureServer(ThreadingHTTPServer):
+    # socketserver's default backlog of 5 drops SYNs under concurrent crawls,
+    # which shows up as 1s connect stalls (the initial TCP retransmit timeout)
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class FixtureSite:
+    """Threaded HTTP server serving pre-rendered pages with artificial latency."""
+
+    def __init__(self, pages: Dict[str, bytes], latency: float = 0.05,
+                 rate_limit: Optional[float] = None, retry_after: int = 1):
+        """
+        Args:
+            pages: URL path -> HTML body (a '/robots.txt' entry is served as text/plain)
+            latency: Artificial latency per request in seconds
+            rate_limit: Requests per second served before answering 429 (None = unlimited)
+            retry_after: Retry-After seconds sent with 429 responses
+        """
+        self.pages = pages
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.requests_served = 0
+        self.requests_throttled = 0
+        self._tokens = rate_limit or 0.0
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._server = _FixtureServer(('127.0.0.1', 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _admit(self) -> bool:
+        """Take a token from the server-side bucket (burst of one second)."""
+        if not self.rate_limit:
+            return True
+        now = time.monotonic()
+        self._tokens = min(self.rate_limit, self._tokens + (now - self._refilled_at) * self.rate_limit)
+        self._refilled_at = now
+        if self._tokens < 1:
+            self.requests_throttled += 1
+            return False
+        self._tokens -= 1
+        return True
+
+    def _make_handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with site._lock:
+                    site.requests_served += 1
+                    admitted = site._admit()
+                if site.latency:
+                    time.sleep(site.latency)
+
+                if not admitted:
+                    self.send_response(429)
+                    self.send_header('Retry-After', str(site.retry_after))
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                body = site.pages.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                if self.path == '/robots.txt':
+                    content_type = 'text/plain; charset=utf-8'
+                elif self.path.endswith('.xml.gz'):
+                    content_type = 'application/gzip'
+                elif self.path.endswith('.xml'):
+                    content_type = 'application/xml; charset=utf-8'
+                else:
+                    content_type = 'text/html; charset=utf-8'
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Scrape -> Upload Pipeline Benchmark
+
+Scrapes the local fixture site and uploads the pages to a simulated OpenAI
+client (fixed latency per file upload and per vector store attach), first
+sequentially - scrape, then upload every file - and then through the
+IngestPipeline, and reports the wall time of each.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/ingest_pipeline_bench.py --latency 0.3 --upload-latency 0.1
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+from backend.microservices.events_grasp_service.benchmarks.fixture_site import FixtureSite, build_pages
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.aws_reinvent_2025.scraper import (
+    AWSReInventScraper
+)
+from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.vector_store_manager import (
+    OpenAIVectorStoreManager
+)
+from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.upload_manifest import (
+    UploadManifest
+)
+from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.ingest_pipeline import (
+    DEFAULT_QUEUE_SIZE, DEFAULT_UPLOAD_WORKERS, IngestPipeline
+)
+
+
+class SimulatedOpenAI:
+    """The subset of the OpenAI client the uploads use, with fixed per-call latency."""
+
+    def __init__(self, upload_latency: float, attach_latency: float):
+        self._ids = iter(range(1, 10 ** 9))
+        self._lock = threading.Lock()
+
+        def next_id(prefix):
+            with self._lock:
+                return f"{prefix}-{next(self._ids)}"
+
+        def create_file(file, purpose):
+            time.sleep(upload_latency)
+            return SimpleNamespace(id=next_id('file'))
+
+        def attach(vector_store_id, file_id):
+            time.sleep(attach_latency)
+            return SimpleNamespace(id=file_id, status='completed')
+
+        def empty_list(**kwargs):
+            return SimpleNamespace(data=[], iter_pages=lambda: iter([SimpleNamespace(data=[])]))
+
+        self.files = SimpleNamespace(create=create_file, list=empty_list)
+        self.vector_stores = SimpleNamespace(
+            create=lambda name: SimpleNamespace(id=next_id('vs')),
+            list=empty_list,
+            files=SimpleNamespace(create_and_poll=attach)
+        )
+
+
+def make_manager(config_dir: Path, client: SimulatedOpenAI) -> OpenAIVectorStoreManager:
+    os.environ.setdefault('OPENAI_API_KEY', 'sk-benchmark')
+    manager = OpenAIVectorStoreManager(store_name='ingest-bench')
+    manager.client = client
+    manager.config_dir = config_dir
+    manager.config_file = config_dir / 'ingest-bench.json'
+    # Keep benchmark stores out of the application database
+    manager.checkpoint = False
+    return manager
+
+
+def make_scraper(base_url: str, output_dir: Path) -> AWSReInventScraper:
+    return AWSReInventScraper(
+        output_dir=output_dir,
+        max_depth=2,
+        root_url=f"{base_url}/blogs/",
+        allowed_domain='127.0.0.1',
+        concurrency=8,
+        per_host_limit=8,
+        max_host_rate=None
+    )
+
+
+def run_sequential(site: FixtureSite, tmp: Path, client: SimulatedOpenAI, upload_workers: int) -> dict:
+    """Scrape everything, then upload every saved file (upload_workers threads)."""
+    started = time.monotonic()
+    scraper = make_scraper(site.base_url, tmp / 'sequential')
+    result = scraper.run()
+    crawl_seconds = time.monotonic() - started
+
+    manager = make_manager(tmp, client)
+    manager.datasets_dir = scraper.output_dir
+    files = manager.get_content_files()
+    manifest = UploadManifest(tmp / 'sequential.uploads.json')
+    pending = iter(files)
+    lock = threading.Lock()
+
+    def upload():
+        while True:
+            with lock:
+                file_path = next(pending, None)
+            if file_path is None:
+                return
+            manager.upload_and_attach('vs-sequential', file_path, manifest)
+
+    threads = [threading.Thread(target=upload) for _ in range(upload_workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {
+        'mode': 'scrape, then upload',
+        'pages': result['total_pages'],
+        'files': len(files),
+        'crawl_seconds': round(crawl_seconds, 3),
+        'total_seconds': round(time.monotonic() - started, 3)
+    }
+
+
+def run_pipelined(site: FixtureSite, tmp: Path, client: SimulatedOpenAI, queue_size: int, upload_workers: int) -> dict:
+    """Scrape and upload through the IngestPipeline."""
+    pipeline = IngestPipeline(make_scraper(site.base_url, tmp / 'pipelined'), make_manager(tmp, client),
+                              queue_size=queue_size, upload_workers=upload_workers)
+    result = pipeline.run()
+    return {
+        'mode': f'pipelined (queue={queue_size})',
+        'pages': result['total_pages'],
+        'files': result['files_added'],
+        'crawl_seconds': result['crawl_seconds'],
+        'total_seconds': result['total_seconds'],
+        'backpressure_waits': result['backpressure_waits']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scrape -> upload pipeline benchmark')
+    parser.add_argument('--fanout', type=int, default=10, help='Posts linked from the root page')
+    parser.add_argument('--children', type=int, default=5, help='Posts linked from each first-level post')
+    parser.add_argument('--latency', type=float, default=0.3, help='Artificial server latency in seconds')
+    parser.add_argument('--upload-latency', type=float, default=0.1, help='Simulated files.create latency in seconds')
+    parser.add_argument('--attach-latency', type=float, default=0.1, help='Simulated attach-and-poll latency in seconds')
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE, help='Pipeline queue size')
+    parser.add_argument('--upload-workers', type=int, default=DEFAULT_UPLOAD_WORKERS, help='Upload threads')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    client = SimulatedOpenAI(args.upload_latency, args.attach_latency)
+    with FixtureSite(build_pages(args.fanout, args.children), latency=args.latency) as site, \
+            tempfile.TemporaryDirectory() as tmp:
+        results = [
+            run_sequential(site, Path(tmp), client, args.upload_workers),
+            run_pipelined(site, Path(tmp), client, args.queue_size, args.upload_workers)
+        ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\nUpload latency {args.upload_latency}s + attach {args.attach_latency}s per file, "
+          f"{args.upload_workers} upload workers")
+    print("-" * 78)
+    print(f"{'mode':<28} {'pages':>7} {'files':>7} {'crawl s':>9} {'total s':>9}")
+    for r in results:
+        print(f"{r['mode']:<28} {r['pages']:>7} {r['files']:>7} {r['crawl_seconds']:>9.2f} {r['total_seconds']:>9.2f}")
+    sequential, pipelined = results
+    if pipelined['total_seconds']:
+        print(f"\nPipelined speedup: {sequential['total_seconds'] / pipelined['total_seconds']:.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Remote Inventory Benchmark
+
+Fills the local fake OpenAI server with N files and M vector stores and
+compares the old single .list() call with the RemoteInventory: a cold
+listing (every page), a warm one (within the TTL) and an incremental
+refresh after a few new uploads. Reports objects seen, API calls and time.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/inventory_bench.py --files 2000 --stores 60
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+from openai import OpenAI
+
+from backend.microservices.events_grasp_service.benchmarks.fake_openai import FakeOpenAI
+from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.inventory import (
+    RemoteInventory
+)
+
+
+def populate(server: FakeOpenAI, files: int, stores: int):
+    with server._lock:
+        for i in range(files):
+            server.route('POST', '/v1/files', {}, b'filename="session-%05d.txt"\r\n\r\nbody' % i)
+        for i in range(stores):
+            server.route('POST', '/v1/vector_stores', {}, json.dumps({'name': f'store-{i}'}).encode('utf-8'))
+
+
+def measure(server: FakeOpenAI, mode: str, list_files, list_stores) -> dict:
+    server.requests.clear()
+    started = time.monotonic()
+    files, stores = list_files(), list_stores()
+    return {
+        'mode': mode,
+        'files': len(files),
+        'stores': len(stores),
+        'api_calls': sum(server.requests.values()),
+        'seconds': round(time.monotonic() - started, 3)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Remote inventory benchmark')
+    parser.add_argument('--files', type=int, default=2000, help='Files in the fake account')
+    parser.add_argument('--stores', type=int, default=60, help='Vector stores in the fake account')
+    parser.add_argument('--new', type=int, default=10, help='Files uploaded before the incremental refresh')
+    parser.add_argument('--latency', type=float, default=0.05, help='Fake API latency per request in seconds')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    with FakeOpenAI(latency=args.latency) as server, tempfile.TemporaryDirectory() as tmp:
+        populate(server, args.files, args.stores)
+        client = OpenAI(api_key='sk-benchmark', base_url=server.base_url, max_retries=0)
+        inventory = RemoteInventory(client, cache_dir=Path(tmp))
+
+        results = [
+            measure(server, 'single .list() (old)', lambda: client.files.list().data,
+                    lambda: client.vector_stores.list().data),
+            measure(server, 'inventory, cold', inventory.files, inventory.vector_stores),
+            measure(server, 'inventory, within TTL', inventory.files, inventory.vector_stores),
+        ]
+        populate(server, args.new, 0)
+        results.append(measure(server, f'inventory, +{args.new} files', lambda: inventory.files(max_age=0),
+                               lambda: inventory.vector_stores(max_age=0)))
+        # A new process reads the same cache file
+        reloaded = RemoteInventory(client, cache_dir=Path(tmp))
+        results.append(measure(server, 'new process, within TTL', reloaded.files, reloaded.vector_stores))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\nAccount with {args.files + args.new} files and {args.stores} vector stores, "
+          f"{args.latency}s per request")
+    print("-" * 68)
+    print(f"{'mode':<26} {'files':>7} {'stores':>7} {'API calls':>10} {'seconds':>9}")
+    for r in results:
+        print(f"{r['mode']:<26} {r['files']:>7} {r['stores']:>7} {r['api_calls']:>10} {r['seconds']:>9.3f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
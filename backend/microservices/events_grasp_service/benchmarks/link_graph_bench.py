@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Link Graph / PageRank Benchmark
+
+Builds a synthetic crawl graph with power-law in-degrees through
+LinkGraph.add_page (as the scraper does), then times CSR compaction,
+PageRank and save/load.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/link_graph_bench.py --pages 100000
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.link_graph import (
+    GRAPH_FILE, LinkGraph
+)
+
+
+def build_graph(pages: int, links_per_page: int, seed: int = 0) -> LinkGraph:
+    """Build a graph whose link targets follow a Pareto distribution (a few hubs, a long tail)."""
+    rng = np.random.default_rng(seed)
+    urls = [f"https://aws.amazon.com/blogs/post-{i}/" for i in range(pages)]
+    targets = (rng.pareto(1.2, (pages, links_per_page)) * 50).astype(np.int64) % pages
+    graph = LinkGraph()
+    for i in range(pages):
+        graph.add_page(urls[i], [urls[j] for j in targets[i]])
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Link graph and PageRank benchmark')
+    parser.add_argument('--pages', type=int, default=100000, help='Pages in the synthetic graph')
+    parser.add_argument('--links', type=int, default=10, help='Links per page')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    graph = build_graph(args.pages, args.links)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    indptr, indices = graph.csr()
+    csr_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    graph.rank()
+    rank_seconds = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / GRAPH_FILE
+        started = time.perf_counter()
+        graph.save(path)
+        save_seconds = time.perf_counter() - started
+        file_kb = path.stat().st_size // 1024
+        started = time.perf_counter()
+        LinkGraph.load(path)
+        load_seconds = time.perf_counter() - started
+
+    result = {
+        'pages': len(graph),
+        'links': int(len(indices)),
+        'build_seconds': round(build_seconds, 3),
+        'csr_seconds': round(csr_seconds, 3),
+        'pagerank_seconds': round(rank_seconds, 3),
+        'save_seconds': round(save_seconds, 3),
+        'load_seconds': round(load_seconds, 3),
+        'file_kb': file_kb,
+        'top_pages': [{'url': url, 'pagerank': round(score, 6)} for url, score in graph.top(5)]
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    print(f"\nGraph: {result['pages']} pages, {result['links']} unique links")
+    print("-" * 60)
+    for key in ('build_seconds', 'csr_seconds', 'pagerank_seconds', 'save_seconds', 'load_seconds'):
+        print(f"{key.replace('_seconds', ''):<10} {result[key]:>8.3f}s")
+    print(f"file       {file_kb:>8} KB")
+    print("\nTop pages:")
+    for page in result['top_pages']:
+        print(f"  {page['pagerank']:.6f}  {page['url']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Small-Page Packing Benchmark
+
+Builds a vector store from N short generated blog posts on the local fake
+OpenAI server, once uploading every page as its own file and once with
+--pack (pages bundled ~20 to a file), then edits a few posts and syncs both
+stores. Reports API calls, uploads, file objects created and seconds, and
+checks that every page can be resolved back from its bundle's file id.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/pack_bench.py --pages 2000
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+from backend.microservices.events_grasp_service.benchmarks.fake_openai import FakeOpenAI
+from backend.microservices.events_grasp_service.benchmarks.upload_bench import make_manager
+from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.page_packer import (
+    BundleMap
+)
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.content_store import (
+    render_document
+)
+
+
+def write_posts(directory: Path, count: int, size: int) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        text = (f"Post {i}. " + "Short announcement of a new service feature. " * (size // 45 + 1))[:size]
+        document = render_document(f"https://aws.amazon.com/blogs/news/post-{i:05d}/", f"Post {i}",
+                                   '2025-12-01T00:00:00', text)
+        (directory / f"post-{i:05d}.txt").write_text(document, encoding='utf-8')
+    return directory
+
+
+def measure(server: FakeOpenAI, scenario: str, run) -> dict:
+    server.requests.clear()
+    files_before = len(server.files)
+    started = time.monotonic()
+    result = run()
+    return {
+        'scenario': scenario,
+        'seconds': round(time.monotonic() - started, 3),
+        'api_calls': sum(server.requests.values()),
+        'uploads': server.requests.get('POST /v1/files', 0),
+        'file_objects': len(server.files) - files_before,
+        'attached': len(server.attachments[result['vector_store_id']])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Small-page packing benchmark')
+    parser.add_argument('--pages', type=int, default=2000, help='Blog posts in the corpus')
+    parser.add_argument('--size', type=int, default=1500, help='Characters of text per post')
+    parser.add_argument('--edited', type=int, default=5, help='Posts edited before the sync')
+    parser.add_argument('--latency', type=float, default=0.02, help='Fake API latency per request in seconds')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    results = []
+    with FakeOpenAI(latency=args.latency, processing_seconds=0.05, poll_after_ms=50) as server, \
+            tempfile.TemporaryDirectory() as tmp:
+        datasets_dir = write_posts(Path(tmp) / 'content', args.pages, args.size)
+        plain = make_manager(server, Path(tmp), datasets_dir, 'pack-bench-plain', 8)
+        packed = make_manager(server, Path(tmp), datasets_dir, 'pack-bench-packed', 8)
+        packed.pack = True
+
+        results.append(measure(server, 'create, file per page', plain.create_vector_store))
+        results.append(measure(server, 'create, packed', packed.create_vector_store))
+
+        for file_path in sorted(datasets_dir.glob('*.txt'))[::args.pages // max(1, args.edited)][:args.edited]:
+            file_path.write_text(file_path.read_text() + ' Updated.', encoding='utf-8')
+        results.append(measure(server, f'sync {args.edited} edited, per page', plain.sync_vector_store))
+        results.append(measure(server, f'sync {args.edited} edited, packed', packed.sync_vector_store))
+
+        bundle_map = BundleMap(packed.bundle_map_file)
+        resolved = set()
+        for bundle in bundle_map.bundles.values():
+            resolved.update(page['filename'] for page in bundle_map.resolve(bundle['file_id']))
+
+    if args.json:
+        print(json.dumps({'results': results, 'bundles': len(bundle_map), 'pages_resolved': len(resolved)},
+                         indent=2))
+        return 0
+
+    print(f"\n{args.pages} posts of {args.size} characters, {args.latency}s per request")
+    print("-" * 84)
+    print(f"{'scenario':<28} {'seconds':>9} {'API calls':>10} {'uploads':>9} {'file objects':>13} {'attached':>9}")
+    for r in results:
+        print(f"{r['scenario']:<28} {r['seconds']:>9.2f} {r['api_calls']:>10} {r['uploads']:>9} "
+              f"{r['file_objects']:>13} {r['attached']:>9}")
+    print(f"\nBundle map: {len(bundle_map)} bundles; {len(resolved)}/{args.pages} pages resolvable by file id")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Parse Pool Scaling Benchmark
+
+Crawls a zero-latency fixture site (served from a separate process so it does
+not compete for the crawler's GIL) with an increasing number of parse worker
+processes and reports pages/sec and speedup over inline parsing. With fetch
+cost near zero the run is CPU-bound, which is the situation when
+re-processing a large crawl.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/parse_pool_bench.py --workers 0 1 2 4 8
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+import tempfile
+import multiprocessing
+from pathlib import Path
+from contextlib import contextmanager
+
+from backend.microservices.events_grasp_service.benchmarks.fixture_site import FixtureSite, build_pages
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.extraction import EXTRACTION_BACKENDS
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.aws_reinvent_2025.scraper import (
+    AWSReInventScraper
+)
+
+
+def _serve(fanout: int, children: int, paragraphs: int, conn):
+    pages = build_pages(fanout=fanout, children=children, paragraphs=paragraphs)
+    with FixtureSite(pages, latency=0) as site:
+        conn.send((site.base_url, len(pages)))
+        conn.recv()
+
+
+@contextmanager
+def fixture_site_process(fanout: int, children: int, paragraphs: int):
+    """Run the fixture site in a child process and yield (base_url, page_count)."""
+    parent_conn, child_conn = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_serve, args=(fanout, children, paragraphs, child_conn), daemon=True)
+    process.start()
+    try:
+        yield parent_conn.recv()
+    finally:
+        parent_conn.send('stop')
+        process.join(timeout=5)
+
+
+def run_once(base_url: str, parse_workers: int, parser: str, concurrency: int) -> dict:
+    """Crawl the fixture site once and return its result summary."""
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = AWSReInventScraper(
+            output_dir=Path(tmp),
+            max_depth=2,
+            root_url=f"{base_url}/blogs/",
+            allowed_domain='127.0.0.1',
+            concurrency=concurrency,
+            per_host_limit=concurrency,
+            parser=parser,
+            parse_workers=parse_workers,
+            # Measure parsing, not the per-host pacing
+            max_host_rate=None
+        )
+        result = scraper.run(clear_existing=True)
+
+    pages = result['total_pages']
+    elapsed = result['elapsed_seconds']
+    return {
+        'parse_workers': parse_workers,
+        'pages': pages,
+        'elapsed_seconds': elapsed,
+        'pages_per_second': round(pages / elapsed, 2) if elapsed else 0.0
+    }
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='Parse pool scaling benchmark')
+    parser.add_argument('--fanout', type=int, default=40, help='Posts linked from the root page')
+    parser.add_argument('--children', type=int, default=25, help='Posts linked from each first-level post')
+    parser.add_argument('--paragraphs', type=int, default=60, help='Body paragraphs per page')
+    parser.add_argument('--workers', type=int, nargs='+', default=sorted({0, 1, 2, 4, cpus}),
+                        help='Parse worker counts to compare (0 = inline)')
+    parser.add_argument('--parser', choices=sorted(EXTRACTION_BACKENDS), default='bs4',
+                        help='Extraction backend (default: bs4, the CPU-heavier one)')
+    parser.add_argument('--concurrency', type=int, default=32, help='CrawlEngine worker count')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with fixture_site_process(args.fanout, args.children, args.paragraphs) as (base_url, page_count):
+        results = [run_once(base_url, workers, args.parser, args.concurrency) for workers in args.workers]
+
+    baseline = results[0]['elapsed_seconds']
+    for r in results:
+        r['speedup'] = round(baseline / r['elapsed_seconds'], 2) if r['elapsed_seconds'] else 0.0
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\nFixture site: {page_count} pages, parser={args.parser}, {cpus} CPUs")
+    print("-" * 64)
+    for r in results:
+        label = 'inline' if r['parse_workers'] == 0 else f"{r['parse_workers']} workers"
+        print(f"{label:<12} {r['pages']:>6} pages  {r['elapsed_seconds']:>7.2f}s  "
+              f"{r['pages_per_second']:>8.1f} pages/s  {r['speedup']:>5.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
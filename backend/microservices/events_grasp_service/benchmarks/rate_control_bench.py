@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Rate Controller Benchmark
+
+Crawls a fixture site that answers 429 + Retry-After above a server-side
+request rate, once without rate control and once with the adaptive per-host
+controller, and reports pages saved, pages/sec, throttle events and latency
+percentiles. An optional robots.txt Crawl-delay caps the controller.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/rate_control_bench.py --server-rate 25
+"""
+
+import sys
+import json
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from backend.microservices.events_grasp_service.benchmarks.fixture_site import FixtureSite, build_pages
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.aws_reinvent_2025.scraper import (
+    AWSReInventScraper
+)
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.rate_control import (
+    DEFAULT_INITIAL_RATE
+)
+
+
+def run_once(base_url: str, concurrency: int, host_rate: float, max_host_rate: Optional[float]) -> Dict:
+    """Crawl the fixture site once and return its result summary."""
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = AWSReInventScraper(
+            output_dir=Path(tmp),
+            max_depth=2,
+            root_url=f"{base_url}/blogs/",
+            allowed_domain='127.0.0.1',
+            concurrency=concurrency,
+            per_host_limit=concurrency,
+            host_rate=host_rate,
+            max_host_rate=max_host_rate
+        )
+        result = scraper.run(clear_existing=True)
+
+    host = next(iter(result['host_rates'].values()), {})
+    latency = host.get('latency_ms') or {}
+    elapsed = result['elapsed_seconds']
+    return {
+        'mode': f'adaptive (max {max_host_rate}/s)' if max_host_rate else 'no rate control',
+        'pages': result['total_pages'],
+        'elapsed_seconds': elapsed,
+        'pages_per_second': round(result['total_pages'] / elapsed, 2) if elapsed else 0.0,
+        'throttle_events': result['throttle_events'],
+        'final_rate': host.get('rate'),
+        'peak_rate': host.get('peak_rate'),
+        'latency_p50_ms': latency.get('p50'),
+        'latency_p99_ms': latency.get('p99')
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Adaptive rate controller benchmark')
+    parser.add_argument('--fanout', type=int, default=20, help='Posts linked from the root page')
+    parser.add_argument('--children', type=int, default=5, help='Posts linked from each first-level post')
+    parser.add_argument('--latency', type=float, default=0.02, help='Artificial server latency in seconds')
+    parser.add_argument('--server-rate', type=float, default=25.0, help='Requests/sec the site serves before 429')
+    parser.add_argument('--crawl-delay', type=float, help='Crawl-delay to publish in robots.txt')
+    parser.add_argument('--concurrency', type=int, default=16, help='CrawlEngine worker count')
+    parser.add_argument('--host-rate', type=float, default=DEFAULT_INITIAL_RATE, help='Initial requests/sec per host')
+    parser.add_argument('--max-host-rate', type=float, default=100.0, help='Controller ceiling in requests/sec')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    # The unthrottled run logs every 429 as a failed fetch
+    logging.getLogger().setLevel(logging.CRITICAL)
+
+    pages = build_pages(fanout=args.fanout, children=args.children)
+    if args.crawl_delay:
+        pages['/robots.txt'] = f"User-agent: *\nCrawl-delay: {args.crawl_delay}\n".encode('utf-8')
+
+    results = []
+    for max_host_rate in (None, args.max_host_rate):
+        with FixtureSite(pages, latency=args.latency, rate_limit=args.server_rate) as site:
+            r = run_once(site.base_url, args.concurrency, args.host_rate, max_host_rate)
+            r['requests_throttled_by_server'] = site.requests_throttled
+            results.append(r)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    expected = sum(1 for path in pages if path != '/robots.txt')
+    print(f"\nFixture site: {expected} pages, server limit {args.server_rate} req/s, "
+          f"{args.latency * 1000:.0f} ms latency")
+    print("-" * 96)
+    for r in results:
+        print(f"{r['mode']:<28} {r['pages']:>4} pages  {r['elapsed_seconds']:>7.2f}s  "
+              f"{r['pages_per_second']:>7.2f} pages/s  {r['requests_throttled_by_server']:>4} x 429  "
+              f"p50 {r['latency_p50_ms'] or 0:>6.1f} ms  rate {r['final_rate'] or 0:>6.2f}/s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
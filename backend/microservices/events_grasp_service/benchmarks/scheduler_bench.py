@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+OpenAI Request Scheduler Benchmark
+
+Creates a vector store from N generated content files on the local fake
+OpenAI server with a requests-per-second limit, once with the SDK's own
+retry handling (max_retries as given, default 2) and once through the
+rate-limit-aware request scheduler, and reports files attached, failed
+uploads, 429s received, retries and achieved requests/sec.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/scheduler_bench.py --files 300 --rate-limit 40
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+from openai import OpenAI
+
+from backend.microservices.events_grasp_service.benchmarks.fake_openai import FakeOpenAI
+from backend.microservices.events_grasp_service.benchmarks.upload_bench import make_manager, write_files
+
+
+def run(mode: str, server_args: dict, tmp: Path, datasets_dir: Path, upload_concurrency: int,
+        sdk_retries: int = None) -> dict:
+    with FakeOpenAI(**server_args) as server:
+        manager = make_manager(server, tmp, datasets_dir, f"scheduler-bench-{mode}", upload_concurrency)
+        if sdk_retries is not None:
+            manager.client = OpenAI(api_key='sk-benchmark', base_url=server.base_url, max_retries=sdk_retries)
+        started = time.monotonic()
+        try:
+            result = manager.create_vector_store()
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        seconds = time.monotonic() - started
+        config = manager.load_config() or {}
+        attached = sum(1 for f in config.get('files', []) if f['status'] == 'completed')
+        served = sum(server.requests.values())
+        return {
+            'mode': mode,
+            'success': result['success'],
+            'attached': attached,
+            'seconds': round(seconds, 3),
+            'served_requests': served,
+            'rate_limited': server.rate_limited,
+            'requests_per_sec': round((served + server.rate_limited) / seconds, 1),
+            # The plain SDK client bypasses the manager's scheduler
+            'api': result.get('api') if sdk_retries is None else None
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='OpenAI request scheduler benchmark')
+    parser.add_argument('--files', type=int, default=300, help='Content files to upload')
+    parser.add_argument('--rate-limit', type=int, default=40, help='Requests per second the fake API allows')
+    parser.add_argument('--latency', type=float, default=0.02, help='Fake API latency per request in seconds')
+    parser.add_argument('--upload-concurrency', type=int, default=16, help='Parallel uploads')
+    parser.add_argument('--sdk-retries', type=int, default=2, help='max_retries of the plain SDK client')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.ERROR)
+    server_args = dict(latency=args.latency, processing_seconds=0.1, poll_after_ms=100, rate_limit=args.rate_limit)
+    with tempfile.TemporaryDirectory() as tmp:
+        datasets_dir = write_files(Path(tmp) / 'content', args.files, 2000)
+        results = [
+            run(f'SDK, max_retries={args.sdk_retries}', server_args, Path(tmp), datasets_dir,
+                args.upload_concurrency, sdk_retries=args.sdk_retries),
+            run('request scheduler', server_args, Path(tmp), datasets_dir, args.upload_concurrency)
+        ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\n{args.files} files, fake API limited to {args.rate_limit} requests/sec, "
+          f"{args.upload_concurrency} parallel uploads")
+    print("-" * 84)
+    print(f"{'mode':<22} {'attached':>9} {'seconds':>9} {'served':>8} {'429s':>7} {'req/sec':>8} {'retries':>8}")
+    for r in results:
+        retries = r['api']['retries'] if r['api'] else '-'
+        print(f"{r['mode']:<22} {r['attached']:>9} {r['seconds']:>9.2f} {r['served_requests']:>8} "
+              f"{r['rate_limited']:>7} {r['requests_per_sec']:>8.1f} {retries:>8}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
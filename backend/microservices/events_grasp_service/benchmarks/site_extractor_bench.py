@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Site Extractor Benchmark
+
+Extracts a corpus of aws.amazon.com/blogs pages with the generic lxml path
+and with the registered site-specific extractor, and reports extraction
+speed and the bytes of text kept per page - the difference is boilerplate
+that no longer gets written, embedded and uploaded.
+
+The corpus is a directory of saved *.html blog posts (their URLs are taken
+as --base-url plus the file name); without --corpus, synthetic pages with
+the blog's markup and page chrome are used.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/site_extractor_bench.py --corpus ~/saved-blog-posts
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from backend.microservices.events_grasp_service.benchmarks.fixture_site import PARAGRAPH
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.extraction import (
+    SITE_EXTRACTORS, extract_page
+)
+
+DEFAULT_BASE_URL = "https://aws.amazon.com/blogs/aws/"
+
+
+def render_blog_post(index: int, paragraphs: int) -> bytes:
+    """Render a page with the aws.amazon.com blog post markup and its div-based page chrome."""
+    menu = ''.join(f'<li><a href="/products/service-{i}/">Service {i} - managed offering</a></li>' for i in range(150))
+    related = ''.join(f'<li><a href="/blogs/aws/post-{i}/">Related announcement {i}</a></li>' for i in range(10))
+    tags = ''.join(f'<a href="/blogs/aws/tag/topic-{i}/" rel="tag">Topic {i}</a> ' for i in range(8))
+    body = ''.join(f'<p>{PARAGRAPH}</p>' for _ in range(paragraphs))
+    return (
+        f'<html><head><title>Post {index} | AWS News Blog</title>'
+        f'<meta property="og:title" content="Post {index}"><meta name="author" content="Jane Doe"></head><body>'
+        f'<div id="aws-page-header"><div class="m-nav"><ul>{menu}</ul></div>'
+        f'<div class="m-search">Search in AWS Blogs Sign In to the Console Create an AWS Account</div></div>'
+        f'<div class="lb-row"><div class="lb-col lb-mid-18">'
+        f'<div class="blog-breadcrumbs">AWS Blog Home Blogs Editions</div>'
+        f'<article class="blog-post" typeof="TechArticle">'
+        f'<h1 class="lb-h2 blog-post-title" property="name headline">Post {index}</h1>'
+        f'<footer class="blog-post-meta">by <span property="author" typeof="Person">'
+        f'<span property="name">Jane Doe</span></span> on '
+        f'<time property="datePublished" datetime="2025-11-{index % 28 + 1:02d}T09:00:00-08:00">'
+        f'{index % 28 + 1:02d} NOV 2025</time> in <span class="blog-post-categories">{tags}</span> '
+        f'| Permalink | Comments | Share</footer>'
+        f'<section class="blog-post-content lb-rtxt" property="articleBody">{body}</section>'
+        f'<footer class="blog-post-tags">Tags: {tags}</footer></article>'
+        f'<div class="blog-comments">Comments Loading comments... Leave a comment</div></div>'
+        f'<div class="lb-col lb-tiny-24 lb-mid-6 lb-sidebar"><div class="lb-widget">Resources '
+        f'Getting Started What\'s New Top Posts Official AWS Podcast Case Studies</div>'
+        f'<div class="lb-widget">Follow Twitter Facebook LinkedIn Twitch Email Updates</div>'
+        f'<div class="lb-widget">Related posts<ul>{related}</ul></div></div></div>'
+        f'<div id="aws-page-footer"><div class="lb-footer">Learn About AWS What Is AWS? What Is Cloud Computing? '
+        f'AWS Inclusion, Diversity &amp; Equity Careers at AWS Investor Relations Press Releases '
+        f'Resources for AWS Getting Started Training and Certification Developers on AWS Help Contact Us '
+        f'Privacy Site Terms Cookie Preferences &copy; 2025, Amazon Web Services, Inc. or its affiliates.</div></div>'
+        f'</body></html>'
+    ).encode('utf-8')
+
+
+def load_corpus(corpus_dir: str, base_url: str, pages: int, paragraphs: int) -> List[Tuple[str, bytes]]:
+    """
+    Load (url, html) pairs from a directory of saved blog posts, or render synthetic ones.
+
+    Args:
+        corpus_dir: Directory searched recursively for *.html / *.htm files
+        base_url: URL prefix the saved files are served under
+        pages: Synthetic pages to render
+        paragraphs: Body paragraphs per synthetic page
+
+    Returns:
+        List of (url, content) pairs
+    """
+    if corpus_dir is None:
+        return [(f"{base_url}post-{i}/", render_blog_post(i, paragraphs)) for i in range(pages)]
+
+    root = Path(corpus_dir).expanduser()
+    files = sorted(p for p in root.rglob('*') if p.suffix.lower() in ('.html', '.htm'))
+    return [(f"{base_url}{p.stem}/", p.read_bytes()) for p in files]
+
+
+def run_once(corpus: List[Tuple[str, bytes]], site_extractors: bool, repeat: int) -> Dict:
+    """Extract the corpus `repeat` times and return speed and output size."""
+    extract_page(corpus[0][1], corpus[0][0], site_extractors=site_extractors)
+
+    started = time.perf_counter()
+    text_bytes = 0
+    matched = 0
+    for _ in range(repeat):
+        for url, content in corpus:
+            page = extract_page(content, url, site_extractors=site_extractors)
+            text_bytes += len(page.text.encode('utf-8'))
+            matched += page.extractor is not None
+    elapsed = time.perf_counter() - started
+
+    pages = len(corpus) * repeat
+    return {
+        'mode': 'site extractor' if site_extractors else 'generic',
+        'pages': pages,
+        'site_extracted': matched,
+        'elapsed_seconds': round(elapsed, 3),
+        'pages_per_second': round(pages / elapsed, 2) if elapsed else 0.0,
+        'text_bytes_per_page': text_bytes // pages if pages else 0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Site-specific extractor benchmark')
+    parser.add_argument('--corpus', type=str, help='Directory of saved blog post *.html files (default: synthetic)')
+    parser.add_argument('--base-url', type=str, default=DEFAULT_BASE_URL,
+                        help=f'URL prefix of the corpus pages (default: {DEFAULT_BASE_URL})')
+    parser.add_argument('--pages', type=int, default=200, help='Synthetic pages')
+    parser.add_argument('--paragraphs', type=int, default=12, help='Body paragraphs per synthetic page')
+    parser.add_argument('--repeat', type=int, default=3, help='Passes over the corpus per mode')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    if SITE_EXTRACTORS.match(args.base_url) is None:
+        print(f"No site extractor registered for {args.base_url}")
+        return 1
+    corpus = load_corpus(args.corpus, args.base_url, args.pages, args.paragraphs)
+    if not corpus:
+        print(f"No *.html files found in {args.corpus}")
+        return 1
+
+    generic = run_once(corpus, site_extractors=False, repeat=args.repeat)
+    site = run_once(corpus, site_extractors=True, repeat=args.repeat)
+    saved = generic['text_bytes_per_page'] - site['text_bytes_per_page']
+    summary = {
+        'results': [generic, site],
+        'bytes_saved_per_page': saved,
+        'percent_saved': round(100.0 * saved / generic['text_bytes_per_page'], 1) if generic['text_bytes_per_page'] else 0.0
+    }
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    print(f"\nCorpus: {len(corpus)} pages ({args.corpus or 'synthetic blog posts'}), {args.repeat} passes")
+    print("-" * 72)
+    print(f"{'mode':<16} {'pages/s':>10} {'elapsed':>9} {'text bytes/page':>16} {'site-extracted':>15}")
+    for r in summary['results']:
+        print(f"{r['mode']:<16} {r['pages_per_second']:>10.1f} {r['elapsed_seconds']:>8.2f}s "
+              f"{r['text_bytes_per_page']:>16} {r['site_extracted']:>15}")
+    print(f"\nBytes saved per page: {saved} ({summary['percent_saved']}%)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
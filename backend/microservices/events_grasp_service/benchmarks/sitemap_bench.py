@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Sitemap Discovery Benchmark
+
+Scrapes a local fixture site by following links, from its gzip sitemap
+index, and again from the sitemap in incremental mode (where <lastmod>
+lets unchanged pages be skipped), and reports the requests the site served
+and the wall time of each run.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/sitemap_bench.py --fanout 20 --latency 0.05
+"""
+
+import sys
+import json
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+from backend.microservices.events_grasp_service.benchmarks.fixture_site import (
+    FixtureSite, build_pages, build_sitemaps
+)
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.aws_reinvent_2025.scraper import (
+    AWSReInventScraper
+)
+
+
+def run_once(site: FixtureSite, output_dir: Path, mode: str, sitemap: bool, incremental: bool) -> dict:
+    """Run a single scrape against the fixture site and return its result summary."""
+    served = site.requests_served
+    scraper = AWSReInventScraper(
+        output_dir=output_dir,
+        max_depth=2,
+        root_url=f"{site.base_url}/blogs/",
+        allowed_domain='127.0.0.1',
+        concurrency=16,
+        per_host_limit=16,
+        max_host_rate=None,
+        sitemap=sitemap,
+        incremental=incremental
+    )
+    result = scraper.run(clear_existing=not incremental)
+    return {
+        'mode': mode,
+        'pages': result['total_pages'],
+        'requests': site.requests_served - served,
+        'unchanged': result['pages_unchanged'],
+        'elapsed_seconds': result['elapsed_seconds']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sitemap discovery benchmark')
+    parser.add_argument('--fanout', type=int, default=20, help='Posts linked from the root page')
+    parser.add_argument('--children', type=int, default=5, help='Posts linked from each first-level post')
+    parser.add_argument('--latency', type=float, default=0.05, help='Artificial server latency in seconds')
+    parser.add_argument('--per-sitemap', type=int, default=50, help='URLs per child sitemap')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    pages = build_pages(args.fanout, args.children)
+    with FixtureSite(dict(pages), latency=args.latency) as site, tempfile.TemporaryDirectory() as tmp:
+        site.pages.update(build_sitemaps(sorted(pages), site.base_url, per_file=args.per_sitemap))
+        results = [
+            run_once(site, Path(tmp) / 'links', 'follow links', sitemap=False, incremental=False),
+            run_once(site, Path(tmp) / 'sitemap', 'sitemap', sitemap=True, incremental=True),
+            run_once(site, Path(tmp) / 'sitemap', 'sitemap, incremental re-run', sitemap=True, incremental=True)
+        ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\nFixture site: {len(pages)} pages, latency={args.latency}s")
+    print("-" * 78)
+    print(f"{'mode':<30} {'pages':>7} {'requests':>9} {'unchanged':>10} {'seconds':>9}")
+    for r in results:
+        print(f"{r['mode']:<30} {r['pages']:>7} {r['requests']:>9} {r['unchanged']:>10} {r['elapsed_seconds']:>9.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Vector Store Sync Benchmark
+
+Creates a vector store from N generated content files on the local fake
+OpenAI server, then syncs it after different corpus changes - none, some
+files edited in place, renamed, deleted - and reports the API calls and
+files.create uploads each run made. --action update runs
+update_vector_store instead of sync_vector_store.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/sync_bench.py --files 500 --changed 10
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+from backend.microservices.events_grasp_service.benchmarks.fake_openai import FakeOpenAI
+from backend.microservices.events_grasp_service.benchmarks.upload_bench import make_manager, write_files
+
+
+def run_sync(server: FakeOpenAI, manager, action: str, scenario: str, **kwargs) -> dict:
+    server.requests.clear()
+    started = time.monotonic()
+    if action == 'update':
+        result = manager.update_vector_store()
+    else:
+        result = manager.sync_vector_store(**kwargs)
+    vector_store_id = result['vector_store_id']
+    return {
+        'scenario': scenario,
+        'seconds': round(time.monotonic() - started, 3),
+        'api_calls': sum(server.requests.values()),
+        'uploads': server.requests.get('POST /v1/files', 0),
+        'detached': result.get('detached', result.get('replaced_files', 0)),
+        'deleted': result.get('files_deleted', 0),
+        'attached_remotely': len(server.attachments[vector_store_id])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vector store sync benchmark')
+    parser.add_argument('--files', type=int, default=500, help='Content files in the corpus')
+    parser.add_argument('--changed', type=int, default=10, help='Files edited / renamed / deleted per scenario')
+    parser.add_argument('--latency', type=float, default=0.02, help='Fake API latency per request in seconds')
+    parser.add_argument('--action', choices=['sync', 'update'], default='sync', help='Manager method to run')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    with FakeOpenAI(latency=args.latency, processing_seconds=0.05, poll_after_ms=50) as server, \
+            tempfile.TemporaryDirectory() as tmp:
+        datasets_dir = write_files(Path(tmp) / 'content', args.files, 2000)
+        manager = make_manager(server, Path(tmp), datasets_dir, 'sync-bench', 8)
+        manager.create_vector_store()
+        files = sorted(datasets_dir.glob('*.txt'))
+        n = args.changed
+
+        results = [run_sync(server, manager, args.action, 'unchanged')]
+
+        for file_path in files[:n]:
+            file_path.write_text(file_path.read_text() + ' Updated.', encoding='utf-8')
+        if args.action == 'sync':
+            results.append(run_sync(server, manager, args.action, f'{n} edited (dry run)', dry_run=True))
+        results.append(run_sync(server, manager, args.action, f'{n} edited'))
+
+        for file_path in files[n:n * 2]:
+            file_path.rename(file_path.with_name(f"renamed-{file_path.name}"))
+        results.append(run_sync(server, manager, args.action, f'{n} renamed'))
+
+        for file_path in files[n * 2:n * 3]:
+            file_path.unlink()
+        results.append(run_sync(server, manager, args.action, f'{n} deleted'))
+        if args.action == 'sync':
+            results.append(run_sync(server, manager, args.action, 'unchanged (verify)', verify=True))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\n{args.action} on a {args.files}-file store")
+    print("-" * 82)
+    print(f"{'scenario':<22} {'seconds':>9} {'API calls':>10} {'uploads':>9} {'detached':>9} "
+          f"{'deleted':>8} {'attached':>9}")
+    for r in results:
+        print(f"{r['scenario']:<22} {r['seconds']:>9.2f} {r['api_calls']:>10} {r['uploads']:>9} "
+              f"{r['detached']:>9} {r['deleted']:>8} {r['attached_remotely']:>9}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
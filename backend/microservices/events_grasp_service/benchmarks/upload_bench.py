@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Vector Store Upload Benchmark
+
+Uploads N generated content files to a local fake OpenAI server (fixed
+latency per request, fixed processing time per attached file), first one
+file at a time - files.create then vector_stores.files.create_and_poll, as
+create_vector_store used to - and then with the parallel uploads and file
+batch attachment create_vector_store uses now, and reports files/sec.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/upload_bench.py --files 200 --latency 0.05
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+from backend.microservices.events_grasp_service.benchmarks.fake_openai import FakeOpenAI
+from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.vector_store_manager import (
+    DEFAULT_UPLOAD_CONCURRENCY, OpenAIVectorStoreManager
+)
+
+
+def write_files(directory: Path, count: int, size: int) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        body = f"Session {i}: " + ("re:Invent session abstract text. " * (size // 33 + 1))[:size]
+        (directory / f"session-{i:05d}.txt").write_text(body, encoding='utf-8')
+    return directory
+
+
+def make_manager(server: FakeOpenAI, config_dir: Path, datasets_dir: Path, store_name: str,
+                 upload_concurrency: int) -> OpenAIVectorStoreManager:
+    os.environ.setdefault('OPENAI_API_KEY', 'sk-benchmark')
+    manager = OpenAIVectorStoreManager(store_name=store_name, upload_concurrency=upload_concurrency,
+                                       poll_interval=server.poll_after_ms / 1000)
+    manager.client = manager.scheduler.client(api_key='sk-benchmark', base_url=server.base_url)
+    manager.checkpoint = False
+    manager.config_dir = config_dir
+    manager.config_file = config_dir / f"{store_name}.json"
+    manager.datasets_dir = datasets_dir
+    return manager
+
+
+def run_sequential(server: FakeOpenAI, tmp: Path, datasets_dir: Path) -> dict:
+    """One files.create + create_and_poll per file."""
+    manager = make_manager(server, tmp, datasets_dir, 'upload-bench-sequential', 1)
+    started = time.monotonic()
+    store = manager.client.vector_stores.create(name=manager.store_name)
+    manifest = manager.load_upload_manifest()
+    records = [manager.upload_and_attach(store.id, f, manifest) for f in manager.get_content_files()]
+    seconds = time.monotonic() - started
+    completed = sum(1 for r in records if r and r['status'] == 'completed')
+    return {'mode': 'sequential', 'files': completed, 'seconds': round(seconds, 3),
+            'files_per_sec': round(completed / seconds, 1)}
+
+
+def run_batched(server: FakeOpenAI, tmp: Path, datasets_dir: Path, upload_concurrency: int) -> dict:
+    """create_vector_store: parallel uploads, then file batches with one poller."""
+    manager = make_manager(server, tmp, datasets_dir, 'upload-bench-batched', upload_concurrency)
+    started = time.monotonic()
+    result = manager.create_vector_store()
+    seconds = time.monotonic() - started
+    completed = sum(1 for f in manager.load_config()['files'] if f['status'] == 'completed')
+    return {'mode': f'parallel x{upload_concurrency} + batches', 'files': completed,
+            'seconds': round(seconds, 3), 'files_per_sec': round(completed / seconds, 1),
+            'success': result['success']}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vector store upload benchmark')
+    parser.add_argument('--files', type=int, default=200, help='Content files to upload')
+    parser.add_argument('--size', type=int, default=4000, help='Bytes per file')
+    parser.add_argument('--latency', type=float, default=0.05, help='Fake API latency per request in seconds')
+    parser.add_argument('--processing', type=float, default=0.2, help='Seconds an attached file stays in_progress')
+    parser.add_argument('--poll-ms', type=int, default=100, help='openai-poll-after-ms sent by the fake API')
+    parser.add_argument('--upload-concurrency', type=int, default=DEFAULT_UPLOAD_CONCURRENCY,
+                        help='Parallel uploads')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    server_args = dict(latency=args.latency, processing_seconds=args.processing, poll_after_ms=args.poll_ms)
+    with tempfile.TemporaryDirectory() as tmp:
+        datasets_dir = write_files(Path(tmp) / 'content', args.files, args.size)
+        # A fresh server per run so the second run cannot reuse the first run's uploads
+        with FakeOpenAI(**server_args) as server:
+            sequential = run_sequential(server, Path(tmp), datasets_dir)
+        with FakeOpenAI(**server_args) as server:
+            batched = run_batched(server, Path(tmp), datasets_dir, args.upload_concurrency)
+            batched['requests'] = dict(sorted(server.requests.items()))
+    results = [sequential, batched]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\n{args.files} files of {args.size} bytes, {args.latency}s per request, "
+          f"{args.processing}s processing per file")
+    print("-" * 64)
+    print(f"{'mode':<28} {'files':>7} {'seconds':>9} {'files/sec':>10}")
+    for r in results:
+        print(f"{r['mode']:<28} {r['files']:>7} {r['seconds']:>9.2f} {r['files_per_sec']:>10.1f}")
+    if batched['seconds']:
+        print(f"\nSpeedup: {sequential['seconds'] / batched['seconds']:.1f}x")
+    print("\nAPI calls (batched run):")
+    for route, count in batched['requests'].items():
+        print(f"  {count:>6}  {route}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Visited-Set Memory Benchmark
+
+Fills a Python set of URL strings and a CompactUrlSet with the same synthetic
+URLs and reports heap bytes per URL (tracemalloc) and add/lookup throughput.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/benchmarks/visited_set_bench.py --urls 1000000
+"""
+
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+from typing import Dict, List
+
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.url_set import CompactUrlSet
+
+
+def make_urls(count: int) -> List[str]:
+    """Build blog-like URLs of realistic length."""
+    return [
+        f"https://aws.amazon.com/blogs/machine-learning/category-{i % 97}/post-{i}-building-generative-ai-apps/"
+        for i in range(count)
+    ]
+
+
+def measure(kind: str, urls: List[str]) -> Dict:
+    """Measure memory and speed of one visited-set implementation."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    if kind == 'set':
+        # The set owns its own copies, as URLs parsed out of pages would be
+        visited = set()
+        for url in urls:
+            visited.add(''.join(url))
+    else:
+        visited = CompactUrlSet()
+        for url in urls:
+            visited.add(url)
+    add_elapsed = time.perf_counter() - started
+    heap, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    hits = sum(1 for url in urls if url in visited)
+    lookup_elapsed = time.perf_counter() - started
+
+    return {
+        'kind': kind,
+        'urls': len(urls),
+        'hits': hits,
+        'heap_mb': round(heap / 1024 / 1024, 2),
+        'bytes_per_url': round(heap / len(urls), 1) if urls else 0.0,
+        'adds_per_second': round(len(urls) / add_elapsed) if add_elapsed else 0,
+        'lookups_per_second': round(len(urls) / lookup_elapsed) if lookup_elapsed else 0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Visited-set memory benchmark')
+    parser.add_argument('--urls', type=int, default=200000, help='Number of distinct URLs')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    args = parser.parse_args()
+
+    urls = make_urls(args.urls)
+    results = [measure('set', urls), measure('compact', urls)]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\n{args.urls} URLs, avg {sum(map(len, urls)) // max(1, len(urls))} chars")
+    print("-" * 72)
+    for r in results:
+        print(f"{r['kind']:<8} {r['heap_mb']:>9.2f} MB  {r['bytes_per_url']:>7.1f} B/URL  "
+              f"{r['adds_per_second']:>10} adds/s  {r['lookups_per_second']:>10} lookups/s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
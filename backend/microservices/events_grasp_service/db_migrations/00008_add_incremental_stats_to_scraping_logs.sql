@@ -0,0 +1,6 @@
+-- 00008_add_incremental_stats_to_scraping_logs.sql
+-- Track per-run page change statistics for incremental (conditional-GET) scrapes
+
+ALTER TABLE event_scraping_logs ADD COLUMN pages_new INTEGER DEFAULT 0;
+ALTER TABLE event_scraping_logs ADD COLUMN pages_changed INTEGER DEFAULT 0;
+ALTER TABLE event_scraping_logs ADD COLUMN pages_unchanged INTEGER DEFAULT 0;
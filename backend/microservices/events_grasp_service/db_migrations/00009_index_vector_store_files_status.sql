@@ -0,0 +1,4 @@
+-- 00009_index_vector_store_files_status.sql
+-- Vector store builds checkpoint every file in vector_store_files; progress is counted per status
+
+CREATE INDEX IF NOT EXISTS idx_vector_files_store_status ON vector_store_files(vector_store_id, status);
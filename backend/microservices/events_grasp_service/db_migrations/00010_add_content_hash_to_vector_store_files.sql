@@ -0,0 +1,10 @@
+-- 00010_add_content_hash_to_vector_store_files.sql
+-- Vector store file rows are written in bulk and upserted by (store, content hash)
+
+ALTER TABLE vector_store_files ADD COLUMN content_hash VARCHAR(64);
+
+UPDATE vector_store_files
+SET content_hash = json_extract(file_metadata_json, '$.content_hash')
+WHERE file_metadata_json LIKE '%content_hash%';
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_vector_files_store_hash ON vector_store_files(vector_store_id, content_hash);
@@ -91,6 +91,30 @@ def get_vector_store(vector_store_id: int):
     return ctx.resp
 
 
+@router.get('/{vector_store_id}/progress', response_model=VectorStoresResp)
+def get_vector_store_build_progress(vector_store_id: int):
+    """
+    Get the per-file progress of a vector store build.
+
+    Builds checkpoint every file in vector_store_files, so this can be
+    polled while a build is running.
+
+    Args:
+        vector_store_id: The vector store ID
+
+    Returns:
+        File counts by status and percent complete
+    """
+    req = VectorStoresReq()
+    ctx = VectorStoresCtx(req=req)
+    ctx = vector_stores_service.get_build_progress(ctx, vector_store_id)
+
+    if not ctx.resp.success:
+        raise HTTPException(status_code=404, detail=ctx.resp.message)
+
+    return ctx.resp
+
+
 @router.post('/', response_model=VectorStoresResp, status_code=201)
 def create_vector_store(payload: VectorStoreCreateReq):
     """
@@ -0,0 +1,79 @@
+"""DAO for recording scraper runs in event_scraping_logs."""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import text
+
+
+class ScrapingLogDAO:
+    """Creates and updates event_scraping_logs rows for a scrape run."""
+
+    def __init__(self, db_manager):
+        self.db = db_manager
+
+    def start_log(self, event_id: int, source_location: str, source_location_type: str,
+                  output_location: Optional[str] = None,
+                  output_location_type: Optional[str] = 'local_directory') -> int:
+        """Insert an in_progress log row and return its id."""
+        with self.db.session_scope() as session:
+            result = session.execute(text("""
+                INSERT INTO event_scraping_logs
+                (event_id, source_location, source_location_type, start_time, status,
+                 output_location, output_location_type, files_scraped)
+                VALUES (:event_id, :source_location, :source_location_type, :start_time, 'in_progress',
+                        :output_location, :output_location_type, 0)
+            """), {
+                "event_id": event_id,
+                "source_location": source_location,
+                "source_location_type": source_location_type,
+                "start_time": datetime.now(),
+                "output_location": output_location,
+                "output_location_type": output_location_type
+            })
+            return result.lastrowid
+
+    def update_progress(self, scraping_log_id: int, files_scraped: int):
+        """Update the running file count of an in-progress log row."""
+        with self.db.session_scope() as session:
+            session.execute(text("""
+                UPDATE event_scraping_logs
+                SET files_scraped = :files_scraped
+                WHERE scraping_log_id = :scraping_log_id
+            """), {"scraping_log_id": scraping_log_id, "files_scraped": files_scraped})
+
+    def finish_log(self, scraping_log_id: int, status: str, files_scraped: int,
+                   pages_new: int = 0, pages_changed: int = 0, pages_unchanged: int = 0,
+                   error_message: Optional[str] = None):
+        """Mark a log row as finished with its final counters."""
+        with self.db.session_scope() as session:
+            session.execute(text("""
+                UPDATE event_scraping_logs
+                SET status = :status,
+                    end_time = :end_time,
+                    files_scraped = :files_scraped,
+                    pages_new = :pages_new,
+                    pages_changed = :pages_changed,
+                    pages_unchanged = :pages_unchanged,
+                    error_message = :error_message
+                WHERE scraping_log_id = :scraping_log_id
+            """), {
+                "scraping_log_id": scraping_log_id,
+                "status": status,
+                "end_time": datetime.now(),
+                "files_scraped": files_scraped,
+                "pages_new": pages_new,
+                "pages_changed": pages_changed,
+                "pages_unchanged": pages_unchanged,
+                "error_message": error_message
+            })
+
+    def last_completed_start(self, event_id: int) -> Optional[datetime]:
+        """Return the start_time of the event's most recent completed run, or None."""
+        with self.db.session_scope() as session:
+            value = session.execute(text("""
+                SELECT MAX(start_time)
+                FROM event_scraping_logs
+                WHERE event_id = :event_id AND status = 'completed'
+            """), {"event_id": event_id}).scalar()
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        return value
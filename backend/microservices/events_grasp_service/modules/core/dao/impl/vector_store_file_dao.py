@@ -0,0 +1,179 @@
+"""DAO for the per-file state of vector stores in vector_store_files."""
+import json
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import text
+
+
+class VectorStoreFileDAO:
+    """Registers stores in event_vector_stores and records their files in vector_store_files."""
+
+    def __init__(self, db_manager):
+        self.db = db_manager
+
+    def find_store(self, provider: str, db_name: str) -> Optional[Dict]:
+        """Return the most recent active event_vector_stores row with this provider and name."""
+        with self.db.session_scope() as session:
+            row = session.execute(text("""
+                SELECT vector_store_id, vector_store_db_link, status, vector_config_json, event_id
+                FROM event_vector_stores
+                WHERE vector_store_provider = :provider AND vector_store_db_name = :db_name AND is_active = 1
+                ORDER BY vector_store_id DESC
+                LIMIT 1
+            """), {"provider": provider, "db_name": db_name}).fetchone()
+        if not row:
+            return None
+        return {"vector_store_id": row[0], "vector_store_db_link": row[1], "status": row[2],
+                "vector_config_json": row[3], "event_id": row[4]}
+
+    def get_store(self, vector_store_id: int) -> Optional[Dict]:
+        """Return an event_vector_stores row by id."""
+        with self.db.session_scope() as session:
+            row = session.execute(text("""
+                SELECT vector_store_id, vector_store_db_link, status, vector_config_json, event_id
+                FROM event_vector_stores
+                WHERE vector_store_id = :vector_store_id
+            """), {"vector_store_id": vector_store_id}).fetchone()
+        if not row:
+            return None
+        return {"vector_store_id": row[0], "vector_store_db_link": row[1], "status": row[2],
+                "vector_config_json": row[3], "event_id": row[4]}
+
+    def create_store(self, provider: str, db_name: str, db_link: str, config_json: Optional[str] = None,
+                     status: str = 'building', event_id: Optional[int] = None) -> int:
+        """Insert an event_vector_stores row (a build, by default; no event unless given) and return its id."""
+        with self.db.session_scope() as session:
+            result = session.execute(text("""
+                INSERT INTO event_vector_stores
+                (event_id, vector_store_provider, vector_store_db_name, vector_store_db_link, vector_config_json, status)
+                VALUES (:event_id, :provider, :db_name, :db_link, :config, :status)
+            """), {"event_id": event_id, "provider": provider, "db_name": db_name, "db_link": db_link,
+                  "config": config_json, "status": status})
+            return result.lastrowid
+
+    def update_store(self, vector_store_id: int, status: str, db_link: Optional[str] = None,
+                     config_json: Optional[str] = None, event_id: Optional[int] = None):
+        """Set a store row's status (and remote id / config / event when given)."""
+        with self.db.session_scope() as session:
+            session.execute(text("""
+                UPDATE event_vector_stores
+                SET status = :status,
+                    vector_store_db_link = COALESCE(:db_link, vector_store_db_link),
+                    vector_config_json = COALESCE(:config, vector_config_json),
+                    event_id = COALESCE(:event_id, event_id),
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE vector_store_id = :vector_store_id
+            """), {"vector_store_id": vector_store_id, "status": status, "db_link": db_link, "config": config_json,
+                  "event_id": event_id})
+
+    def list_files(self, vector_store_id: int) -> List[Dict]:
+        """Return a store's file rows with their metadata JSON decoded."""
+        with self.db.session_scope() as session:
+            rows = session.execute(text("""
+                SELECT file_id, file_name, status, uploaded_flag, uploaded_to_datetime,
+                       source_file_location, file_size_bytes, file_metadata_json, content_hash
+                FROM vector_store_files
+                WHERE vector_store_id = :vector_store_id
+            """), {"vector_store_id": vector_store_id}).fetchall()
+        return [{
+            "file_id": row[0],
+            "file_name": row[1],
+            "status": row[2],
+            "uploaded_flag": bool(row[3]),
+            "uploaded_to_datetime": row[4],
+            "source_file_location": row[5],
+            "file_size_bytes": row[6],
+            "metadata": json.loads(row[7]) if row[7] else {},
+            "content_hash": row[8]
+        } for row in rows]
+
+    def list_live_references(self, provider: str, exclude_status: str = 'deleted') -> Tuple[List[str], List[Dict]]:
+        """
+        Return what the provider's stores that are not in exclude_status still reference.
+
+        Returns:
+            Tuple of (remote vector store ids, file metadata of their file rows)
+        """
+        with self.db.session_scope() as session:
+            stores = session.execute(text("""
+                SELECT vector_store_db_link
+                FROM event_vector_stores
+                WHERE vector_store_provider = :provider AND COALESCE(status, '') != :exclude_status
+                  AND vector_store_db_link IS NOT NULL
+            """), {"provider": provider, "exclude_status": exclude_status}).fetchall()
+            files = session.execute(text("""
+                SELECT f.file_metadata_json
+                FROM vector_store_files f
+                JOIN event_vector_stores s ON s.vector_store_id = f.vector_store_id
+                WHERE s.vector_store_provider = :provider AND COALESCE(s.status, '') != :exclude_status
+            """), {"provider": provider, "exclude_status": exclude_status}).fetchall()
+        return [row[0] for row in stores], [json.loads(row[0]) if row[0] else {} for row in files]
+
+    def delete_files(self, vector_store_id: int) -> int:
+        """Delete a store's file rows (a new build replaces them); returns the number deleted."""
+        with self.db.session_scope() as session:
+            result = session.execute(text("DELETE FROM vector_store_files WHERE vector_store_id = :vector_store_id"),
+                                     {"vector_store_id": vector_store_id})
+            return result.rowcount
+
+    def upsert_files(self, vector_store_id: int, files: List[Dict]) -> int:
+        """
+        Insert or update file rows by content hash, all in one transaction (executemany).
+
+        Args:
+            vector_store_id: event_vector_stores row the files belong to
+            files: Dicts with content_hash, file_name, status, source_file_location,
+                source_location_type, and optionally file_size_bytes and metadata.
+                A 'completed' file is flagged as uploaded and stamped with the time.
+
+        Returns:
+            Number of rows written
+        """
+        if not files:
+            return 0
+        now = datetime.now()
+        params = [{
+            "vector_store_id": vector_store_id,
+            "content_hash": f["content_hash"],
+            "file_name": f["file_name"],
+            "status": f["status"],
+            "uploaded_flag": 1 if f["status"] == "completed" else 0,
+            "uploaded_to_datetime": now if f["status"] == "completed" else None,
+            "source_file_location": f["source_file_location"],
+            "source_location_type": f["source_location_type"],
+            "file_size_bytes": f.get("file_size_bytes"),
+            "metadata": json.dumps(f.get("metadata") or {})
+        } for f in files]
+        with self.db.session_scope() as session:
+            session.execute(text("""
+                INSERT INTO vector_store_files
+                (vector_store_id, content_hash, file_name, file_display_name, status, uploaded_flag,
+                 uploaded_to_datetime, source_file_location, source_location_type, file_size_bytes,
+                 file_metadata_json)
+                VALUES (:vector_store_id, :content_hash, :file_name, :file_name, :status, :uploaded_flag,
+                        :uploaded_to_datetime, :source_file_location, :source_location_type, :file_size_bytes,
+                        :metadata)
+                ON CONFLICT (vector_store_id, content_hash) DO UPDATE SET
+                    file_name = excluded.file_name,
+                    file_display_name = excluded.file_display_name,
+                    status = excluded.status,
+                    uploaded_flag = excluded.uploaded_flag,
+                    uploaded_to_datetime = COALESCE(vector_store_files.uploaded_to_datetime,
+                                                    excluded.uploaded_to_datetime),
+                    source_file_location = excluded.source_file_location,
+                    source_location_type = excluded.source_location_type,
+                    file_size_bytes = COALESCE(excluded.file_size_bytes, vector_store_files.file_size_bytes),
+                    file_metadata_json = excluded.file_metadata_json
+            """), params)
+        return len(params)
+
+    def delete_files_by_hash(self, vector_store_id: int, content_hashes: List[str]) -> int:
+        """Delete a store's file rows with the given content hashes in one transaction; returns the number deleted."""
+        if not content_hashes:
+            return 0
+        with self.db.session_scope() as session:
+            result = session.execute(text("""
+                DELETE FROM vector_store_files
+                WHERE vector_store_id = :vector_store_id AND content_hash = :content_hash
+            """), [{"vector_store_id": vector_store_id, "content_hash": digest} for digest in content_hashes])
+            return result.rowcount
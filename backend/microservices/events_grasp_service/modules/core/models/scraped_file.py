@@ -37,5 +37,6 @@ def create_scraped_file_model(Base):
         source_location_type = Column(String(50), nullable=False)
         file_size_bytes = Column(BigInteger)
         file_metadata_json = Column(Text)
+        content_hash = Column(String(64))
 
     return ScrapedFile
@@ -35,6 +35,9 @@ def create_scraping_log_model(Base):
         output_location = Column(Text)
         output_location_type = Column(String(50))
         files_scraped = Column(Integer, default=0)
+        pages_new = Column(Integer, default=0)
+        pages_changed = Column(Integer, default=0)
+        pages_unchanged = Column(Integer, default=0)
         error_message = Column(Text)
         created_at = Column(DateTime, server_default=func.now())
 
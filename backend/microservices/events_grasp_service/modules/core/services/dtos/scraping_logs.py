@@ -17,6 +17,9 @@ class ScrapingLogModel(BaseModel):
     output_location: Optional[str] = None
     output_location_type: Optional[str] = None
     files_scraped: int = 0
+    pages_new: int = 0
+    pages_changed: int = 0
+    pages_unchanged: int = 0
     error_message: Optional[str] = None
     created_at: Optional[str] = None
     duration: Optional[str] = None  # Human-readable duration
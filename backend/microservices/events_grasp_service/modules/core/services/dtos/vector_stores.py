@@ -7,7 +7,7 @@ from dataclasses import dataclass
 class VectorStoreModel(BaseModel):
     """Vector store item model."""
     vector_store_id: int
-    event_id: int
+    event_id: Optional[int] = None
     event_name: Optional[str] = None
     vector_store_provider: str
     vector_store_db_name: str
@@ -45,12 +45,26 @@ class VectorStoresReq(BaseModel):
     limit: Optional[int] = 100
 
 
+class VectorStoreBuildProgressModel(BaseModel):
+    """Per-file progress of a vector store build (counted from vector_store_files)."""
+    vector_store_id: int
+    status: str = 'pending'
+    total_files: int = 0
+    uploaded_files: int = 0
+    completed_files: int = 0
+    failed_files: int = 0
+    pending_files: int = 0
+    percent_complete: float = 0.0
+    last_uploaded_at: Optional[str] = None
+
+
 class VectorStoresResp(BaseModel):
     """Response model for vector stores operations."""
     success: bool = True
     message: Optional[str] = None
     vector_stores: Optional[List[VectorStoreModel]] = None
     vector_store: Optional[VectorStoreModel] = None
+    progress: Optional[VectorStoreBuildProgressModel] = None
     total_count: int = 0
 
 
@@ -94,7 +94,10 @@ class ScrapingLogsService(IScrapingLogsService):
                         output_location_type,
                         files_scraped,
                         error_message,
-                        created_at
+                        created_at,
+                        pages_new,
+                        pages_changed,
+                        pages_unchanged
                     FROM event_scraping_logs
                     WHERE event_id = :event_id
                     ORDER BY start_time DESC
@@ -124,6 +127,9 @@ class ScrapingLogsService(IScrapingLogsService):
                         output_location=row[7],
                         output_location_type=row[8],
                         files_scraped=row[9] or 0,
+                        pages_new=row[12] or 0,
+                        pages_changed=row[13] or 0,
+                        pages_unchanged=row[14] or 0,
                         error_message=row[10],
                         created_at=self._format_datetime(row[11]),
                         duration=duration
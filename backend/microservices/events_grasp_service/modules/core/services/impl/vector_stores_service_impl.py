@@ -4,7 +4,7 @@ from typing import Optional
 from sqlalchemy import text
 from ..interfaces.vector_stores_service_interface import IVectorStoresService
 from ..dtos.vector_stores import (
-    VectorStoresCtx, VectorStoresResp, VectorStoreModel
+    VectorStoresCtx, VectorStoresResp, VectorStoreModel, VectorStoreBuildProgressModel
 )
 
 # Set up logging
@@ -323,6 +323,60 @@ class VectorStoresService(IVectorStoresService):
 
         return ctx
 
+    def get_build_progress(self, ctx: VectorStoresCtx, vector_store_id: int) -> VectorStoresCtx:
+        """Count a vector store's checkpointed files by status (readable while a build runs)."""
+        try:
+            with self.db.session_scope() as session:
+                store = session.execute(text("""
+                    SELECT status FROM event_vector_stores WHERE vector_store_id = :vector_store_id
+                """), {"vector_store_id": vector_store_id}).fetchone()
+
+                if not store:
+                    ctx.set_resp(VectorStoresResp(
+                        success=False,
+                        message="Vector store not found"
+                    ))
+                    return ctx
+
+                rows = session.execute(text("""
+                    SELECT
+                        status,
+                        COUNT(*) as files,
+                        SUM(CASE WHEN uploaded_flag = 1 THEN 1 ELSE 0 END) as uploaded,
+                        MAX(uploaded_to_datetime) as last_uploaded_at
+                    FROM vector_store_files
+                    WHERE vector_store_id = :vector_store_id
+                    GROUP BY status
+                """), {"vector_store_id": vector_store_id}).fetchall()
+
+                counts = {row[0]: row[1] for row in rows}
+                total = sum(counts.values())
+                completed = sum(row[2] or 0 for row in rows)
+                last_uploaded = max((row[3] for row in rows if row[3]), default=None)
+
+                ctx.set_resp(VectorStoresResp(
+                    success=True,
+                    progress=VectorStoreBuildProgressModel(
+                        vector_store_id=vector_store_id,
+                        status=store[0] or 'pending',
+                        total_files=total,
+                        uploaded_files=counts.get('uploaded', 0),
+                        completed_files=completed,
+                        failed_files=counts.get('failed', 0) + counts.get('cancelled', 0),
+                        pending_files=counts.get('pending', 0),
+                        percent_complete=round(100.0 * completed / total, 1) if total else 0.0,
+                        last_uploaded_at=self._format_datetime(last_uploaded)
+                    )
+                ))
+
+        except Exception as e:
+            ctx.set_resp(VectorStoresResp(
+                success=False,
+                message=f"Failed to fetch build progress: {str(e)}"
+            ))
+
+        return ctx
+
     def _format_datetime(self, dt) -> Optional[str]:
         """Format datetime to string."""
         if not dt:
@@ -75,3 +75,17 @@ class IVectorStoresService(ABC):
             VectorStoresCtx with response indicating success/failure
         """
         pass
+
+    @abstractmethod
+    def get_build_progress(self, ctx: VectorStoresCtx, vector_store_id: int) -> VectorStoresCtx:
+        """
+        Get the per-file progress of a vector store build.
+
+        Args:
+            ctx: Context with request data
+            vector_store_id: The vector store ID
+
+        Returns:
+            VectorStoresCtx with response containing the build progress
+        """
+        pass
@@ -0,0 +1,408 @@
+"""
+Per-file record of a vector store in the application database.
+
+Every file the manager puts in a vector store gets a vector_store_files row,
+keyed by (store row, content hash): status 'uploaded' once the file object
+exists in OpenAI storage, then 'completed' (uploaded_flag set,
+uploaded_to_datetime stamped) or 'failed' once its file batch finishes.
+update, sync and the ingest pipeline upsert the files they attach and
+delete the rows of files they detach, so the API's listings and file counts
+read the same state as the local config.
+
+Rows are written in bulk: changes are buffered and upserted with one
+executemany per flush (every FLUSH_ROWS files or FLUSH_INTERVAL seconds,
+and when a run ends), so upload threads never wait on a commit per file.
+
+create_vector_store keeps the store's event_vector_stores row 'building'
+until it returns. A build that dies part way is resumed from the rows:
+completed files are skipped, uploaded-but-unattached files are attached by
+their existing file id, and only files with no row are uploaded (including
+those whose row was still buffered when the process was killed).
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from .upload_manifest import UploadManifest
+    from ....dao.impl.vector_store_file_dao import VectorStoreFileDAO
+    from ....integrations.db import get_db_manager
+    from ....integrations.migrator import apply_migrations
+except ImportError:
+    # Running as a script: resolve through the repository root on PYTHONPATH
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.upload_manifest import (
+        UploadManifest
+    )
+    from backend.microservices.events_grasp_service.modules.core.dao.impl.vector_store_file_dao import (
+        VectorStoreFileDAO
+    )
+    from backend.microservices.events_grasp_service.modules.core.integrations.db import get_db_manager
+    from backend.microservices.events_grasp_service.modules.core.integrations.migrator import apply_migrations
+
+logger = logging.getLogger(__name__)
+
+PROVIDER = 'openai'
+
+# event_vector_stores.status
+BUILDING = 'building'
+ACTIVE = 'active'
+DELETED = 'deleted'
+
+# vector_store_files.status
+UPLOADED = 'uploaded'
+COMPLETED = 'completed'
+
+# Buffered file rows are flushed when this many are pending, or this many seconds after the last flush
+FLUSH_ROWS = 200
+FLUSH_INTERVAL = 2.0
+
+
+def _open_dao() -> VectorStoreFileDAO:
+    apply_migrations()
+    return VectorStoreFileDAO(get_db_manager())
+
+
+def _source_type(source_file_location: str) -> str:
+    if source_file_location.startswith('content-store:'):
+        return 'content_store'
+    if source_file_location.startswith('bundle:'):
+        return 'page_bundle'
+    return 'local_file'
+
+
+class BuildCheckpoint:
+    """Per-file state of one vector store, keyed by content hash, written in bulk. Thread-safe."""
+
+    def __init__(self, dao: VectorStoreFileDAO, db_vector_store_id: int, vector_store_id: str,
+                 flush_rows: int = FLUSH_ROWS, flush_interval: float = FLUSH_INTERVAL):
+        """
+        Args:
+            dao: VectorStoreFileDAO
+            db_vector_store_id: event_vector_stores row of the store
+            vector_store_id: OpenAI vector store
+            flush_rows: Pending rows that trigger a flush
+            flush_interval: Seconds after which pending rows are flushed
+        """
+        self.dao = dao
+        self.db_vector_store_id = db_vector_store_id
+        self.vector_store_id = vector_store_id
+        self.flush_rows = max(1, flush_rows)
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        # Flushes are serialized so rows reach the database in the order they were recorded
+        self._flush_lock = threading.Lock()
+        # content hash -> file row as last recorded
+        self.rows: Dict[str, Dict] = {}
+        # content hash -> row to upsert / content hashes whose rows are deleted, at the next flush
+        self._pending: Dict[str, Dict] = {}
+        self._removed: Set[str] = set()
+        self._last_flush = time.monotonic()
+        # The last flush could not be written (its rows are pending again)
+        self.flush_failed = False
+        self.flushes = 0
+        for row in dao.list_files(db_vector_store_id):
+            digest = row['content_hash'] or row['metadata'].get('content_hash')
+            if digest:
+                self.rows[digest] = row
+
+    @classmethod
+    def start(cls, store_name: str, vector_store_id: str, db_vector_store_id: Optional[int] = None,
+              event_id: Optional[int] = None) -> Optional['BuildCheckpoint']:
+        """
+        Begin recording a new build.
+
+        Uses the given event_vector_stores row, or the store's row by name
+        (created if missing), and clears its file rows from earlier builds.
+        With event_id the row is linked to that event.
+
+        Returns:
+            BuildCheckpoint, or None if the database is unavailable
+        """
+        try:
+            dao = _open_dao()
+            row = dao.get_store(db_vector_store_id) if db_vector_store_id else dao.find_store(PROVIDER, store_name)
+            if row is None and db_vector_store_id:
+                logger.warning(f"event_vector_stores row {db_vector_store_id} not found; build is not checkpointed")
+                return None
+            if row is None:
+                db_vector_store_id = dao.create_store(PROVIDER, store_name, vector_store_id, event_id=event_id)
+            else:
+                db_vector_store_id = row['vector_store_id']
+                cleared = dao.delete_files(db_vector_store_id)
+                if cleared:
+                    logger.info(f"Cleared {cleared} file rows of the previous build")
+                dao.update_store(db_vector_store_id, BUILDING, db_link=vector_store_id, event_id=event_id)
+            logger.info(f"Checkpointing build progress in vector_store_files (store row {db_vector_store_id})")
+            return cls(dao, db_vector_store_id, vector_store_id)
+        except Exception as e:
+            logger.warning(f"Build progress is not checkpointed (database unavailable: {e})")
+            return None
+
+    @classmethod
+    def open(cls, store_name: str, vector_store_id: str, db_vector_store_id: Optional[int] = None,
+             event_id: Optional[int] = None) -> Optional['BuildCheckpoint']:
+        """
+        Record changes to an existing store (update, sync, ingest).
+
+        Uses the given event_vector_stores row, or the store's row by name
+        (created 'active' if missing). A row linked to a different OpenAI
+        vector store is relinked and its file rows cleared; a deleted one is
+        made active again. With event_id the row is linked to that event.
+
+        Returns:
+            BuildCheckpoint, or None if the database is unavailable
+        """
+        try:
+            dao = _open_dao()
+            row = dao.get_store(db_vector_store_id) if db_vector_store_id else dao.find_store(PROVIDER, store_name)
+            if row is None and db_vector_store_id:
+                logger.warning(f"event_vector_stores row {db_vector_store_id} not found; files are not recorded")
+                return None
+            if row is None:
+                db_vector_store_id = dao.create_store(PROVIDER, store_name, vector_store_id, status=ACTIVE,
+                                                      event_id=event_id)
+            else:
+                db_vector_store_id = row['vector_store_id']
+                if row['vector_store_db_link'] != vector_store_id:
+                    dao.delete_files(db_vector_store_id)
+                if row['vector_store_db_link'] != vector_store_id or row['status'] == DELETED:
+                    dao.update_store(db_vector_store_id, ACTIVE, db_link=vector_store_id, event_id=event_id)
+                elif event_id is not None and row['event_id'] != event_id:
+                    dao.update_store(db_vector_store_id, row['status'], event_id=event_id)
+            return cls(dao, db_vector_store_id, vector_store_id)
+        except Exception as e:
+            logger.warning(f"Files are not recorded in vector_store_files (database unavailable: {e})")
+            return None
+
+    @classmethod
+    def interrupted(cls, store_name: str, db_vector_store_id: Optional[int] = None) -> Optional['BuildCheckpoint']:
+        """
+        Find an unfinished build of the store (its row is still 'building').
+
+        Returns:
+            BuildCheckpoint with the build's file rows and OpenAI vector store id,
+            or None if there is no interrupted build (or no database)
+        """
+        try:
+            dao = _open_dao()
+            row = dao.get_store(db_vector_store_id) if db_vector_store_id else dao.find_store(PROVIDER, store_name)
+        except Exception as e:
+            logger.warning(f"Could not look for an interrupted build (database unavailable: {e})")
+            return None
+        if row is None or row['status'] != BUILDING or not row['vector_store_db_link']:
+            return None
+        return cls(dao, row['vector_store_id'], row['vector_store_db_link'])
+
+    @staticmethod
+    def discard(store_name: str, db_vector_store_id: Optional[int] = None):
+        """Delete the file rows of a deleted store and mark its row 'deleted'."""
+        try:
+            dao = _open_dao()
+            row = dao.get_store(db_vector_store_id) if db_vector_store_id else dao.find_store(PROVIDER, store_name)
+            if row is None:
+                return
+            cleared = dao.delete_files(row['vector_store_id'])
+            dao.update_store(row['vector_store_id'], DELETED)
+            logger.info(f"Removed {cleared} file rows of store row {row['vector_store_id']}")
+        except Exception as e:
+            logger.warning(f"Could not remove the store's file rows: {e}")
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def count(self, status: str) -> int:
+        with self._lock:
+            return sum(1 for row in self.rows.values() if row['status'] == status)
+
+    def seed(self, manifest: UploadManifest) -> Tuple[int, int]:
+        """
+        Load the checkpointed files into an upload manifest bound to the store.
+
+        Completed files become attached entries (skipped by upload_files);
+        uploaded and failed ones reusable uploads (attached again without
+        re-uploading).
+
+        Returns:
+            (completed, to re-attach) file counts
+        """
+        completed = uploaded = 0
+        with self._lock:
+            for digest, row in self.rows.items():
+                file_id = row['metadata'].get('openai_file_id')
+                if not file_id:
+                    continue
+                file_info = {'file_id': file_id, 'filename': row['file_name'],
+                             'uploaded_at': row['metadata'].get('uploaded_at')}
+                if row['status'] == COMPLETED:
+                    manifest.record(digest, file_info)
+                    completed += 1
+                else:
+                    manifest.offer(digest, file_info)
+                    uploaded += 1
+        return completed, uploaded
+
+    def completed_records(self) -> List[Dict]:
+        """Config file records of the files a previous run attached."""
+        with self._lock:
+            return [{
+                'file_id': row['metadata']['openai_file_id'],
+                'vs_file_id': row['metadata']['openai_file_id'],
+                'filename': row['file_name'],
+                'filepath': row['source_file_location'],
+                'status': COMPLETED,
+                'reused': row['metadata'].get('reused', False),
+                'content_hash': digest,
+                'batch_id': row['metadata'].get('batch_id'),
+                'uploaded_at': row['metadata'].get('uploaded_at')
+            } for digest, row in self.rows.items() if row['status'] == COMPLETED]
+
+    def backfill(self, records: List[Dict]) -> int:
+        """
+        Record completed config file records that have no row yet
+        (stores built before their files were recorded in the database).
+
+        Returns:
+            Number of rows added
+        """
+        with self._lock:
+            missing = [r for r in records if r.get('status') == COMPLETED and r.get('content_hash')
+                       and r['content_hash'] not in self.rows]
+        if missing:
+            self.files_attached(missing)
+            logger.info(f"Recorded {len(missing)} previously attached files in vector_store_files")
+        return len(missing)
+
+    def rekey(self, mapping: Dict[str, str]) -> int:
+        """
+        Move rows to new content hashes (a manifest re-keyed to a new hash).
+
+        Args:
+            mapping: Old content hash -> new content hash
+
+        Returns:
+            Number of rows moved
+        """
+        with self._lock:
+            moved = [(old, new, self.rows[old]) for old, new in mapping.items()
+                     if old in self.rows and new not in self.rows]
+        for old, new, row in moved:
+            metadata = {key: value for key, value in row['metadata'].items() if key != 'content_hash'}
+            self._write(row['source_file_location'], row['file_name'], new, row['status'], metadata,
+                        size=row['file_size_bytes'])
+        if moved:
+            self.files_removed([old for old, _, _ in moved])
+            logger.info(f"Moved {len(moved)} file rows to their new content hashes")
+        return len(moved)
+
+    def file_uploaded(self, file_path, digest: str, file_id: str, size: int):
+        """Record a file object created in OpenAI storage (called from upload threads)."""
+        self._write(str(file_path), file_path.name, digest, UPLOADED, {'openai_file_id': file_id}, size=size)
+
+    def files_attached(self, records: List[Dict]):
+        """Record the outcome of attaching files (file records from attach_files or upload_and_attach)."""
+        for record in records:
+            metadata = {
+                'openai_file_id': record['file_id'],
+                'batch_id': record.get('batch_id'),
+                'reused': record.get('reused', False),
+                'uploaded_at': record.get('uploaded_at')
+            }
+            self._write(record['filepath'], record['filename'], record['content_hash'], record['status'], metadata)
+
+    def file_renamed(self, digest: str, filename: str):
+        """Record a file whose content is now saved under another name."""
+        with self._lock:
+            row = self.rows.get(digest)
+        if row is not None:
+            self._write(row['source_file_location'], filename, digest, row['status'], {})
+
+    def files_removed(self, digests: Iterable[str]):
+        """Delete the rows of files detached from the store."""
+        with self._lock:
+            for digest in digests:
+                self.rows.pop(digest, None)
+                self._pending.pop(digest, None)
+                self._removed.add(digest)
+            due = self._flush_due()
+        if due:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the buffered rows: one bulk upsert and one bulk delete, each in a single transaction.
+
+        Rows that could not be written are buffered again (unless recorded
+        anew meanwhile) and retried by the next flush.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = list(self._pending.values()), {}
+                removed, self._removed = sorted(self._removed), set()
+                self._last_flush = time.monotonic()
+            if not pending and not removed:
+                return
+            try:
+                self.dao.delete_files_by_hash(self.db_vector_store_id, removed)
+                self.dao.upsert_files(self.db_vector_store_id, pending)
+                self.flushes += 1
+                self.flush_failed = False
+            except Exception as e:
+                logger.warning(f"Could not record {len(pending) + len(removed)} file rows: {e}")
+                with self._lock:
+                    for row in pending:
+                        digest = row['content_hash']
+                        if digest not in self._pending and digest not in self._removed:
+                            self._pending[digest] = row
+                    for digest in removed:
+                        if digest not in self._pending:
+                            self._removed.add(digest)
+                self.flush_failed = True
+
+    def finish(self):
+        """
+        Flush and mark the store built (it is no longer resumed).
+
+        If rows could not be written the store stays building, so the next
+        run resumes it instead of trusting an incomplete record.
+        """
+        self.flush()
+        if self.flush_failed:
+            logger.warning(f"Build of store row {self.db_vector_store_id} not marked complete: "
+                           f"{len(self._pending) + len(self._removed)} file rows are not recorded")
+            return
+        try:
+            self.dao.update_store(self.db_vector_store_id, ACTIVE)
+        except Exception as e:
+            logger.warning(f"Could not mark the build complete: {e}")
+
+    def _flush_due(self) -> bool:
+        # After a failed flush the rows are retried once per interval, not on every write
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            return True
+        return not self.flush_failed and len(self._pending) + len(self._removed) >= self.flush_rows
+
+    def _write(self, source_file_location: str, file_name: str, digest: str, status: str, metadata: Dict,
+               size: Optional[int] = None):
+        with self._lock:
+            row = self.rows.get(digest, {})
+            metadata = {**row.get('metadata', {}), 'content_hash': digest,
+                        'openai_vector_store_id': self.vector_store_id, **metadata}
+            row = {
+                'file_name': file_name,
+                'status': status,
+                'source_file_location': source_file_location,
+                'file_size_bytes': size if size is not None else row.get('file_size_bytes'),
+                'metadata': metadata
+            }
+            self.rows[digest] = row
+            self._removed.discard(digest)
+            self._pending[digest] = {
+                'content_hash': digest,
+                'source_location_type': _source_type(source_file_location),
+                **row
+            }
+            due = self._flush_due()
+        if due:
+            self.flush()
@@ -0,0 +1,296 @@
+"""
+Concurrent, resumable deletion of OpenAI files and vector stores.
+
+Cleanup used to delete one object per blocking call, so clearing an
+account with thousands of files took hours. The DeletionEngine deletes on
+a bounded pool of threads through the caller's client, whose
+OpenAIRequestScheduler paces the calls and retries rate-limited and failed
+ones. Files are deleted before the vector stores they belong to, and
+progress (rate, failures, time left) is logged as it goes.
+
+Every cleanup job writes a deletion journal next to the inventory cache:
+the objects it planned to delete, then one line per object deleted or
+failed. A job that is interrupted resumes from its journal the next time it
+runs - without listing the account again and without re-deleting what is
+already gone - and the journal is removed once the job completes.
+"""
+
+import re
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from openai import NotFoundError
+
+try:
+    from .inventory import FILES, INVENTORY_DIR, VECTOR_STORES, RemoteInventory
+except ImportError:
+    # Running as a script: resolve through the repository root on PYTHONPATH
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.inventory import (
+        FILES, INVENTORY_DIR, VECTOR_STORES, RemoteInventory
+    )
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DELETE_CONCURRENCY = 16
+PROGRESS_INTERVAL = 5.0
+JOURNAL_SUFFIX = ".deletions.jsonl"
+
+# (kind, object id); kinds are the inventory's FILES and VECTOR_STORES
+DeletionItem = Tuple[str, str]
+
+
+class DeletionJournal:
+    """Append-only record of one cleanup job: its plan, then each object's outcome. Thread-safe."""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Journal file (JSON lines)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> Tuple[List[DeletionItem], Set[str]]:
+        """
+        Read an interrupted job.
+
+        Returns:
+            Tuple of (planned items, ids already deleted)
+        """
+        items: List[DeletionItem] = []
+        done: Set[str] = set()
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # The last line may be cut short by the interruption
+                    continue
+                if record.get('op') == 'plan':
+                    items.extend((kind, object_id) for kind, object_id in record['items'])
+                elif record.get('op') == 'deleted':
+                    done.add(record['id'])
+        return items, done
+
+    def start(self, job: str, items: List[DeletionItem]):
+        """Begin a job: write its plan (replacing any earlier journal)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._close()
+            self._file = open(self.path, 'w')
+            self._write({'op': 'plan', 'job': job, 'items': [list(item) for item in items]})
+
+    def resume(self):
+        """Continue appending to an interrupted job's journal."""
+        with self._lock:
+            self._close()
+            self._file = open(self.path, 'a')
+
+    def record(self, object_id: str, deleted: bool, error: Optional[str] = None):
+        """Record the outcome of one deletion (called from worker threads)."""
+        record = {'op': 'deleted', 'id': object_id} if deleted else {'op': 'failed', 'id': object_id, 'error': error}
+        with self._lock:
+            self._write(record)
+
+    def finish(self):
+        """The job completed: drop its journal."""
+        with self._lock:
+            self._close()
+            if self.path.exists():
+                self.path.unlink()
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def _write(self, record: Dict):
+        if self._file is not None:
+            self._file.write(json.dumps(record) + '\n')
+            self._file.flush()
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class DeletionEngine:
+    """Deletes files and vector stores concurrently, journaled per job."""
+
+    def __init__(self, client, inventory: Optional[RemoteInventory] = None,
+                 concurrency: int = DEFAULT_DELETE_CONCURRENCY, journal_dir: Optional[Path] = INVENTORY_DIR,
+                 progress_interval: float = PROGRESS_INTERVAL):
+        """
+        Args:
+            client: OpenAI client (paced and retried by its request scheduler)
+            inventory: Inventory cache to drop deleted objects from
+            concurrency: Deletions in flight at once
+            journal_dir: Directory of the deletion journals (None: jobs are not resumable)
+            progress_interval: Seconds between progress log lines
+        """
+        self.client = client
+        self.inventory = inventory
+        self.concurrency = max(1, concurrency)
+        self.journal_dir = Path(journal_dir) if journal_dir is not None else None
+        self.progress_interval = progress_interval
+
+    def journal(self, job: str) -> Optional[DeletionJournal]:
+        """The journal of a job (one file per job name), or None if jobs are not journaled."""
+        if self.journal_dir is None:
+            return None
+        slug = re.sub(r'[^A-Za-z0-9_.-]+', '_', job).strip('_')
+        return DeletionJournal(self.journal_dir / f"{slug}{JOURNAL_SUFFIX}")
+
+    def interrupted(self, job: str) -> bool:
+        journal = self.journal(job)
+        return journal is not None and journal.exists
+
+    def run(self, job: str, plan: Callable[[], List[DeletionItem]], resume: bool = True) -> Dict:
+        """
+        Run a cleanup job, resuming it if an earlier run was interrupted.
+
+        Args:
+            job: Job name (the same action and filters give the same name)
+            plan: Returns the (kind, id) items to delete; only called for a fresh job
+            resume: Continue an interrupted job from its journal (False: plan afresh)
+
+        Returns:
+            Dictionary with counts, deleted and failed ids by kind, and timings
+        """
+        journal = self.journal(job)
+        done: Set[str] = set()
+        resumed = resume and journal is not None and journal.exists
+        if resumed:
+            items, done = journal.load()
+            journal.resume()
+            logger.info(f"Resuming interrupted cleanup '{job}': {len(done)}/{len(items)} already deleted")
+        else:
+            items = plan()
+            if journal is not None:
+                journal.start(job, items)
+
+        started = time.monotonic()
+        deleted: Dict[str, List[str]] = {FILES: [], VECTOR_STORES: []}
+        failed: Dict[str, List[str]] = {FILES: [], VECTOR_STORES: []}
+        try:
+            # Files first: a store deleted before its files would leave them unlisted by store
+            for kind in (FILES, VECTOR_STORES):
+                pending = [object_id for k, object_id in items if k == kind and object_id not in done]
+                if pending:
+                    deleted[kind], failed[kind] = self.delete(kind, pending, journal)
+        finally:
+            if journal is not None:
+                journal.close()
+        if journal is not None:
+            journal.finish()
+
+        seconds = time.monotonic() - started
+        total_deleted = len(deleted[FILES]) + len(deleted[VECTOR_STORES])
+        return {
+            'job': job,
+            'resumed': resumed,
+            'planned': len(items),
+            'already_deleted': len(done),
+            'deleted': total_deleted,
+            'failed': len(failed[FILES]) + len(failed[VECTOR_STORES]),
+            'files_deleted': len(deleted[FILES]),
+            'stores_deleted': len(deleted[VECTOR_STORES]),
+            'deleted_ids': deleted,
+            'failed_ids': failed,
+            'seconds': round(seconds, 3),
+            'per_sec': round(total_deleted / seconds, 1) if seconds > 0 else 0.0
+        }
+
+    def delete(self, kind: str, object_ids: List[str],
+               journal: Optional[DeletionJournal] = None) -> Tuple[List[str], List[str]]:
+        """
+        Delete objects of one kind concurrently.
+
+        Objects that no longer exist count as deleted.
+
+        Returns:
+            Tuple of (deleted ids, failed ids)
+        """
+        remove = self.client.files.delete if kind == FILES else self.client.vector_stores.delete
+        label = 'files' if kind == FILES else 'vector stores'
+        lock = threading.Lock()
+        deleted: List[str] = []
+        failed: List[str] = []
+        started = last_report = time.monotonic()
+
+        def delete_one(object_id: str):
+            nonlocal last_report
+            error = None
+            try:
+                remove(object_id)
+            except NotFoundError:
+                pass
+            except Exception as e:
+                error = str(e)
+                logger.warning(f"Could not delete {object_id}: {e}")
+            if journal is not None:
+                journal.record(object_id, error is None, error)
+            with lock:
+                (deleted if error is None else failed).append(object_id)
+                now = time.monotonic()
+                if now - last_report >= self.progress_interval:
+                    last_report = now
+                    self._log_progress(label, len(deleted), len(failed), len(object_ids), now - started)
+
+        logger.info(f"Deleting {len(object_ids)} {label} ({self.concurrency} at a time)...")
+        pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='delete')
+        try:
+            list(pool.map(delete_one, object_ids))
+        except BaseException:
+            # Interrupted: stop queued deletions; the journal has the ones that finished
+            pool.shutdown(wait=True, cancel_futures=True)
+            self._forget(kind, deleted)
+            raise
+        pool.shutdown()
+        self._forget(kind, deleted)
+        self._log_progress(label, len(deleted), len(failed), len(object_ids), time.monotonic() - started)
+        return deleted, failed
+
+    def list_store_files(self, store_ids: Iterable[str], strict: bool = False) -> Dict[str, List[str]]:
+        """
+        List the files attached to each store concurrently (every page).
+
+        Stores that no longer exist map to []. Stores that fail to list map to
+        [] as well, unless strict, in which case the error is raised.
+        """
+        def list_files(store_id: str) -> List[str]:
+            try:
+                return [vs_file.id for vs_file in self.client.vector_stores.files.list(vector_store_id=store_id,
+                                                                                        limit=100)]
+            except NotFoundError:
+                return []
+            except Exception as e:
+                if strict:
+                    raise
+                logger.warning(f"Could not list files for store {store_id}: {e}")
+                return []
+
+        store_ids = list(store_ids)
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='list') as pool:
+            return dict(zip(store_ids, pool.map(list_files, store_ids)))
+
+    def _forget(self, kind: str, object_ids: List[str]):
+        if self.inventory is not None and object_ids:
+            self.inventory.forget(kind, object_ids)
+
+    @staticmethod
+    def _log_progress(label: str, deleted: int, failed: int, total: int, elapsed: float):
+        rate = deleted / elapsed if elapsed > 0 else 0.0
+        remaining = total - deleted - failed
+        eta = f", ~{remaining / rate:.0f}s left" if rate > 0 and remaining else ""
+        logger.info(f"Deleted {deleted}/{total} {label} ({rate:.1f}/s, {failed} failed{eta})")
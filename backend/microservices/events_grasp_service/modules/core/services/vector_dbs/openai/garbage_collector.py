@@ -0,0 +1,167 @@
+"""
+Mark-and-sweep garbage collection of orphaned OpenAI files.
+
+A run that dies between uploading a file and attaching it, or a store
+deleted without its files, leaves file objects nothing refers to, and they
+are billed as storage until deleted. The collector marks every file id that
+is still referenced:
+
+- files attached to any vector store in the account, or to a store recorded
+  in event_vector_stores (listed remotely)
+- file ids in the vector_store_files rows of stores not marked 'deleted',
+  which include the uploaded-but-unattached files an interrupted build
+  reuses when it resumes
+- file ids in the upload manifests next to the vector store configs
+
+and then sweeps the unmarked files of the collected purpose ('assistants')
+that are older than a grace period, so uploads of a run still in progress
+are left alone. Marking is all-or-nothing: if a store's files cannot be
+listed or the database cannot be read, nothing is swept.
+
+A sweep is always planned from a fresh mark (marks go stale, so an
+interrupted sweep is not resumed from its journal) and deletes through the
+DeletionEngine with its bounded concurrency.
+"""
+
+import time
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+try:
+    from .build_checkpoint import DELETED, PROVIDER
+    from .deletion_engine import DeletionEngine
+    from .inventory import FILES, INVENTORY_DIR, RemoteInventory
+    from .sync_planner import referenced_file_ids
+    from ....dao.impl.vector_store_file_dao import VectorStoreFileDAO
+    from ....integrations.db import get_db_manager
+    from ....integrations.migrator import apply_migrations
+except ImportError:
+    # Running as a script: resolve through the repository root on PYTHONPATH
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.build_checkpoint import (
+        DELETED, PROVIDER
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.deletion_engine import (
+        DeletionEngine
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.inventory import (
+        FILES, INVENTORY_DIR, RemoteInventory
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.sync_planner import (
+        referenced_file_ids
+    )
+    from backend.microservices.events_grasp_service.modules.core.dao.impl.vector_store_file_dao import (
+        VectorStoreFileDAO
+    )
+    from backend.microservices.events_grasp_service.modules.core.integrations.db import get_db_manager
+    from backend.microservices.events_grasp_service.modules.core.integrations.migrator import apply_migrations
+
+logger = logging.getLogger(__name__)
+
+GC_JOB = "gc-sweep"
+GC_PURPOSE = "assistants"
+DEFAULT_GRACE_HOURS = 24.0
+
+# Mark sources
+MARK_STORES = 'vector_stores'
+MARK_DATABASE = 'database'
+MARK_MANIFESTS = 'manifests'
+
+
+class GarbageCollector:
+    """Finds and deletes the account's unreferenced files."""
+
+    def __init__(self, inventory: RemoteInventory, engine: DeletionEngine,
+                 config_dir: Path = INVENTORY_DIR, dao: Optional[VectorStoreFileDAO] = None):
+        """
+        Args:
+            inventory: Inventory of the account's files and vector stores
+            engine: DeletionEngine the sweep deletes through
+            config_dir: Directory of the vector store configs and upload manifests
+            dao: VectorStoreFileDAO (default: the application database)
+        """
+        self.inventory = inventory
+        self.engine = engine
+        self.config_dir = Path(config_dir)
+        self.dao = dao
+
+    def _open_dao(self) -> VectorStoreFileDAO:
+        if self.dao is None:
+            apply_migrations()
+            self.dao = VectorStoreFileDAO(get_db_manager())
+        return self.dao
+
+    def mark(self) -> Dict[str, Set[str]]:
+        """
+        Collect the referenced file ids.
+
+        Returns:
+            Marked file ids by source (MARK_STORES, MARK_DATABASE, MARK_MANIFESTS)
+
+        Raises:
+            Exception: If a store's files could not be listed or the database could not be read
+        """
+        store_links, file_rows = self._open_dao().list_live_references(PROVIDER, exclude_status=DELETED)
+        database = {row['openai_file_id'] for row in file_rows if row.get('openai_file_id')}
+
+        # Stores recorded locally are listed too, in case the inventory missed them (gone ones list as empty)
+        store_ids = [store['id'] for store in self.inventory.vector_stores(max_age=0)]
+        store_ids = list(dict.fromkeys(store_ids + store_links))
+        logger.info(f"Marking the files of {len(store_ids)} vector stores...")
+        attached = set()
+        for file_ids in self.engine.list_store_files(store_ids, strict=True).values():
+            attached.update(file_ids)
+
+        manifests = referenced_file_ids(self.config_dir)
+        return {MARK_STORES: attached, MARK_DATABASE: database, MARK_MANIFESTS: manifests}
+
+    def plan(self, purpose: str = GC_PURPOSE, grace_hours: float = DEFAULT_GRACE_HOURS) -> Dict:
+        """
+        Mark, then pick the files a sweep would delete.
+
+        Args:
+            purpose: Only files with this purpose are collected
+            grace_hours: Files created more recently than this are kept
+
+        Returns:
+            Dictionary with the orphaned files and the mark and skip counts
+        """
+        started = time.monotonic()
+        marks = self.mark()
+        marked = set().union(*marks.values())
+        cutoff = time.time() - grace_hours * 3600
+
+        orphans: List[Dict] = []
+        recent = other_purpose = 0
+        files = self.inventory.files(max_age=0)
+        for f in files:
+            if f['id'] in marked:
+                continue
+            if f['purpose'] != purpose:
+                other_purpose += 1
+            elif (f['created_at'] or 0) > cutoff:
+                recent += 1
+            else:
+                orphans.append(f)
+
+        return {
+            'files_total': len(files),
+            'marked': len(marked),
+            'marked_by_source': {source: len(ids) for source, ids in marks.items()},
+            'skipped_recent': recent,
+            'skipped_other_purpose': other_purpose,
+            'orphans': orphans,
+            'orphan_bytes': sum(f.get('bytes', 0) or 0 for f in orphans),
+            'purpose': purpose,
+            'grace_hours': grace_hours,
+            'seconds': round(time.monotonic() - started, 3)
+        }
+
+    def sweep(self, plan: Dict) -> Dict:
+        """
+        Delete the orphaned files of a plan.
+
+        Returns:
+            DeletionEngine result of the sweep
+        """
+        return self.engine.run(GC_JOB, lambda: [(FILES, f['id']) for f in plan['orphans']], resume=False)
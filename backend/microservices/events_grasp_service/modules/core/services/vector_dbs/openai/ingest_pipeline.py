@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Scrape -> Vector Store Ingest Pipeline
+
+Runs the scraper and the vector store upload at the same time instead of
+one after the other. Every page the scraper saves is put on a bounded queue
+that upload workers drain into the OpenAI Files API and the vector store.
+The page callback runs on the crawl's event loop, so it never blocks: a page
+that does not fit is held back, and the crawl awaits room in the queue (in a
+thread) after every page. When uploads fall behind the crawl slows down with
+them, memory stays bounded, and the total time for a fresh event approaches
+max(crawl, upload) rather than crawl + upload.
+"""
+
+import sys
+import time
+import queue
+import asyncio
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .upload_manifest import UploadManifest, content_hash
+    from .build_checkpoint import BuildCheckpoint
+    from .vector_store_manager import VECTOR_STORE_NAME, OpenAIVectorStoreManager
+    from ...web_scraping.base_scraper import BaseScraper
+    from ...web_scraping.crawl_engine import DEFAULT_CONCURRENCY
+    from ...web_scraping.content_store import CONTENT_STORE_DIR, ContentStore
+    from ...web_scraping.aws_reinvent_2025.scraper import OUTPUT_DIR, AWSReInventScraper
+except ImportError:
+    # Running as a script: resolve through the repository root on PYTHONPATH
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.upload_manifest import (
+        UploadManifest, content_hash
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.build_checkpoint import (
+        BuildCheckpoint
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.vector_store_manager import (
+        VECTOR_STORE_NAME, OpenAIVectorStoreManager
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.base_scraper import (
+        BaseScraper
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.crawl_engine import (
+        DEFAULT_CONCURRENCY
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.content_store import (
+        CONTENT_STORE_DIR, ContentStore
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.aws_reinvent_2025.scraper import (
+        OUTPUT_DIR, AWSReInventScraper
+    )
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_UPLOAD_WORKERS = 4
+
+# Queue item telling an upload worker to stop
+_DONE = None
+
+
+class IngestPipeline:
+    """Feeds a scraper's pages through a bounded queue into vector store uploads."""
+
+    def __init__(self, scraper: BaseScraper, manager: OpenAIVectorStoreManager,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, upload_workers: int = DEFAULT_UPLOAD_WORKERS):
+        """
+        Args:
+            scraper: Scraper to run (its on_page callback is taken over)
+            manager: Vector store manager used for the store, config and uploads
+            queue_size: Pages buffered between the crawl and the uploads
+            upload_workers: Threads uploading and attaching files
+        """
+        if queue_size < 1 or upload_workers < 1:
+            raise ValueError("queue_size and upload_workers must be at least 1")
+        self.scraper = scraper
+        self.manager = manager
+        self.upload_workers = upload_workers
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        # Pages handed over while the queue was full, waiting for page_backpressure to queue them
+        self._held: deque = deque()
+        self._held_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self.stats = {
+            'pages_queued': 0,
+            'already_in_store': 0,
+            'new_uploads': 0,
+            'reused_files': 0,
+            'failed': 0,
+            'backpressure_waits': 0,
+            'backpressure_seconds': 0.0
+        }
+
+        scraper.on_page = self.enqueue
+        scraper.on_page_backpressure = self.page_backpressure
+        # Uploads read the scraper's output; the store's rows are linked to the scraped event
+        manager.datasets_dir = scraper.output_dir
+        if manager.event_id is None:
+            manager.event_id = scraper.event_id
+        manager.from_content_store = scraper.use_content_store
+        manager.content_store_path = scraper.content_store_path
+
+    def enqueue(self, page: Dict):
+        """
+        Scraper callback: queue a saved page.
+
+        On the crawl's event loop this never blocks: a page that does not fit
+        is held until page_backpressure() queues it. Outside an event loop
+        (serial and replay runs) it waits for room itself.
+        """
+        self._held.append(page)
+        self.stats['pages_queued'] += 1
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._queue_held(block=True)
+            return
+        self._queue_held(block=False)
+
+    async def page_backpressure(self):
+        """Awaited by the crawl after every page: waits, off the event loop, until held pages are queued."""
+        if self._held:
+            await asyncio.get_running_loop().run_in_executor(None, self._queue_held, True)
+
+    def _queue_held(self, block: bool):
+        """Move held pages onto the queue; without block, only while there is room and nobody else is waiting."""
+        if not self._held_lock.acquire(blocking=block):
+            return
+        try:
+            while self._held:
+                try:
+                    self.queue.put_nowait(self._held[0])
+                except queue.Full:
+                    if not block:
+                        return
+                    started = time.monotonic()
+                    self.queue.put(self._held[0])
+                    with self._lock:
+                        self.stats['backpressure_waits'] += 1
+                        self.stats['backpressure_seconds'] += time.monotonic() - started
+                self._held.popleft()
+        finally:
+            self._held_lock.release()
+
+    def resolve_store(self) -> Tuple[str, Dict]:
+        """
+        Return the vector store to ingest into and its config, creating the store if needed.
+
+        Returns:
+            Tuple of (vector_store_id, config)
+        """
+        config = self.manager.load_config()
+        existing = self.manager.find_existing_store()
+        if existing is not None:
+            if not config or config.get('vector_store_id') != existing['id']:
+                config = {'vector_store_id': existing['id'], 'created_at': datetime.now().isoformat(), 'files': []}
+            logger.info(f"Ingesting into existing vector store: {existing['id']}")
+            return existing['id'], config
+
+        vector_store = self.manager.client.vector_stores.create(name=self.manager.store_name)
+        logger.info(f"Created vector store: {vector_store.id}")
+        return vector_store.id, {'vector_store_id': vector_store.id, 'created_at': datetime.now().isoformat(), 'files': []}
+
+    def save_config(self, vector_store_id: str, config: Dict, files: List[Dict]):
+        """Add the uploaded files to the vector store config and save it."""
+        config.update({
+            'vector_store_name': self.manager.store_name,
+            'vector_store_id': vector_store_id,
+            'updated_at': datetime.now().isoformat(),
+            'datasets_directory': str(self.manager.datasets_dir)
+        })
+        config['files'] = config.get('files', []) + files
+        config['total_files'] = len(config['files'])
+        self.manager.save_config(config)
+
+    def _upload_worker(self, vector_store_id: str, manifest: UploadManifest, in_store: set, results: List[Dict],
+                       file_log: Optional[BuildCheckpoint]):
+        store = ContentStore(self.manager.content_store_path) if self.manager.from_content_store else None
+        try:
+            while True:
+                page = self.queue.get()
+                if page is _DONE:
+                    return
+                # A worker that died would leave the crawl waiting on a queue nobody drains
+                try:
+                    self._ingest_page(page, vector_store_id, manifest, in_store, results, file_log, store)
+                except Exception as e:
+                    logger.error(f"Failed to ingest {page.get('url') or page.get('filename')}: {e}")
+                    with self._lock:
+                        self.stats['failed'] += 1
+        finally:
+            if store is not None:
+                store.close()
+
+    def _ingest_page(self, page: Dict, vector_store_id: str, manifest: UploadManifest, in_store: set,
+                     results: List[Dict], file_log: Optional[BuildCheckpoint], store: Optional[ContentStore]):
+        document = self.manager.document_for_page(page, store)
+        if document is None:
+            return
+        try:
+            content = document.read_bytes()
+        except OSError as e:
+            logger.error(f"Failed to read {document.name}: {e}")
+            with self._lock:
+                self.stats['failed'] += 1
+            return
+        # Content already attached (or being attached by another worker) is skipped
+        digest = content_hash(content)
+        with self._lock:
+            if digest in in_store:
+                self.stats['already_in_store'] += 1
+                return
+            in_store.add(digest)
+
+        try:
+            file_info = self.manager.upload_and_attach(vector_store_id, document, manifest, content)
+        except Exception:
+            with self._lock:
+                in_store.discard(digest)
+            raise
+        with self._lock:
+            if file_info is None:
+                self.stats['failed'] += 1
+                in_store.discard(digest)
+                return
+            self.stats['reused_files' if file_info['reused'] else 'new_uploads'] += 1
+            results.append(file_info)
+        # Buffered: rows reach vector_store_files in bulk
+        if file_log is not None:
+            file_log.files_attached([file_info])
+
+    def run(self, clear_existing: bool = True) -> Dict:
+        """
+        Scrape and upload concurrently.
+
+        Args:
+            clear_existing: Clear the scraper's output directory first
+
+        Returns:
+            Dictionary with scrape and upload results
+        """
+        started = time.monotonic()
+        self.manager.scheduler.reset_stats()
+        vector_store_id, config = self.resolve_store()
+        manifest = self.manager.load_upload_manifest(config, self.manager.get_content_files())
+        self.manager.bind_upload_manifest(manifest, vector_store_id)
+        in_store = set(manifest.hashes())
+        results: List[Dict] = []
+        file_log = self.manager.open_file_log(vector_store_id, config)
+
+        workers = [
+            threading.Thread(target=self._upload_worker,
+                             args=(vector_store_id, manifest, in_store, results, file_log),
+                             name=f"upload-{i}", daemon=True)
+            for i in range(self.upload_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            scrape_result = self.scraper.run(clear_existing=clear_existing)
+        finally:
+            crawl_seconds = time.monotonic() - started
+            # Pages still held when the crawl stopped go ahead of the stop markers
+            self._queue_held(block=True)
+            for _ in workers:
+                self.queue.put(_DONE)
+            for worker in workers:
+                worker.join()
+            # Pages re-uploaded with changed content replace their previous version
+            detached = set(self.manager.detach_stale_versions(vector_store_id, manifest, results))
+            if file_log is not None:
+                file_log.files_removed(f['content_hash'] for f in config.get('files', [])
+                                       if f['file_id'] in detached and f.get('content_hash'))
+                file_log.flush()
+            config['files'] = [f for f in config.get('files', []) if f['file_id'] not in detached]
+            # Record what was uploaded even if the scrape failed
+            self.save_config(vector_store_id, config, results)
+            manifest.save()
+        total_seconds = time.monotonic() - started
+
+        self.stats['backpressure_seconds'] = round(self.stats['backpressure_seconds'], 3)
+        logger.info("=" * 60)
+        logger.info("Ingest Pipeline Complete!")
+        logger.info(f"Pages scraped: {scrape_result['total_pages']} in {crawl_seconds:.2f}s")
+        logger.info(f"Files added: {len(results)} (new uploads: {self.stats['new_uploads']}, "
+                    f"reused: {self.stats['reused_files']}, failed: {self.stats['failed']})")
+        logger.info(f"Scraper waited on uploads {self.stats['backpressure_waits']} times "
+                    f"({self.stats['backpressure_seconds']}s)")
+        logger.info(f"Total: {total_seconds:.2f}s (uploads finished {total_seconds - crawl_seconds:.2f}s after the crawl)")
+        logger.info("=" * 60)
+
+        return {
+            'success': scrape_result['success'],
+            'vector_store_id': vector_store_id,
+            'total_pages': scrape_result['total_pages'],
+            'files_added': len(results),
+            'total_files': config['total_files'],
+            'crawl_seconds': round(crawl_seconds, 3),
+            'total_seconds': round(total_seconds, 3),
+            **self.stats,
+            'api': self.manager.api_report()
+        }
+
+
+def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Scrape AWS re:Invent content and upload it to the vector store as it is scraped')
+    parser.add_argument('--store-name', type=str, default=VECTOR_STORE_NAME,
+                        help=f'Vector store name (default: {VECTOR_STORE_NAME})')
+    parser.add_argument('--output-dir', type=str, default=str(OUTPUT_DIR),
+                        help=f'Output directory for scraped content (default: {OUTPUT_DIR})')
+    parser.add_argument('--max-depth', type=int, default=1,
+                        help='Maximum depth for following links (default: 1)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Number of concurrent fetch workers (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only re-parse pages that changed since the last run (conditional GET)')
+    parser.add_argument('--content-store', action='store_true',
+                        help='Save page text to the shared content-addressed store instead of .txt files')
+    parser.add_argument('--content-store-path', type=str, default=str(CONTENT_STORE_DIR),
+                        help=f'Content store directory (default: {CONTENT_STORE_DIR})')
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE,
+                        help=f'Pages buffered between scraping and uploading (default: {DEFAULT_QUEUE_SIZE})')
+    parser.add_argument('--upload-workers', type=int, default=DEFAULT_UPLOAD_WORKERS,
+                        help=f'Concurrent upload threads (default: {DEFAULT_UPLOAD_WORKERS})')
+    parser.add_argument('--event-id', type=int,
+                        help='Event the scrape and the vector store rows are recorded under')
+
+    args = parser.parse_args()
+
+    try:
+        scraper = AWSReInventScraper(
+            output_dir=Path(args.output_dir),
+            max_depth=args.max_depth,
+            concurrency=args.concurrency,
+            incremental=args.incremental,
+            content_store=args.content_store,
+            content_store_path=Path(args.content_store_path),
+            event_id=args.event_id
+        )
+        manager = OpenAIVectorStoreManager(store_name=args.store_name)
+        pipeline = IngestPipeline(scraper, manager, queue_size=args.queue_size, upload_workers=args.upload_workers)
+        result = pipeline.run(clear_existing=not args.incremental)
+    except ValueError as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+
+    if result['success']:
+        print(f"\n✅ Scraped {result['total_pages']} pages and added {result['files_added']} files "
+              f"to {result['vector_store_id']} in {result['total_seconds']:.1f}s")
+        if result['failed']:
+            print(f"⚠️ {result['failed']} files failed to upload")
+    else:
+        print("\n❌ Ingest failed")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
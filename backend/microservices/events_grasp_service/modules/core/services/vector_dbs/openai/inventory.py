@@ -0,0 +1,181 @@
+"""
+Cached inventory of the files and vector stores in an OpenAI account.
+
+Listings are paginated to the end (the list endpoints return one page per
+call) and cached in a JSON file per account. Within the TTL the cache is
+served without any API call. After it, the listing is refreshed newest-first
+only until an already-known object is reached, so a refresh costs one page
+plus one per page of new objects. Objects deleted by other tools are only
+noticed by a full refresh, which happens every full_refresh_interval or on
+request; deletions made through this code are forgotten immediately.
+
+Vector stores are always listed in full: their file_counts change while the
+objects stay known, and an account has few stores.
+"""
+
+import os
+import json
+import time
+import atexit
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INVENTORY_DIR = Path.home() / "runtime_data" / "keys" / "openai" / "vector-dbs"
+DEFAULT_TTL = 300.0
+FULL_REFRESH_INTERVAL = 3600.0
+PAGE_SIZE = 100
+# Forgotten ids are written back at most this often (and at exit)
+SAVE_INTERVAL = 1.0
+
+FILES = 'files'
+VECTOR_STORES = 'vector_stores'
+
+
+def _file_record(f) -> Dict:
+    return {
+        'id': f.id,
+        'filename': f.filename,
+        'purpose': f.purpose,
+        'bytes': f.bytes,
+        'created_at': f.created_at
+    }
+
+
+def _store_record(s) -> Dict:
+    return {
+        'id': s.id,
+        'name': s.name,
+        'file_counts': {
+            'total': s.file_counts.total,
+            'completed': s.file_counts.completed,
+            'in_progress': s.file_counts.in_progress,
+            'failed': s.file_counts.failed
+        },
+        'created_at': s.created_at
+    }
+
+
+class RemoteInventory:
+    """Paginated, TTL-cached listing of an account's files and vector stores."""
+
+    def __init__(self, client, cache_dir: Path = INVENTORY_DIR, ttl: float = DEFAULT_TTL,
+                 full_refresh_interval: float = FULL_REFRESH_INTERVAL):
+        """
+        Args:
+            client: OpenAI client
+            cache_dir: Directory for the cache file (one per API key)
+            ttl: Seconds a listing is served from the cache before it is refreshed
+            full_refresh_interval: Seconds between full re-listings (to notice external deletions)
+        """
+        self.client = client
+        self.ttl = ttl
+        self.full_refresh_interval = full_refresh_interval
+        account = hashlib.sha256((getattr(client, 'api_key', None) or '').encode('utf-8')).hexdigest()[:12]
+        self.cache_file = Path(cache_dir) / f"inventory-{account}.json"
+        self.stats = {'api_pages': 0, 'incremental_refreshes': 0, 'full_refreshes': 0, 'cache_hits': 0}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._saved_at = 0.0
+        self._data = {kind: {'items': {}, 'refreshed_at': 0.0, 'full_refresh_at': 0.0} for kind in (FILES, VECTOR_STORES)}
+
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'r') as f:
+                    self._data.update(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable inventory cache {self.cache_file}: {e}")
+        atexit.register(self.flush)
+
+    def files(self, max_age: Optional[float] = None, full: bool = False) -> List[Dict]:
+        """
+        List the account's files, newest first.
+
+        Args:
+            max_age: Refresh if the cached listing is older than this (default: the TTL; 0 = always)
+            full: Re-list everything instead of refreshing incrementally
+        """
+        return self._items(FILES, max_age, full)
+
+    def vector_stores(self, max_age: Optional[float] = None, full: bool = False) -> List[Dict]:
+        """List the account's vector stores, newest first (same arguments as files())."""
+        return self._items(VECTOR_STORES, max_age, full)
+
+    def age(self, kind: str = FILES) -> Optional[float]:
+        """Seconds since a listing was last refreshed, or None if it never was."""
+        refreshed_at = self._data[kind]['refreshed_at']
+        return time.time() - refreshed_at if refreshed_at else None
+
+    def forget(self, kind: str, ids: Iterable[str]):
+        """Drop deleted objects from the cache."""
+        with self._lock:
+            items = self._data[kind]['items']
+            for object_id in ids:
+                self._dirty |= items.pop(object_id, None) is not None
+            if self._dirty and time.monotonic() - self._saved_at > SAVE_INTERVAL:
+                self._save()
+
+    def flush(self):
+        """Write pending changes to the cache file."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def _items(self, kind: str, max_age: Optional[float], full: bool) -> List[Dict]:
+        with self._lock:
+            state = self._data[kind]
+            now = time.time()
+            if full or now - state['full_refresh_at'] > self.full_refresh_interval:
+                self._refresh(kind, full=True)
+            elif now - state['refreshed_at'] > (self.ttl if max_age is None else max_age):
+                # Known stores change (file_counts), so stores are not refreshed incrementally
+                self._refresh(kind, full=kind == VECTOR_STORES)
+            else:
+                self.stats['cache_hits'] += 1
+            return sorted(state['items'].values(), key=lambda item: item['created_at'] or 0, reverse=True)
+
+    def _refresh(self, kind: str, full: bool):
+        state = self._data[kind]
+        known = state['items']
+        newest = max((item['created_at'] or 0 for item in known.values()), default=0)
+        lister = self.client.files.list if kind == FILES else self.client.vector_stores.list
+        record = _file_record if kind == FILES else _store_record
+        started = time.monotonic()
+
+        fetched = {}
+        pages = 0
+        for page in lister(order='desc', limit=PAGE_SIZE).iter_pages():
+            pages += 1
+            reached_known = False
+            for obj in page.data:
+                # Newest first: everything from here on is already cached
+                if not full and (obj.id in known or (obj.created_at or 0) < newest):
+                    reached_known = True
+                    break
+                fetched[obj.id] = record(obj)
+            if reached_known:
+                break
+
+        now = time.time()
+        state['items'] = fetched if full else {**known, **fetched}
+        state['refreshed_at'] = now
+        if full:
+            state['full_refresh_at'] = now
+        self.stats['api_pages'] += pages
+        self.stats['full_refreshes' if full else 'incremental_refreshes'] += 1
+        logger.info(f"{'Listed' if full else 'Refreshed'} {kind}: {len(fetched)} "
+                    f"{'total' if full else 'new'} in {pages} pages ({time.monotonic() - started:.2f}s)")
+        self._save()
+
+    def _save(self):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self._data, f)
+        os.replace(tmp, self.cache_file)
+        self._dirty = False
+        self._saved_at = time.monotonic()
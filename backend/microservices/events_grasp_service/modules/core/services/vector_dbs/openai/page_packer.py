@@ -0,0 +1,245 @@
+"""
+Packing of small pages into bundle files for the vector store.
+
+A blog with thousands of short posts costs one files.create call, one
+attachment and one file object per post. Packing concatenates small pages
+into bundles of PACK_TARGET_PAGES pages on average (at most PACK_MAX_BYTES),
+each page preceded by a delimiter naming its file and source URL, and
+uploads the bundles instead. Pages of SMALL_PAGE_BYTES or more are still
+uploaded on their own.
+
+Bundles are uploaded like any content file: they have a name and bytes, are
+deduplicated by content hash, and a bundle whose pages changed is replaced
+under the same name. To keep an edit from reshuffling every bundle after
+it, pages are taken in filename order and a bundle ends after a page whose
+name hashes to a boundary (content-defined chunking over the names), so
+adding, removing or editing a page only changes the bundle that holds it.
+
+The bundle map, a JSON file next to the vector store config, records the
+pages in each bundle with their byte ranges, so a citation of a bundle's
+file id is resolved back to the page (and URL) it came from.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .upload_manifest import UploadManifest, content_hash
+except ImportError:
+    # Running as a script: resolve through the repository root on PYTHONPATH
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.upload_manifest import (
+        UploadManifest, content_hash
+    )
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_MAP_SUFFIX = ".bundles.json"
+BUNDLE_PREFIX = "bundle-"
+
+# Average pages per bundle, hard limits per bundle, and the size from which a page is uploaded alone
+PACK_TARGET_PAGES = 20
+PACK_MAX_PAGES = 64
+PACK_MAX_BYTES = 512 * 1024
+SMALL_PAGE_BYTES = 32 * 1024
+
+DELIMITER = "#" * 80
+
+
+def page_source(content: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """Return the (URL, title) from a page document's header."""
+    url = title = None
+    for line in content[:4096].decode('utf-8', errors='replace').splitlines()[:6]:
+        if line.startswith('URL: '):
+            url = line[5:].strip()
+        elif line.startswith('Title: '):
+            title = line[7:].strip()
+    return url, title
+
+
+def _page_header(index: int, total: int, name: str, url: Optional[str]) -> bytes:
+    return (f"{DELIMITER}\n"
+            f"PAGE {index} OF {total} | FILE: {name}\n"
+            f"SOURCE: {url or 'unknown'}\n"
+            f"{DELIMITER}\n\n").encode('utf-8')
+
+
+def _is_boundary(name: str, target_pages: int) -> bool:
+    digest = hashlib.sha1(name.encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'big') % target_pages == 0
+
+
+class PageBundle:
+    """A bundle of small pages, uploaded as one file (same name and read_bytes() interface as a page)."""
+
+    def __init__(self, pages: List[Tuple[object, Optional[str], Optional[str]]]):
+        """
+        Args:
+            pages: (page file, URL, title) in bundle order
+        """
+        self.pages = pages
+        self.name = f"{BUNDLE_PREFIX}{Path(pages[0][0].name).stem}.txt"
+        # Set when the bundle is rendered
+        self.page_ranges: List[Dict] = []
+        self.digest: Optional[str] = None
+
+    def read_bytes(self) -> bytes:
+        """Render the bundle: every page preceded by its delimiter. Records each page's byte range."""
+        parts, ranges, offset = [], [], 0
+        for index, (page, url, title) in enumerate(self.pages, 1):
+            header = _page_header(index, len(self.pages), page.name, url)
+            body = page.read_bytes() + b"\n\n"
+            ranges.append({'filename': page.name, 'url': url, 'title': title,
+                           'start': offset, 'end': offset + len(header) + len(body)})
+            parts += [header, body]
+            offset += len(header) + len(body)
+        content = b"".join(parts)
+        self.page_ranges = ranges
+        self.digest = content_hash(content)
+        return content
+
+    def __str__(self) -> str:
+        return f"bundle:{self.name}"
+
+
+def pack_pages(files: Iterable, target_pages: int = PACK_TARGET_PAGES, max_pages: int = PACK_MAX_PAGES,
+               max_bytes: int = PACK_MAX_BYTES, small_page_bytes: int = SMALL_PAGE_BYTES) -> Tuple[List[PageBundle], List]:
+    """
+    Group small pages into bundles.
+
+    Args:
+        files: Page files (Paths or StoredDocuments)
+        target_pages: Average pages per bundle
+        max_pages: Most pages in one bundle
+        max_bytes: Largest bundle (before delimiters)
+        small_page_bytes: Pages at least this large are not packed
+
+    Returns:
+        Tuple of (bundles, pages to upload on their own)
+    """
+    target_pages = max(1, target_pages)
+    bundles: List[PageBundle] = []
+    alone = []
+    current: List[Tuple[object, Optional[str], Optional[str]]] = []
+    size = 0
+    for page in sorted(files, key=lambda f: f.name):
+        try:
+            content = page.read_bytes()
+        except OSError as e:
+            logger.error(f"Failed to read {page.name}: {e}")
+            continue
+        if len(content) >= small_page_bytes:
+            alone.append(page)
+            continue
+        if current and (size + len(content) > max_bytes or len(current) >= max_pages):
+            bundles.append(PageBundle(current))
+            current, size = [], 0
+        url, title = page_source(content)
+        current.append((page, url, title))
+        size += len(content)
+        if _is_boundary(page.name, target_pages):
+            bundles.append(PageBundle(current))
+            current, size = [], 0
+    if current:
+        bundles.append(PageBundle(current))
+    return bundles, alone
+
+
+class BundleMap:
+    """Bundle name -> uploaded file id and page byte ranges, for resolving citations."""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Bundle map JSON file (loaded if it exists)
+        """
+        self.path = Path(path)
+        self.bundles: Dict[str, Dict] = {}
+        if self.path.exists():
+            with open(self.path, 'r') as f:
+                self.bundles = json.load(f).get('bundles', {})
+
+    def __len__(self) -> int:
+        return len(self.bundles)
+
+    def update(self, bundles: List[PageBundle], manifest: UploadManifest):
+        """
+        Replace the map with the given bundles (those of the current corpus).
+
+        Args:
+            bundles: The corpus's bundles
+            manifest: Upload manifest of the store, for the bundles' file ids
+        """
+        mapped = {}
+        for bundle in bundles:
+            if bundle.digest is None:
+                bundle.read_bytes()
+            entry = manifest.get(bundle.digest)
+            mapped[bundle.name] = {
+                'content_hash': bundle.digest,
+                'file_id': entry['file_id'] if entry else None,
+                'pages': bundle.page_ranges
+            }
+        self.bundles = mapped
+
+    def save(self):
+        """Write the map atomically."""
+        data = {'updated_at': datetime.now().isoformat(), 'bundles': self.bundles}
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, self.path)
+        pages = sum(len(b['pages']) for b in self.bundles.values())
+        logger.info(f"Bundle map saved to {self.path} ({len(self.bundles)} bundles, {pages} pages)")
+
+    def delete(self):
+        self.bundles = {}
+        if self.path.exists():
+            self.path.unlink()
+
+    def _bundle(self, key: str) -> Optional[Dict]:
+        if key in self.bundles:
+            return self.bundles[key]
+        for bundle in self.bundles.values():
+            if bundle['file_id'] == key:
+                return bundle
+        return None
+
+    def resolve(self, key: str, offset: Optional[int] = None) -> List[Dict]:
+        """
+        Return the pages of a bundle, or the page at a byte offset.
+
+        Args:
+            key: Bundle name or OpenAI file id
+            offset: Byte offset in the bundle
+
+        Returns:
+            Page records (filename, url, title, start, end); empty if the key is not a bundle
+        """
+        bundle = self._bundle(key)
+        if bundle is None:
+            return []
+        if offset is None:
+            return list(bundle['pages'])
+        return [page for page in bundle['pages'] if page['start'] <= offset < page['end']]
+
+    def resolve_text(self, key: str, text: str) -> List[Dict]:
+        """
+        Return the pages a cited chunk of a bundle came from.
+
+        Chunks of small pages carry their delimiters, so the pages whose file
+        name or source URL appear in the text are returned; if none do (a chunk
+        in the middle of a long page), all of the bundle's pages.
+
+        Args:
+            key: Bundle name or OpenAI file id
+            text: Chunk text from a file search result
+        """
+        pages = self.resolve(key)
+        named = [page for page in pages
+                 if f"FILE: {page['filename']}" in text or (page['url'] and f"SOURCE: {page['url']}" in text)]
+        return named or pages
@@ -0,0 +1,258 @@
+"""
+Rate-Limit-Aware Scheduler for OpenAI API Calls
+
+Every request an OpenAI client makes passes through one shared token
+bucket, installed as the transport of the client's HTTP connection pool so
+it covers all endpoints (uploads, file batches, polling, listings) without
+touching the call sites:
+
+- Pacing: the bucket's rate follows the x-ratelimit-remaining-requests /
+  x-ratelimit-reset-requests headers (the remaining budget spread over the
+  time to reset), capped at max_rate; without them it grows additively on
+  success and halves on 429.
+- Retries: 429, 408/409 and 5xx responses and connection errors are retried
+  with full-jitter exponential backoff. Retry-After / retry-after-ms, or an
+  exhausted request budget, pause every thread sharing the scheduler until
+  the given time instead of letting them run into more 429s.
+- Stats: achieved requests/sec, retries and rate-limit hits per run.
+"""
+
+import re
+import time
+import random
+import logging
+import threading
+from typing import Dict, Optional
+
+import httpx
+from openai import DefaultHttpxClient, OpenAI
+
+try:
+    from ...web_scraping.rate_control import parse_retry_after
+except ImportError:
+    # Running as a script: resolve through the repository root on PYTHONPATH
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.rate_control import (
+        parse_retry_after
+    )
+
+logger = logging.getLogger(__name__)
+
+# Requests per second until the API's rate-limit headers say otherwise
+DEFAULT_MAX_RATE = 50.0
+MIN_RATE = 0.5
+ADDITIVE_STEP = 0.5
+BACKOFF_FACTOR = 0.5
+
+DEFAULT_MAX_RETRIES = 6
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+# Longest server-requested pause honored before the request is given up on
+MAX_RETRY_AFTER = 120.0
+
+RETRY_STATUSES = (408, 409, 429, 500, 502, 503, 504)
+
+_DURATION = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+_UNIT_SECONDS = {'h': 3600.0, 'm': 60.0, 's': 1.0, 'ms': 0.001}
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """
+    Parse an x-ratelimit-reset-* header ('20ms', '1s', '6m0s', '1h2m3.5s') into seconds.
+
+    Returns:
+        Seconds until the limit resets, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    parts = _DURATION.findall(value.strip())
+    if not parts:
+        return None
+    return sum(float(number) * _UNIT_SECONDS[unit] for number, unit in parts)
+
+
+def retry_delay(headers) -> Optional[float]:
+    """Seconds a response asks the client to wait (retry-after-ms, then Retry-After)."""
+    retry_after_ms = headers.get('retry-after-ms')
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    return parse_retry_after(headers.get('retry-after'))
+
+
+class OpenAIRequestScheduler:
+    """Token bucket, rate-limit tracking and retry policy shared by OpenAI clients."""
+
+    def __init__(self, max_rate: float = DEFAULT_MAX_RATE, max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff_base: float = BACKOFF_BASE, backoff_cap: float = BACKOFF_CAP):
+        """
+        Args:
+            max_rate: Requests per second never exceeded
+            max_retries: Retries per request before the error is returned to the caller
+            backoff_base: First backoff ceiling in seconds (doubles per attempt)
+            backoff_cap: Largest backoff ceiling in seconds
+        """
+        self.max_rate = max_rate
+        self.rate = max_rate
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.tokens = 1.0
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {
+                'requests': 0,
+                'retries': 0,
+                'rate_limited': 0,
+                'server_errors': 0,
+                'connection_errors': 0,
+                'gave_up': 0,
+                'waited_seconds': 0.0
+            }
+            self._first_request_at: Optional[float] = None
+            self._last_response_at: Optional[float] = None
+
+    def _refill(self, now: float):
+        # Allow a burst of about one second's worth of requests
+        self.tokens = min(max(1.0, self.rate), self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def acquire(self):
+        """Block until the bucket allows another request."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                elif self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    self.stats['requests'] += 1
+                    self.stats['waited_seconds'] += waited
+                    if self._first_request_at is None:
+                        self._first_request_at = now
+                    return
+                else:
+                    wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def observe(self, response: httpx.Response):
+        """Adjust pacing from a response's status and rate-limit headers."""
+        headers = response.headers
+        remaining = headers.get('x-ratelimit-remaining-requests')
+        reset = parse_reset(headers.get('x-ratelimit-reset-requests'))
+        with self._lock:
+            now = time.monotonic()
+            self._last_response_at = now
+            if response.status_code == 429:
+                self.stats['rate_limited'] += 1
+                self.rate = max(MIN_RATE, self.rate * BACKOFF_FACTOR)
+            elif response.status_code >= 500:
+                self.stats['server_errors'] += 1
+
+            if remaining is not None and remaining.isdigit() and reset is not None:
+                if int(remaining) == 0:
+                    # Budget exhausted: nobody sends until it resets
+                    self.blocked_until = max(self.blocked_until, now + reset)
+                elif response.status_code != 429:
+                    # Spread what is left of the budget over the time to reset
+                    self.rate = max(MIN_RATE, min(self.max_rate, int(remaining) / max(reset, 0.001)))
+            elif response.status_code < 400:
+                self.rate = min(self.max_rate, self.rate + ADDITIVE_STEP)
+
+            delay = retry_delay(headers) if response.status_code in RETRY_STATUSES else None
+            if delay:
+                self.blocked_until = max(self.blocked_until, now + min(delay, MAX_RETRY_AFTER))
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for a retry attempt (0-based)."""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    def record_retry(self, gave_up: bool = False, connection_error: bool = False):
+        with self._lock:
+            if connection_error:
+                self.stats['connection_errors'] += 1
+            self.stats['gave_up' if gave_up else 'retries'] += 1
+
+    def report(self) -> Dict:
+        """Requests, retries and achieved requests/sec since the stats were reset."""
+        with self._lock:
+            stats = dict(self.stats)
+            elapsed = 0.0
+            if self._first_request_at is not None and self._last_response_at is not None:
+                elapsed = self._last_response_at - self._first_request_at
+            stats['waited_seconds'] = round(stats['waited_seconds'], 3)
+            stats['elapsed_seconds'] = round(elapsed, 3)
+            stats['requests_per_sec'] = round(stats['requests'] / elapsed, 2) if elapsed > 0 else 0.0
+            stats['current_rate'] = round(self.rate, 2)
+            return stats
+
+    def log_report(self):
+        report = self.report()
+        if not report['requests']:
+            return
+        logger.info(f"OpenAI API: {report['requests']} requests in {report['elapsed_seconds']:.1f}s "
+                    f"({report['requests_per_sec']:.1f}/s), {report['retries']} retries "
+                    f"({report['rate_limited']} rate limited, {report['server_errors']} server errors), "
+                    f"{report['gave_up']} gave up, {report['waited_seconds']:.1f}s paced across threads")
+
+    def http_client(self, **kwargs) -> httpx.Client:
+        """HTTP client for OpenAI(http_client=...) whose requests go through this scheduler."""
+        return DefaultHttpxClient(transport=ScheduledTransport(self), **kwargs)
+
+    def client(self, **kwargs) -> OpenAI:
+        """OpenAI client using this scheduler (the SDK's own retries are turned off)."""
+        return OpenAI(max_retries=0, http_client=self.http_client(), **kwargs)
+
+
+class ScheduledTransport(httpx.BaseTransport):
+    """httpx transport that paces and retries requests through an OpenAIRequestScheduler."""
+
+    def __init__(self, scheduler: OpenAIRequestScheduler, transport: Optional[httpx.BaseTransport] = None):
+        self.scheduler = scheduler
+        self._transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        scheduler = self.scheduler
+        attempt = 0
+        while True:
+            scheduler.acquire()
+            try:
+                response = self._transport.handle_request(request)
+            except (httpx.ConnectError, httpx.ReadError, httpx.RemoteProtocolError, httpx.TimeoutException):
+                if attempt >= scheduler.max_retries:
+                    scheduler.record_retry(gave_up=True, connection_error=True)
+                    raise
+                scheduler.record_retry(connection_error=True)
+                time.sleep(scheduler.backoff(attempt))
+                attempt += 1
+                continue
+
+            scheduler.observe(response)
+            if response.status_code not in RETRY_STATUSES:
+                return response
+            if attempt >= scheduler.max_retries:
+                scheduler.record_retry(gave_up=True)
+                logger.warning(f"Giving up on {request.method} {request.url.path} after {attempt} retries "
+                               f"(HTTP {response.status_code})")
+                return response
+
+            # Server-requested pauses are applied to the whole bucket by observe()
+            delay = retry_delay(response.headers)
+            response.read()
+            response.close()
+            scheduler.record_retry()
+            if not delay:
+                time.sleep(scheduler.backoff(attempt))
+            attempt += 1
+
+    def close(self):
+        self._transport.close()
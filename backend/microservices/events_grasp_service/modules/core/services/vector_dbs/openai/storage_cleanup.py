@@ -8,6 +8,10 @@ Provides options to:
 - Delete all vector stores
 - Delete only files/stores matching specific names
 - Dry-run mode to preview what would be deleted
+- Garbage-collect orphaned files no vector store references (see garbage_collector)
+
+Deletions run concurrently and are journaled (see deletion_engine), so an
+interrupted cleanup picks up where it stopped when run again.
 """
 
 import os
@@ -20,6 +24,26 @@ from typing import List, Dict, Optional
 
 from openai import OpenAI
 
+try:
+    from .deletion_engine import DEFAULT_DELETE_CONCURRENCY, DeletionEngine
+    from .garbage_collector import DEFAULT_GRACE_HOURS, GC_PURPOSE, GarbageCollector
+    from .inventory import FILES, VECTOR_STORES, RemoteInventory
+    from .request_scheduler import OpenAIRequestScheduler
+except ImportError:
+    # Running as a script: resolve through the repository root on PYTHONPATH
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.deletion_engine import (
+        DEFAULT_DELETE_CONCURRENCY, DeletionEngine
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.garbage_collector import (
+        DEFAULT_GRACE_HOURS, GC_PURPOSE, GarbageCollector
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.inventory import (
+        FILES, VECTOR_STORES, RemoteInventory
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.request_scheduler import (
+        OpenAIRequestScheduler
+    )
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,9 +55,23 @@ logger = logging.getLogger(__name__)
 class OpenAIStorageManager:
     """Manager for cleaning up OpenAI storage (files and vector stores)."""
 
-    def __init__(self):
-        """Initialize the storage manager."""
+    def __init__(self, refresh: bool = False, concurrency: int = DEFAULT_DELETE_CONCURRENCY, resume: bool = True):
+        """
+        Initialize the storage manager.
+
+        Args:
+            refresh: Re-list all files and stores instead of using the cached inventory
+            concurrency: Deletions in flight at once
+            resume: Continue an interrupted cleanup from its deletion journal instead of starting over
+        """
+        self.scheduler = OpenAIRequestScheduler()
         self.client = self._init_client()
+        self.inventory = RemoteInventory(self.client)
+        self.refresh = refresh
+        self.resume = resume
+        self.engine = DeletionEngine(self.client, self.inventory, concurrency=concurrency,
+                                     journal_dir=self.inventory.cache_file.parent)
+        self.collector = GarbageCollector(self.inventory, self.engine, config_dir=self.inventory.cache_file.parent)
 
     def _init_client(self) -> OpenAI:
         """Initialize OpenAI client."""
@@ -50,44 +88,26 @@ class OpenAIStorageManager:
                     "OPENAI_API_KEY not found. Please run 'npm run setup:openai' first."
                 )
 
-        return OpenAI(api_key=api_key)
-
-    def list_all_files(self) -> List[Dict]:
-        """List all files in OpenAI storage."""
-        files = self.client.files.list()
-        return [
-            {
-                'id': f.id,
-                'filename': f.filename,
-                'purpose': f.purpose,
-                'bytes': f.bytes,
-                'created_at': f.created_at
-            }
-            for f in files.data
-        ]
-
-    def list_all_vector_stores(self) -> List[Dict]:
-        """List all vector stores in OpenAI."""
-        stores = self.client.vector_stores.list()
-        return [
-            {
-                'id': s.id,
-                'name': s.name,
-                'file_counts': {
-                    'total': s.file_counts.total,
-                    'completed': s.file_counts.completed,
-                    'in_progress': s.file_counts.in_progress,
-                    'failed': s.file_counts.failed
-                },
-                'created_at': s.created_at
-            }
-            for s in stores.data
-        ]
+        return self.scheduler.client(api_key=api_key)
+
+    def list_all_files(self, max_age: Optional[float] = None) -> List[Dict]:
+        """
+        List all files in OpenAI storage (every page, served from the inventory cache).
+
+        Args:
+            max_age: Refresh the cached listing if older than this many seconds (default: its TTL)
+        """
+        return self.inventory.files(max_age=max_age, full=self.refresh)
+
+    def list_all_vector_stores(self, max_age: Optional[float] = None) -> List[Dict]:
+        """List all vector stores in OpenAI (same arguments as list_all_files)."""
+        return self.inventory.vector_stores(max_age=max_age, full=self.refresh)
 
     def delete_file(self, file_id: str) -> bool:
         """Delete a single file."""
         try:
             self.client.files.delete(file_id)
+            self.inventory.forget(FILES, [file_id])
             return True
         except Exception as e:
             logger.warning(f"Could not delete file {file_id}: {e}")
@@ -104,25 +124,17 @@ class OpenAIStorageManager:
         Returns:
             Dictionary with deletion results
         """
-        deleted_files = []
-
-        # Delete files first if requested
-        if delete_files:
-            try:
-                vs_files = self.client.vector_stores.files.list(vector_store_id=store_id)
-                for vs_file in vs_files.data:
-                    if self.delete_file(vs_file.id):
-                        deleted_files.append(vs_file.id)
-            except Exception as e:
-                logger.warning(f"Could not list files for store {store_id}: {e}")
-
-        # Delete the vector store
-        try:
-            self.client.vector_stores.delete(store_id)
-            return {'success': True, 'files_deleted': deleted_files}
-        except Exception as e:
-            logger.error(f"Could not delete vector store {store_id}: {e}")
-            return {'success': False, 'error': str(e), 'files_deleted': deleted_files}
+        def plan():
+            file_ids = self.engine.list_store_files([store_id])[store_id] if delete_files else []
+            return [(FILES, file_id) for file_id in file_ids] + [(VECTOR_STORES, store_id)]
+
+        result = self.engine.run(f"delete-store-{store_id}", plan, resume=self.resume)
+        files_deleted = result['deleted_ids'][FILES]
+        if result['failed_ids'][VECTOR_STORES]:
+            logger.error(f"Could not delete vector store {store_id}")
+            return {'success': False, 'error': f'Could not delete vector store {store_id}',
+                    'files_deleted': files_deleted}
+        return {'success': True, 'files_deleted': files_deleted}
 
     def delete_all_files(self, dry_run: bool = False, filter_purpose: Optional[str] = None) -> Dict:
         """
@@ -135,36 +147,34 @@ class OpenAIStorageManager:
         Returns:
             Dictionary with deletion results
         """
-        files = self.list_all_files()
-
-        if filter_purpose:
-            files = [f for f in files if f['purpose'] == filter_purpose]
+        job = f"delete-files-{filter_purpose}" if filter_purpose else "delete-files"
 
-        logger.info(f"Found {len(files)} files to delete")
+        def list_files() -> List[Dict]:
+            files = self.list_all_files(max_age=0)
+            if filter_purpose:
+                files = [f for f in files if f['purpose'] == filter_purpose]
+            logger.info(f"Found {len(files)} files to delete")
+            return files
 
         if dry_run:
+            files = list_files()
             logger.info("DRY RUN - No files will be deleted")
             for f in files:
                 logger.info(f"  Would delete: {f['id']} ({f['filename']}) - {f['purpose']}")
+            if self.engine.interrupted(job):
+                logger.info("  (an interrupted run of this cleanup would be resumed first)")
             return {'dry_run': True, 'files_found': len(files), 'files': files}
 
-        deleted = []
-        failed = []
-
-        for f in files:
-            logger.info(f"Deleting: {f['id']} ({f['filename']})...")
-            if self.delete_file(f['id']):
-                deleted.append(f['id'])
-            else:
-                failed.append(f['id'])
-
-        logger.info(f"Deleted {len(deleted)} files, {len(failed)} failed")
+        result = self.engine.run(job, lambda: [(FILES, f['id']) for f in list_files()], resume=self.resume)
+        logger.info(f"Deleted {result['deleted']} files, {result['failed']} failed in {result['seconds']}s")
 
         return {
-            'deleted': len(deleted),
-            'failed': len(failed),
-            'deleted_ids': deleted,
-            'failed_ids': failed
+            'deleted': result['deleted'],
+            'failed': result['failed'],
+            'deleted_ids': result['deleted_ids'][FILES],
+            'failed_ids': result['failed_ids'][FILES],
+            'resumed': result['resumed'],
+            'seconds': result['seconds']
         }
 
     def delete_all_vector_stores(self, dry_run: bool = False,
@@ -181,41 +191,49 @@ class OpenAIStorageManager:
         Returns:
             Dictionary with deletion results
         """
-        stores = self.list_all_vector_stores()
-
-        if filter_name:
-            stores = [s for s in stores if s['name'] == filter_name]
+        job = "delete-stores" + (f"-{filter_name}" if filter_name else "") + ("" if delete_files else "-keep-files")
 
-        logger.info(f"Found {len(stores)} vector stores to delete")
+        def list_stores() -> List[Dict]:
+            stores = self.list_all_vector_stores(max_age=0)
+            if filter_name:
+                stores = [s for s in stores if s['name'] == filter_name]
+            logger.info(f"Found {len(stores)} vector stores to delete")
+            return stores
 
         if dry_run:
+            stores = list_stores()
             logger.info("DRY RUN - No stores will be deleted")
             for s in stores:
                 logger.info(f"  Would delete: {s['id']} ({s['name']}) - {s['file_counts']['total']} files")
+            if self.engine.interrupted(job):
+                logger.info("  (an interrupted run of this cleanup would be resumed first)")
             return {'dry_run': True, 'stores_found': len(stores), 'stores': stores}
 
-        deleted = []
-        failed = []
-        total_files_deleted = 0
+        def plan():
+            store_ids = [s['id'] for s in list_stores()]
+            file_ids = []
+            if delete_files:
+                # A file attached to several stores is deleted once
+                for attached in self.engine.list_store_files(store_ids).values():
+                    file_ids.extend(attached)
+                file_ids = list(dict.fromkeys(file_ids))
+            return [(FILES, file_id) for file_id in file_ids] + [(VECTOR_STORES, store_id) for store_id in store_ids]
 
-        for s in stores:
-            logger.info(f"Deleting: {s['id']} ({s['name']})...")
-            result = self.delete_vector_store(s['id'], delete_files=delete_files)
-            if result['success']:
-                deleted.append(s['id'])
-                total_files_deleted += len(result.get('files_deleted', []))
-            else:
-                failed.append(s['id'])
+        result = self.engine.run(job, plan, resume=self.resume)
+        deleted = result['deleted_ids'][VECTOR_STORES]
+        failed = result['failed_ids'][VECTOR_STORES]
 
         logger.info(f"Deleted {len(deleted)} stores, {len(failed)} failed")
-        logger.info(f"Total files deleted: {total_files_deleted}")
+        logger.info(f"Total files deleted: {result['files_deleted']}")
 
         return {
-            'stores_deleted': len(deleted),
+            'stores_deleted': result['stores_deleted'],
             'stores_failed': len(failed),
-            'files_deleted': total_files_deleted,
+            'files_deleted': result['files_deleted'],
             'deleted_ids': deleted,
-            'failed_ids': failed
+            'failed_ids': failed,
+            'resumed': result['resumed'],
+            'seconds': result['seconds']
         }
 
     def cleanup_all(self, dry_run: bool = False) -> Dict:
@@ -279,22 +297,16 @@ class OpenAIStorageManager:
         Returns:
             Dictionary with deletion results
         """
-        files = self.list_all_files()
+        files = self.list_all_files(max_age=0)
         matching = [f for f in files if f['filename'] == filename]
 
         if not matching:
             logger.warning(f"No file found with name: {filename}")
             return {'success': False, 'error': f'File not found: {filename}'}
 
-        deleted = []
-        failed = []
-
         for f in matching:
             logger.info(f"Deleting: {f['id']} ({f['filename']})...")
-            if self.delete_file(f['id']):
-                deleted.append(f['id'])
-            else:
-                failed.append(f['id'])
+        deleted, failed = self.engine.delete(FILES, [f['id'] for f in matching])
 
         return {
             'success': len(deleted) > 0,
@@ -303,6 +315,46 @@ class OpenAIStorageManager:
             'deleted_ids': deleted
         }
 
+    def collect_garbage(self, dry_run: bool = False, purpose: str = GC_PURPOSE,
+                        grace_hours: float = DEFAULT_GRACE_HOURS, plan: Optional[Dict] = None) -> Dict:
+        """
+        Delete the files no vector store, database row or upload manifest references.
+
+        Args:
+            dry_run: If True, only report the plan
+            purpose: Only collect files with this purpose
+            grace_hours: Keep files younger than this (uploads of runs still in progress)
+            plan: A plan from an earlier dry run to sweep (default: mark afresh)
+
+        Returns:
+            Dictionary with the plan, and the sweep results unless dry_run
+        """
+        if plan is None:
+            plan = self.collector.plan(purpose=purpose, grace_hours=grace_hours)
+            logger.info(f"Marked {plan['marked']} referenced files "
+                        f"({', '.join(f'{n} via {source}' for source, n in plan['marked_by_source'].items())})")
+            logger.info(f"Found {len(plan['orphans'])} orphaned '{plan['purpose']}' files "
+                        f"({round(plan['orphan_bytes'] / (1024 * 1024), 2)} MB); kept {plan['skipped_recent']} "
+                        f"younger than {plan['grace_hours']:g}h and {plan['skipped_other_purpose']} of other purposes")
+            for f in plan['orphans']:
+                logger.info(f"  Orphaned: {f['id']} ({f['filename']}) - {f.get('bytes', 0) or 0} bytes")
+
+        if dry_run:
+            logger.info("DRY RUN - No files will be deleted")
+            return {'dry_run': True, **plan}
+
+        result = self.collector.sweep(plan)
+        logger.info(f"Deleted {result['deleted']} orphaned files, {result['failed']} failed in {result['seconds']}s")
+        return {
+            **plan,
+            'dry_run': False,
+            'deleted': result['deleted'],
+            'failed': result['failed'],
+            'deleted_ids': result['deleted_ids'][FILES],
+            'failed_ids': result['failed_ids'][FILES],
+            'seconds': result['seconds']
+        }
+
     def delete_local_scraped_data(self) -> Dict:
         """
         Delete local scraped data files.
@@ -416,7 +468,8 @@ def main():
         'delete-stores',
         'delete-all',
         'cleanup-everything',
-        'delete-local-data'
+        'delete-local-data',
+        'gc'
     ], help='Action to perform')
     parser.add_argument('--dry-run', action='store_true',
                         help='Show what would be deleted without actually deleting')
@@ -432,11 +485,19 @@ def main():
                         help='Output results as JSON')
     parser.add_argument('--force', action='store_true',
                         help='Skip confirmation prompts')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Re-list all files and stores instead of using the cached inventory')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_DELETE_CONCURRENCY,
+                        help=f'Deletions in flight at once (default: {DEFAULT_DELETE_CONCURRENCY})')
+    parser.add_argument('--restart', action='store_true',
+                        help='Start an interrupted cleanup over (re-list) instead of resuming it')
+    parser.add_argument('--grace-hours', type=float, default=DEFAULT_GRACE_HOURS,
+                        help=f'gc: keep orphaned files younger than this (default: {DEFAULT_GRACE_HOURS:g})')
 
     args = parser.parse_args()
 
     try:
-        manager = OpenAIStorageManager()
+        manager = OpenAIStorageManager(refresh=args.refresh, concurrency=args.concurrency, resume=not args.restart)
 
         if args.action == 'summary':
             result = manager.get_storage_summary()
@@ -454,6 +515,9 @@ def main():
                 print(f"\nTotal Vector Stores: {result['total_vector_stores']}")
                 for store in result['vector_stores']:
                     print(f"  - {store['name']} ({store['id']}): {store['file_counts']['total']} files")
+                age = manager.inventory.age()
+                if age is not None and age >= 1:
+                    print(f"\n(cached listing, refreshed {age:.0f}s ago; use --refresh to re-list everything)")
 
         elif args.action == 'delete-files':
             result = manager.delete_all_files(
@@ -545,6 +609,34 @@ def main():
                 for item in result.get('deleted_items', []):
                     print(f"   Deleted: {item}")
 
+        elif args.action == 'gc':
+            # Always show the plan before sweeping
+            plan = manager.collect_garbage(dry_run=True, purpose=args.filter_purpose or GC_PURPOSE,
+                                           grace_hours=args.grace_hours)
+            orphans = len(plan['orphans'])
+            if args.dry_run or not orphans:
+                if args.json:
+                    print(json.dumps(plan, indent=2))
+                else:
+                    print(f"\n🧹 {orphans} orphaned files ({round(plan['orphan_bytes'] / (1024 * 1024), 2)} MB) "
+                          f"of {plan['files_total']}; {plan['marked']} referenced")
+            else:
+                if not args.force:
+                    print(f"\n⚠️  WARNING: This will delete {orphans} orphaned files from OpenAI!")
+                    confirm = input("Type 'DELETE ORPHANS' to confirm: ")
+                    if confirm != 'DELETE ORPHANS':
+                        print("Aborted.")
+                        sys.exit(0)
+                result = manager.collect_garbage(plan=plan)
+                if args.json:
+                    print(json.dumps(result, indent=2))
+                else:
+                    print(f"\n✅ Deleted {result['deleted']} orphaned files")
+                    if result['failed'] > 0:
+                        print(f"⚠️  Failed to delete {result['failed']} files")
+
+        manager.scheduler.log_report()
+
     except ValueError as e:
         print(f"\n❌ Error: {e}")
         sys.exit(1)
@@ -0,0 +1,155 @@
+"""
+Sync plan between the local corpus and a vector store.
+
+Diffs the content hashes of the local files against the store's upload
+manifest in one pass and classifies every difference:
+
+- add: content the store does not have, under a new filename
+- replace: changed content under a filename the store has (new version
+  attached, then the old one detached)
+- rename: content the store has, now under a different filename
+- detach: content no longer in the corpus
+- delete: file objects left unreferenced by replace/detach
+
+Planning reads the local files but makes no API calls unless the manifest
+is verified against the store's remote file listing, so a sync costs calls
+proportional to the change, not to the corpus.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from .upload_manifest import MANIFEST_SUFFIX, UploadManifest, content_hash
+except ImportError:
+    # Running as a script: resolve through the repository root on PYTHONPATH
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.upload_manifest import (
+        MANIFEST_SUFFIX, UploadManifest, content_hash
+    )
+
+
+@dataclass
+class SyncPlan:
+    """Actions that bring a vector store in line with the local corpus."""
+    # (file, content_hash)
+    add: List[Tuple[object, str]] = field(default_factory=list)
+    # (file, content_hash, previous content_hash)
+    replace: List[Tuple[object, str, str]] = field(default_factory=list)
+    # (content_hash, old filename, new filename)
+    rename: List[Tuple[str, str, str]] = field(default_factory=list)
+    # (content_hash, manifest entry)
+    detach: List[Tuple[str, Dict]] = field(default_factory=list)
+    # Attached remotely but missing from the manifest, and in the manifest but
+    # not attached remotely (found by verifying against the store)
+    untracked: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    duplicates: int = 0
+    local_files: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.add or self.replace or self.rename or self.detach or self.untracked or self.missing)
+
+    @property
+    def uploads(self) -> List[Tuple[object, str]]:
+        """Files to upload and attach (additions and new versions)."""
+        return self.add + [(file_path, digest) for file_path, digest, _ in self.replace]
+
+    def summary(self) -> Dict:
+        return {
+            'local_files': self.local_files,
+            'unchanged': self.unchanged,
+            'add': len(self.add),
+            'replace': len(self.replace),
+            'rename': len(self.rename),
+            'detach': len(self.detach) + len(self.untracked),
+            'duplicates_skipped': self.duplicates
+        }
+
+    def format(self, manifest: UploadManifest, limit: int = 20) -> str:
+        """Human-readable plan (at most `limit` lines per action)."""
+        lines = [
+            f"Sync plan: {self.local_files} local files, {self.unchanged} unchanged, "
+            f"{len(self.add)} to add, {len(self.replace)} to replace, {len(self.rename)} renamed, "
+            f"{len(self.detach) + len(self.untracked)} to detach"
+        ]
+
+        def section(title, items):
+            if not items:
+                return
+            lines.append(f"  {title}:")
+            lines.extend(f"    {item}" for item in items[:limit])
+            if len(items) > limit:
+                lines.append(f"    ... and {len(items) - limit} more")
+
+        section('add', [file_path.name for file_path, _ in self.add])
+        section('replace', [f"{file_path.name} ({manifest.get(old)['file_id']} -> new upload)"
+                            for file_path, _, old in self.replace])
+        section('rename', [f"{old} -> {new}" for _, old, new in self.rename])
+        section('detach', [f"{entry['filename']} ({entry['file_id']})" for _, entry in self.detach]
+                + [f"(untracked) {file_id}" for file_id in self.untracked])
+        return "\n".join(lines)
+
+
+def plan_sync(files: Iterable, manifest: UploadManifest, remote_file_ids: Optional[Set[str]] = None) -> SyncPlan:
+    """
+    Diff the local corpus against the vector store recorded in the manifest.
+
+    Args:
+        files: Paths or StoredDocuments of the whole corpus
+        manifest: Upload manifest bound to the vector store
+        remote_file_ids: File ids actually attached to the store; when given,
+            manifest entries missing remotely are re-added and remote files
+            missing from the manifest are detached
+
+    Returns:
+        SyncPlan
+    """
+    plan = SyncPlan()
+    entries = dict(manifest.entries)
+    if remote_file_ids is not None:
+        plan.missing = [digest for digest, entry in entries.items() if entry['file_id'] not in remote_file_ids]
+        entries = {digest: entry for digest, entry in entries.items() if entry['file_id'] in remote_file_ids}
+        tracked = {entry['file_id'] for entry in entries.values()}
+        plan.untracked = sorted(remote_file_ids - tracked)
+    by_filename = {entry['filename']: digest for digest, entry in entries.items()}
+
+    local: Dict[str, object] = {}
+    for file_path in files:
+        plan.local_files += 1
+        digest = content_hash(file_path.read_bytes())
+        if digest in local:
+            plan.duplicates += 1
+            continue
+        local[digest] = file_path
+
+    replaced = set()
+    for digest, file_path in local.items():
+        entry = entries.get(digest)
+        if entry is not None:
+            if entry['filename'] != file_path.name:
+                plan.rename.append((digest, entry['filename'], file_path.name))
+            else:
+                plan.unchanged += 1
+            continue
+        previous = by_filename.get(file_path.name)
+        if previous is not None and previous not in local:
+            plan.replace.append((file_path, digest, previous))
+            replaced.add(previous)
+        else:
+            plan.add.append((file_path, digest))
+
+    plan.detach = [(digest, entry) for digest, entry in entries.items()
+                   if digest not in local and digest not in replaced]
+    return plan
+
+
+def referenced_file_ids(config_dir: Path, exclude: Optional[Path] = None) -> Set[str]:
+    """File ids recorded in the other vector stores' upload manifests (not safe to delete); all if no exclude."""
+    file_ids = set()
+    for path in Path(config_dir).glob(f"*{MANIFEST_SUFFIX}"):
+        if path != exclude:
+            file_ids.update(entry['file_id'] for entry in UploadManifest(path).entries.values())
+    return file_ids
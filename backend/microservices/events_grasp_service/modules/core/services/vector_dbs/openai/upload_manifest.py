@@ -0,0 +1,201 @@
+"""
+Content-hash manifest of the files attached to a vector store.
+
+Maps the sha256 of each uploaded file's bytes to its OpenAI file id and
+vector store file id, so syncs decide what to upload by content instead of
+by filename: an unchanged file is never uploaded again whatever it is now
+called, and a changed file keeping its name is uploaded while its previous
+version is detached. The manifest is a JSON file next to the vector store
+config.
+
+The hash leaves out the "Scraped: <timestamp>" header line that every
+scrape rewrites, so re-scraping a page whose content did not change keeps
+its key. Manifests keyed by the earlier raw-bytes hash (hash_version 1) are
+re-keyed from the corpus by upgrade() instead of being re-uploaded.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_SUFFIX = ".uploads.json"
+HASH_VERSION = 2
+
+# render_document's scrape timestamp: the header line just before the ==== separator
+_SCRAPED_LINE = re.compile(rb'^Scraped: [^\n]*\n(?==={79}\n)', re.MULTILINE)
+
+
+def content_hash(content: bytes) -> str:
+    """Return the manifest key of a file: sha256 hex digest of its bytes without scrape timestamps."""
+    return hashlib.sha256(_SCRAPED_LINE.sub(b'', content)).hexdigest()
+
+
+class UploadManifest:
+    """sha256 -> uploaded file record for one vector store. Thread-safe."""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Manifest JSON file (loaded if it exists)
+        """
+        self.path = Path(path)
+        self.vector_store_id: Optional[str] = None
+        self.hash_version = HASH_VERSION
+        # Files attached to vector_store_id
+        self.entries: Dict[str, Dict] = {}
+        # Files uploaded for a previous store: reusable by file id, but not attached
+        self.reusable: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self.vector_store_id = data.get('vector_store_id')
+            self.entries = data.get('files', {})
+            self.hash_version = data.get('hash_version', 1)
+
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self.entries
+
+    def hashes(self) -> List[str]:
+        with self._lock:
+            return list(self.entries)
+
+    def get(self, digest: str) -> Optional[Dict]:
+        return self.entries.get(digest)
+
+    def reusable_file_id(self, digest: str) -> Optional[str]:
+        """Return the id of an uploaded file with this content, attached or not."""
+        with self._lock:
+            entry = self.entries.get(digest) or self.reusable.get(digest)
+            return entry['file_id'] if entry else None
+
+    def by_filename(self, filename: str) -> List[Tuple[str, Dict]]:
+        """Return the (hash, entry) pairs attached under a filename."""
+        with self._lock:
+            return [(digest, entry) for digest, entry in self.entries.items() if entry['filename'] == filename]
+
+    def bind(self, vector_store_id: str, valid_file_ids: Optional[Iterable[str]] = None):
+        """
+        Point the manifest at a vector store.
+
+        Entries recorded for a different store become reusable uploads
+        (their files are not attached to the new one).
+
+        Args:
+            vector_store_id: Vector store the entries are attached to
+            valid_file_ids: File ids still in OpenAI storage; other entries are dropped
+        """
+        with self._lock:
+            if self.vector_store_id == vector_store_id:
+                return
+            pool = {**self.reusable, **self.entries}
+            if valid_file_ids is not None:
+                valid = set(valid_file_ids)
+                pool = {digest: entry for digest, entry in pool.items() if entry['file_id'] in valid}
+            if self.vector_store_id is not None:
+                logger.info(f"Upload manifest was for {self.vector_store_id}; "
+                            f"{len(pool)} uploaded files can be reused for {vector_store_id}")
+            self.vector_store_id = vector_store_id
+            self.entries = {}
+            self.reusable = pool
+
+    def record(self, digest: str, file_info: Dict):
+        """Record a file attached to the vector store (a file record from the manager)."""
+        with self._lock:
+            self.entries[digest] = {
+                'file_id': file_info['file_id'],
+                'vs_file_id': file_info.get('vs_file_id', file_info['file_id']),
+                'filename': file_info['filename'],
+                'uploaded_at': file_info.get('uploaded_at')
+            }
+            self.reusable.pop(digest, None)
+
+    def offer(self, digest: str, file_info: Dict):
+        """Record an uploaded file that is not attached to the vector store yet (reusable by file id)."""
+        with self._lock:
+            if digest not in self.entries:
+                self.reusable[digest] = {
+                    'file_id': file_info['file_id'],
+                    'filename': file_info['filename'],
+                    'uploaded_at': file_info.get('uploaded_at')
+                }
+
+    def rename(self, digest: str, filename: str):
+        """Update the filename of an attached file whose content moved to a new name."""
+        with self._lock:
+            entry = self.entries.get(digest)
+            if entry is not None and entry['filename'] != filename:
+                logger.info(f"Unchanged content renamed: {entry['filename']} -> {filename}")
+                entry['filename'] = filename
+
+    def remove(self, digest: str) -> Optional[Dict]:
+        with self._lock:
+            return self.entries.pop(digest, None)
+
+    def upgrade(self, files: Iterable) -> Dict[str, str]:
+        """
+        Re-key a manifest written with an earlier content hash.
+
+        Entries whose file still has the bytes it was uploaded with move to
+        the current key; the others keep their old key and are replaced by
+        the next sync like any changed file.
+
+        Args:
+            files: Paths or StoredDocuments of the corpus
+
+        Returns:
+            Old key -> new key of the entries moved
+        """
+        if self.hash_version >= HASH_VERSION:
+            return {}
+        moved = {}
+        with self._lock:
+            for file_path in files:
+                try:
+                    content = file_path.read_bytes()
+                except OSError:
+                    continue
+                old, new = hashlib.sha256(content).hexdigest(), content_hash(content)
+                if old == new:
+                    continue
+                for pool in (self.entries, self.reusable):
+                    if old in pool and new not in pool:
+                        pool[new] = pool.pop(old)
+                        moved[old] = new
+            self.hash_version = HASH_VERSION
+        logger.info(f"Upload manifest re-keyed to hash version {HASH_VERSION} ({len(moved)} entries moved)")
+        return moved
+
+    def save(self):
+        """Write the manifest atomically."""
+        with self._lock:
+            data = {'vector_store_id': self.vector_store_id, 'hash_version': self.hash_version, 'files': self.entries}
+            tmp = self.path.with_name(self.path.name + '.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.path)
+        logger.info(f"Upload manifest saved to {self.path} ({len(self.entries)} files)")
+
+    def delete(self):
+        with self._lock:
+            self.entries = {}
+            self.reusable = {}
+            self.vector_store_id = None
+            self.hash_version = HASH_VERSION
+        if self.path.exists():
+            self.path.unlink()
@@ -9,12 +9,51 @@ Reads scraped content and creates embeddings using OpenAI's API.
 import os
 import sys
 import json
+import time
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
-
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from openai import NotFoundError, OpenAI
+
+try:
+    from .build_checkpoint import BuildCheckpoint
+    from .inventory import FILES, VECTOR_STORES, RemoteInventory
+    from .page_packer import BUNDLE_MAP_SUFFIX, PACK_TARGET_PAGES, BundleMap, PageBundle, pack_pages
+    from .request_scheduler import DEFAULT_MAX_RATE, OpenAIRequestScheduler
+    from .sync_planner import SyncPlan, plan_sync, referenced_file_ids
+    from .upload_manifest import HASH_VERSION, MANIFEST_SUFFIX, UploadManifest, content_hash
+    from ...web_scraping.content_store import CONTENT_STORE_DIR, ContentStore, StoredDocument, iter_documents
+    from ...web_scraping.manifest import MANIFEST_FILE, PageManifest
+except ImportError:
+    # Running as a script: resolve through the repository root on PYTHONPATH
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.build_checkpoint import (
+        BuildCheckpoint
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.inventory import (
+        FILES, VECTOR_STORES, RemoteInventory
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.page_packer import (
+        BUNDLE_MAP_SUFFIX, PACK_TARGET_PAGES, BundleMap, PageBundle, pack_pages
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.request_scheduler import (
+        DEFAULT_MAX_RATE, OpenAIRequestScheduler
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.sync_planner import (
+        SyncPlan, plan_sync, referenced_file_ids
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.upload_manifest import (
+        HASH_VERSION, MANIFEST_SUFFIX, UploadManifest, content_hash
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.content_store import (
+        CONTENT_STORE_DIR, ContentStore, StoredDocument, iter_documents
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.manifest import (
+        MANIFEST_FILE, PageManifest
+    )
 
 # Configure logging
 logging.basicConfig(
@@ -29,22 +68,66 @@ DATASETS_DIR = Path.home() / "runtime_data" / "datasets" / "aws_reinvent_2025" /
 VECTOR_DB_CONFIG_DIR = Path.home() / "runtime_data" / "keys" / "openai" / "vector-dbs"
 CONFIG_FILE = VECTOR_DB_CONFIG_DIR / f"{VECTOR_STORE_NAME}.json"
 
+# Concurrent files.create calls, and file ids per vector store file batch (API limit 500)
+DEFAULT_UPLOAD_CONCURRENCY = 8
+FILE_BATCH_SIZE = 500
+DEFAULT_POLL_INTERVAL = 1.0
+# A file batch whose status cannot be read this many times in a row is given up as failed
+MAX_BATCH_CHECK_FAILURES = 3
+
 
 class OpenAIVectorStoreManager:
     """Manager for OpenAI Vector Stores."""
 
-    def __init__(self, store_name: str = VECTOR_STORE_NAME):
+    def __init__(self, store_name: str = VECTOR_STORE_NAME, from_content_store: bool = False,
+                 content_store_path: Path = CONTENT_STORE_DIR, follow: bool = False,
+                 upload_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL, max_request_rate: float = DEFAULT_MAX_RATE,
+                 checkpoint: bool = True, db_vector_store_id: Optional[int] = None,
+                 event_id: Optional[int] = None,
+                 pack: bool = False, pack_pages_per_bundle: int = PACK_TARGET_PAGES):
         """
         Initialize the vector store manager.
 
         Args:
             store_name: Name for the vector store
+            from_content_store: Read page text from the content store (scrapes run with --content-store)
+            content_store_path: Content store directory
+            follow: Tail the scrape's page manifest and upload pages while the scrape is still running
+            upload_concurrency: Files uploaded in parallel
+            poll_interval: Seconds between status checks of in-progress file batches
+            max_request_rate: OpenAI API requests per second never exceeded (all threads combined)
+            checkpoint: Record every file the store gets or loses in vector_store_files
+                (written in bulk) and resume an interrupted build
+            db_vector_store_id: event_vector_stores row to record the store under
+                (default: the row named after the store, created if missing)
+            event_id: Event the store's event_vector_stores row is linked to (its files
+                are then listed with the event's scraped files)
+            pack: Upload small pages packed into bundle files (see page_packer)
+            pack_pages_per_bundle: Average pages per bundle when packing
         """
+        if pack and follow:
+            raise ValueError("Packing needs the whole corpus; it cannot be combined with follow mode")
         self.store_name = store_name
+        self.scheduler = OpenAIRequestScheduler(max_rate=max_request_rate)
         self.client = self._init_client()
         self.config_dir = VECTOR_DB_CONFIG_DIR
         self.config_file = self.config_dir / f"{store_name}.json"
         self.datasets_dir = DATASETS_DIR
+        self.from_content_store = from_content_store
+        self.content_store_path = Path(content_store_path)
+        self._content_store: Optional[ContentStore] = None
+        self.follow = follow
+        self.upload_concurrency = max(1, upload_concurrency)
+        self.poll_interval = poll_interval
+        self._inventory: Optional[RemoteInventory] = None
+        self.checkpoint = checkpoint
+        self.db_vector_store_id = db_vector_store_id
+        self.event_id = event_id
+        self.pack = pack
+        self.pack_pages_per_bundle = pack_pages_per_bundle
+        # Bundles of the last packed corpus
+        self._bundles: Optional[List[PageBundle]] = None
 
         # Ensure config directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -64,7 +147,8 @@ class OpenAIVectorStoreManager:
                     "OPENAI_API_KEY not found. Please run 'npm run setup:openai' first."
                 )
 
-        return OpenAI(api_key=api_key)
+        # Pacing and retries are done by the shared scheduler, not per call by the SDK
+        return self.scheduler.client(api_key=api_key)
 
     def load_config(self) -> Optional[Dict]:
         """Load existing vector store configuration."""
@@ -79,33 +163,201 @@ class OpenAIVectorStoreManager:
             json.dump(config, f, indent=2)
         logger.info(f"Configuration saved to {self.config_file}")
 
-    def get_existing_files_from_openai(self) -> Dict[str, str]:
+    @property
+    def inventory(self) -> RemoteInventory:
+        """Cached listing of the account's files and vector stores (kept next to the config)."""
+        if self._inventory is None:
+            self._inventory = RemoteInventory(self.client, cache_dir=self.config_dir)
+        return self._inventory
+
+    @property
+    def manifest_file(self) -> Path:
+        """Upload manifest stored next to the config file."""
+        return self.config_file.with_name(self.config_file.stem + MANIFEST_SUFFIX)
+
+    @property
+    def bundle_map_file(self) -> Path:
+        """Bundle map (bundle -> pages) stored next to the config file."""
+        return self.config_file.with_name(self.config_file.stem + BUNDLE_MAP_SUFFIX)
+
+    def pack_content_files(self, files: Iterable) -> List:
+        """
+        Pack small content files into bundles.
+
+        Returns:
+            Bundles followed by the pages uploaded on their own
+        """
+        files = list(files)
+        bundles, alone = pack_pages(files, target_pages=self.pack_pages_per_bundle)
+        self._bundles = bundles
+        packed = sum(len(bundle.pages) for bundle in bundles)
+        logger.info(f"Packed {packed} pages into {len(bundles)} bundles; {len(alone)} large pages uploaded alone")
+        return bundles + alone
+
+    def save_bundle_map(self, manifest: UploadManifest):
+        """Record the packed bundles' pages and file ids (no-op unless the corpus was packed)."""
+        if self._bundles is None:
+            return
+        bundle_map = BundleMap(self.bundle_map_file)
+        bundle_map.update(self._bundles, manifest)
+        bundle_map.save()
+
+    def load_upload_manifest(self, config: Optional[Dict] = None, files: Optional[Iterable] = None) -> UploadManifest:
+        """
+        Load the store's upload manifest.
+
+        A store created before content hashing has no manifest; it is seeded
+        by hashing the local files its config lists as attached (assuming
+        they have not changed since they were uploaded).
+
+        A manifest keyed by an earlier content hash is re-keyed from the
+        files, together with the config's hashes and the store's file rows,
+        and saved right away (a sync with nothing to do saves nothing).
+
+        Args:
+            config: Vector store config to seed a missing manifest from
+            files: Content files to re-key an earlier manifest from
+        """
+        manifest = UploadManifest(self.manifest_file)
+        if not manifest.exists and config and config.get('files'):
+            manifest.bind(config['vector_store_id'])
+            for file_info in config['files']:
+                if file_info.get('status') != 'completed':
+                    continue
+                digest = file_info.get('content_hash')
+                if digest is None:
+                    file_path = self.datasets_dir / file_info['filename']
+                    if not file_path.exists():
+                        continue
+                    digest = content_hash(file_path.read_bytes())
+                else:
+                    # The config may hold hashes of the earlier kind
+                    manifest.hash_version = 1
+                manifest.record(digest, file_info)
+            logger.info(f"Seeded upload manifest with {len(manifest)} files from {self.config_file}")
+
+        if files is not None and manifest.hash_version < HASH_VERSION:
+            rekeyed = manifest.upgrade(files)
+            manifest.save()
+            if rekeyed and config and config.get('vector_store_id') == manifest.vector_store_id:
+                for file_info in config.get('files', []):
+                    if file_info.get('content_hash') in rekeyed:
+                        file_info['content_hash'] = rekeyed[file_info['content_hash']]
+                self.save_config(config)
+                file_log = self.open_file_log(manifest.vector_store_id)
+                if file_log is not None:
+                    file_log.rekey(rekeyed)
+                    file_log.flush()
+        return manifest
+
+    def bind_upload_manifest(self, manifest: UploadManifest, vector_store_id: str):
+        """Bind the manifest to a vector store, keeping only reusable uploads that still exist."""
+        if manifest.vector_store_id == vector_store_id:
+            return
+        valid_file_ids = None
+        if len(manifest) or manifest.reusable:
+            # Every file id, not one per filename; if storage cannot be listed nothing is dropped
+            try:
+                valid_file_ids = {f['id'] for f in self.inventory.files(full=True)}
+            except Exception as e:
+                logger.warning(f"Could not list files from OpenAI; keeping every reusable upload: {e}")
+        manifest.bind(vector_store_id, valid_file_ids)
+
+    def open_file_log(self, vector_store_id: str, config: Optional[Dict] = None) -> Optional[BuildCheckpoint]:
+        """
+        Open the store's vector_store_files record for an update, sync or ingest.
+
+        Args:
+            vector_store_id: OpenAI vector store
+            config: Vector store config whose attached files are recorded if they have no row yet
+
+        Returns:
+            BuildCheckpoint, or None if recording is off or the database is unavailable
+        """
+        if not self.checkpoint:
+            return None
+        file_log = BuildCheckpoint.open(self.store_name, vector_store_id, self.db_vector_store_id, self.event_id)
+        if file_log is not None and config:
+            file_log.backfill(config.get('files', []))
+        return file_log
+
+    def detach_stale_versions(self, vector_store_id: str, manifest: UploadManifest,
+                              new_files: List[Dict]) -> List[str]:
+        """
+        Detach the previous versions of files that were re-uploaded with changed content.
+
+        Args:
+            vector_store_id: Vector store the files are attached to
+            manifest: Upload manifest (stale entries are removed from it)
+            new_files: File records just attached
+
+        Returns:
+            File ids that were detached
+        """
+        detached = []
+        for file_info in new_files:
+            if file_info['status'] != 'completed':
+                continue
+            for digest, entry in manifest.by_filename(file_info['filename']):
+                if digest == file_info['content_hash']:
+                    continue
+                try:
+                    self.client.vector_stores.files.delete(entry['file_id'], vector_store_id=vector_store_id)
+                except Exception as e:
+                    logger.warning(f"Could not detach previous version of {entry['filename']} ({entry['file_id']}): {e}")
+                    continue
+                manifest.remove(digest)
+                detached.append(entry['file_id'])
+                logger.info(f"Detached previous version of {entry['filename']}: {entry['file_id']}")
+        return detached
+
+    def get_existing_files_from_openai(self, refresh: bool = False) -> Dict[str, str]:
         """
         Get all existing files from OpenAI storage.
 
+        Args:
+            refresh: Re-list every file instead of using the cached inventory
+
         Returns:
             Dictionary mapping filename to file_id
         """
         try:
-            files = self.client.files.list()
             existing = {}
-            for f in files.data:
+            # Oldest first, so the newest upload of a filename wins
+            for f in reversed(self.inventory.files(full=refresh)):
                 # Only consider files with purpose 'assistants' (for vector stores)
-                if f.purpose == 'assistants':
-                    existing[f.filename] = f.id
+                if f['purpose'] == 'assistants':
+                    existing[f['filename']] = f['id']
             logger.info(f"Found {len(existing)} existing files in OpenAI storage")
             return existing
         except Exception as e:
             logger.warning(f"Could not list files from OpenAI: {e}")
             return {}
 
-    def get_content_files(self) -> List[Path]:
-        """Get all content files from the datasets directory."""
+    def get_content_files(self) -> Iterable:
+        """
+        Get all content files from the datasets directory.
+
+        Returns Paths of the .txt files, or StoredDocuments (same name and
+        read_bytes() interface) when reading from the content store. In
+        follow mode, an iterator that yields them as the scraper records pages.
+        """
         if not self.datasets_dir.exists():
             logger.error(f"Datasets directory not found: {self.datasets_dir}")
             logger.error("Please run 'npm run scrape:aws-reinvent' first.")
             return []
 
+        if self.from_content_store and self._content_store is None:
+            self._content_store = ContentStore(self.content_store_path)
+
+        if self.follow:
+            return self.follow_content_files()
+
+        if self.from_content_store:
+            documents = list(iter_documents(self.datasets_dir, self._content_store))
+            logger.info(f"Found {len(documents)} documents in content store {self.content_store_path}")
+            return self.pack_content_files(documents) if self.pack else documents
+
         # Get all .txt files except metadata
         files = [
             f for f in self.datasets_dir.glob("*.txt")
@@ -113,7 +365,320 @@ class OpenAIVectorStoreManager:
         ]
 
         logger.info(f"Found {len(files)} content files")
-        return files
+        return self.pack_content_files(files) if self.pack else files
+
+    def follow_content_files(self) -> Iterator:
+        """
+        Yield content files as the running scrape appends them to its manifest.
+
+        Ends when the scraper closes the manifest (or immediately after the
+        recorded pages, if no scrape is running).
+        """
+        manifest_path = self.datasets_dir / MANIFEST_FILE
+        if PageManifest.writer(manifest_path) is not None:
+            logger.info(f"Following {manifest_path} while the scrape is running...")
+
+        seen = set()
+        for page in PageManifest.follow(manifest_path):
+            document = self.document_for_page(page)
+            if document is None or document.name in seen:
+                continue
+            seen.add(document.name)
+            yield document
+        logger.info(f"Scrape finished; followed {len(seen)} content files")
+
+    def document_for_page(self, page: Dict, store: Optional[ContentStore] = None):
+        """
+        Return the content file of a page manifest record.
+
+        Args:
+            page: Page record
+            store: Content store to read from (default: the manager's own; SQLite
+                connections are per thread, so worker threads pass their own)
+
+        Returns:
+            Path or StoredDocument, or None for pages without saved content
+            (skipped near-duplicates, or text missing from disk/the store)
+        """
+        name = page.get('filename')
+        if not name:
+            return None
+        if self.from_content_store:
+            if store is None:
+                if self._content_store is None:
+                    self._content_store = ContentStore(self.content_store_path)
+                store = self._content_store
+            if not page.get('content_key') or not store.has(page['content_key']):
+                return None
+            return StoredDocument(
+                name=name,
+                url=page['url'],
+                title=page['title'],
+                scraped_at=page['scraped_at'],
+                content_key=page['content_key'],
+                store=store,
+                author=page.get('author'),
+                published=page.get('published')
+            )
+        document = self.datasets_dir / name
+        return document if document.exists() else None
+
+    def _create_file(self, name: str, content: bytes) -> str:
+        file_obj = self.client.files.create(
+            file=(name, content),
+            purpose='assistants'  # Important: must be 'assistants' for vector stores
+        )
+        return file_obj.id
+
+    def upload_files(self, files: Iterable, manifest: UploadManifest,
+                     on_uploaded: Optional[Callable] = None) -> List[Tuple[object, str, str, bool]]:
+        """
+        Upload the content files the vector store does not have yet, concurrently.
+
+        Files are read and hashed on the calling thread (content store reads
+        are not thread-safe), and at most 2 x upload_concurrency files are
+        held in memory at a time. Content already attached to the manifest's
+        store is skipped, content uploaded before is reused by file id, and
+        only new or changed content is uploaded.
+
+        Args:
+            files: Paths or StoredDocuments
+            manifest: Upload manifest bound to the target vector store
+            on_uploaded: Called as on_uploaded(file, content_hash, file_id, size) on the
+                upload thread as soon as each file object is created
+
+        Returns:
+            List of (file, content_hash, file_id, reused) for the files to attach
+        """
+        uploaded = []
+        pending = []
+        seen: Dict[str, str] = {}
+        unchanged = 0
+        in_flight = threading.BoundedSemaphore(self.upload_concurrency * 2)
+        started = time.monotonic()
+
+        def upload(file_path, digest: str, content: bytes) -> str:
+            file_id = self._create_file(file_path.name, content)
+            if on_uploaded is not None:
+                on_uploaded(file_path, digest, file_id, len(content))
+            return file_id
+
+        with ThreadPoolExecutor(max_workers=self.upload_concurrency, thread_name_prefix='upload') as pool:
+            for file_path in files:
+                in_flight.acquire()
+                try:
+                    content = file_path.read_bytes()
+                except OSError as e:
+                    in_flight.release()
+                    logger.error(f"Failed to read {file_path.name}: {e}")
+                    continue
+                digest = content_hash(content)
+                if digest in seen or digest in manifest:
+                    in_flight.release()
+                    if digest in seen:
+                        logger.info(f"Skipping {file_path.name}: same content as {seen[digest]}")
+                    else:
+                        manifest.rename(digest, file_path.name)
+                        unchanged += 1
+                    continue
+                seen[digest] = file_path.name
+
+                file_id = manifest.reusable_file_id(digest)
+                if file_id is not None:
+                    in_flight.release()
+                    logger.info(f"♻️  Reusing existing file: {file_path.name} ({file_id})")
+                    uploaded.append((file_path, digest, file_id, True))
+                    continue
+                logger.info(f"📤 Uploading new file: {file_path.name}")
+                future = pool.submit(upload, file_path, digest, content)
+                future.add_done_callback(lambda _: in_flight.release())
+                pending.append((file_path, digest, future))
+
+            for file_path, digest, future in pending:
+                try:
+                    file_id = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to upload {file_path.name}: {e}")
+                    continue
+                logger.info(f"Uploaded file: {file_id}")
+                uploaded.append((file_path, digest, file_id, False))
+
+        if unchanged:
+            logger.info(f"{unchanged} files unchanged since the last sync")
+        if pending:
+            new_uploads = sum(1 for *_, reused in uploaded if not reused)
+            logger.info(f"Uploaded {new_uploads}/{len(pending)} files in {time.monotonic() - started:.1f}s "
+                        f"({self.upload_concurrency} in parallel)")
+        return uploaded
+
+    def attach_files(self, vector_store_id: str, uploaded: List[Tuple[object, str, str, bool]],
+                     on_attached: Optional[Callable] = None) -> List[Dict]:
+        """
+        Attach uploaded files to a vector store with the file batches API.
+
+        All batches are created up front and watched by a single poller,
+        instead of one create_and_poll per file.
+
+        Args:
+            vector_store_id: Vector store to attach to
+            uploaded: (file, content_hash, file_id, reused) tuples from upload_files
+            on_attached: Called with each batch's file records as soon as the batch finishes
+
+        Returns:
+            File records for the config (status 'failed' for files the batch could not process,
+            and for every file of a batch that could not be created or checked)
+        """
+        if not uploaded:
+            return []
+
+        records = []
+
+        def finished(batch_records: List[Dict]):
+            if on_attached is not None:
+                on_attached(batch_records)
+            records.extend(batch_records)
+
+        batches = {}
+        for start in range(0, len(uploaded), FILE_BATCH_SIZE):
+            chunk = uploaded[start:start + FILE_BATCH_SIZE]
+            try:
+                batch = self.client.vector_stores.file_batches.create(
+                    vector_store_id=vector_store_id,
+                    file_ids=[file_id for _, _, file_id, _ in chunk]
+                )
+            except Exception as e:
+                logger.error(f"Failed to create file batch for {len(chunk)} files: {e}")
+                finished(self._failed_records(chunk))
+                continue
+            logger.info(f"Attaching {len(chunk)} files in batch {batch.id}...")
+            batches[batch.id] = chunk
+
+        # One poller for all batches
+        in_progress = set(batches)
+        check_failures = dict.fromkeys(batches, 0)
+        while in_progress:
+            for batch_id in list(in_progress):
+                try:
+                    batch = self.client.vector_stores.file_batches.retrieve(batch_id, vector_store_id=vector_store_id)
+                except Exception as e:
+                    # Retryable errors were already retried by the request scheduler
+                    check_failures[batch_id] += 1
+                    logger.warning(f"Could not check file batch {batch_id} "
+                                   f"({check_failures[batch_id]}/{MAX_BATCH_CHECK_FAILURES}): {e}")
+                    if check_failures[batch_id] >= MAX_BATCH_CHECK_FAILURES:
+                        logger.error(f"Giving up on file batch {batch_id}; its {len(batches[batch_id])} files "
+                                     f"are recorded as failed")
+                        in_progress.discard(batch_id)
+                        finished(self._failed_records(batches[batch_id], batch_id))
+                    continue
+                check_failures[batch_id] = 0
+                if batch.file_counts.in_progress == 0:
+                    in_progress.discard(batch_id)
+                    finished(self._batch_records(vector_store_id, batch, batches[batch_id]))
+            if in_progress:
+                time.sleep(self.poll_interval)
+        return records
+
+    def _batch_records(self, vector_store_id: str, batch, chunk: List[Tuple[object, str, str, bool]]) -> List[Dict]:
+        """File records of a finished file batch."""
+        counts = batch.file_counts
+        failed = {}
+        if counts.failed or counts.cancelled:
+            for status in ('failed', 'cancelled'):
+                for vs_file in self.client.vector_stores.file_batches.list_files(
+                        batch.id, vector_store_id=vector_store_id, filter=status):
+                    failed[vs_file.id] = (status, getattr(vs_file, 'last_error', None))
+        logger.info(f"✅ Batch {batch.id}: {counts.completed} completed, {counts.failed} failed, "
+                    f"{counts.cancelled} cancelled")
+
+        records = []
+        for file_path, digest, file_id, reused in chunk:
+            status, error = failed.get(file_id, ('completed', None))
+            if status != 'completed':
+                logger.warning(f"⚠️ File status: {status}, error: {error} ({file_path.name})")
+            records.append(self._attach_record(file_path, digest, file_id, reused, status, batch.id))
+        return records
+
+    def _failed_records(self, chunk: List[Tuple[object, str, str, bool]], batch_id: Optional[str] = None) -> List[Dict]:
+        """File records of a chunk whose file batch could not be created or checked."""
+        return [self._attach_record(file_path, digest, file_id, reused, 'failed', batch_id)
+                for file_path, digest, file_id, reused in chunk]
+
+    @staticmethod
+    def _attach_record(file_path, digest: str, file_id: str, reused: bool, status: str,
+                       batch_id: Optional[str]) -> Dict:
+        return {
+            'file_id': file_id,
+            'vs_file_id': file_id,
+            'filename': file_path.name,
+            'filepath': str(file_path),
+            'status': status,
+            'reused': reused,
+            'content_hash': digest,
+            'batch_id': batch_id,
+            'uploaded_at': datetime.now().isoformat()
+        }
+
+    def upload_and_attach(self, vector_store_id: str, file_path, manifest: UploadManifest,
+                          content: Optional[bytes] = None) -> Optional[Dict]:
+        """
+        Upload a content file (or reuse the stored copy) and attach it to a vector store.
+
+        Args:
+            vector_store_id: Vector store to attach to
+            file_path: Path or StoredDocument
+            manifest: Upload manifest bound to the vector store; completed attachments are recorded in it
+            content: The file's bytes, if the caller already read them
+
+        Returns:
+            File record for the config, or None if the upload/attach failed
+        """
+        try:
+            if content is None:
+                content = file_path.read_bytes()
+            digest = content_hash(content)
+
+            # Reuse an earlier upload of the same content
+            file_id = manifest.reusable_file_id(digest)
+            reused = file_id is not None
+            if reused:
+                logger.info(f"♻️  Reusing existing file: {file_path.name} ({file_id})")
+            else:
+                # Upload new file to OpenAI Files API with purpose="assistants"
+                logger.info(f"📤 Uploading new file: {file_path.name}")
+                file_id = self._create_file(file_path.name, content)
+                logger.info(f"Uploaded file: {file_id}")
+
+            # Attach file to vector store and poll until complete
+            logger.info(f"Attaching to vector store and polling...")
+            vs_file = self.client.vector_stores.files.create_and_poll(
+                vector_store_id=vector_store_id,
+                file_id=file_id
+            )
+
+            # Check status
+            if vs_file.status == 'completed':
+                logger.info(f"✅ File attached successfully: {file_path.name}")
+            else:
+                logger.warning(f"⚠️ File status: {vs_file.status}, error: {getattr(vs_file, 'last_error', None)}")
+
+            file_info = {
+                'file_id': file_id,
+                'vs_file_id': vs_file.id if hasattr(vs_file, 'id') else file_id,
+                'filename': file_path.name,
+                'filepath': str(file_path),
+                'status': vs_file.status,
+                'reused': reused,
+                'content_hash': digest,
+                'uploaded_at': datetime.now().isoformat()
+            }
+            if vs_file.status == 'completed':
+                manifest.record(digest, file_info)
+            return file_info
+
+        except Exception as e:
+            logger.error(f"Failed to upload/attach {file_path.name}: {e}")
+            return None
 
     def find_existing_store(self) -> Optional[Dict]:
         """Find existing vector store by name (checks OpenAI API, not just local config)."""
@@ -135,8 +700,15 @@ class OpenAIVectorStoreManager:
         # Also check OpenAI for any stores with the same name (to prevent duplicates)
         try:
             logger.info(f"Checking OpenAI for existing vector stores named '{self.store_name}'...")
-            stores = self.client.vector_stores.list()
-            matches = [s for s in stores.data if getattr(s, 'name', None) == self.store_name]
+            matches = []
+            for cached in self.inventory.vector_stores():
+                if cached['name'] != self.store_name:
+                    continue
+                # The cached listing can include stores deleted elsewhere since it was refreshed
+                try:
+                    matches.append(self.client.vector_stores.retrieve(cached['id']))
+                except NotFoundError:
+                    self.inventory.forget(VECTOR_STORES, [cached['id']])
 
             if not matches:
                 return None
@@ -166,10 +738,10 @@ class OpenAIVectorStoreManager:
                     try:
                         # Attempt to delete files attached to the duplicate store first
                         try:
-                            vs_files = self.client.vector_stores.files.list(vector_store_id=dup_id)
-                            for vs_file in vs_files.data:
+                            for vs_file in self.client.vector_stores.files.list(vector_store_id=dup_id, limit=100):
                                 try:
                                     self.client.files.delete(vs_file.id)
+                                    self.inventory.forget(FILES, [vs_file.id])
                                     logger.info(f"Deleted file {vs_file.id} from duplicate store {dup_id}")
                                 except Exception as e:
                                     logger.warning(f"Could not delete file {vs_file.id}: {e}")
@@ -178,6 +750,7 @@ class OpenAIVectorStoreManager:
 
                         # Delete the duplicate store
                         self.client.vector_stores.delete(dup_id)
+                        self.inventory.forget(VECTOR_STORES, [dup_id])
                         logger.info(f"Deleted duplicate vector store: {dup_id}")
                     except Exception as e:
                         logger.warning(f"Failed to delete duplicate store {dup_id}: {e}")
@@ -200,15 +773,28 @@ class OpenAIVectorStoreManager:
         """
         Create a new vector store and upload files.
 
+        Per-file progress is checkpointed in vector_store_files; if an earlier
+        create died part way, it is resumed instead of refused.
+
         Returns:
             Dictionary with vector store details
         """
         logger.info("=" * 60)
         logger.info(f"Creating Vector Store: {self.store_name}")
         logger.info("=" * 60)
+        self.scheduler.reset_stats()
 
-        # Check if store already exists
-        existing = self.find_existing_store()
+        # An interrupted build is resumed; any other existing store is left alone
+        checkpoint = None
+        if self.checkpoint:
+            checkpoint = BuildCheckpoint.interrupted(self.store_name, self.db_vector_store_id)
+        if checkpoint is not None:
+            try:
+                self.client.vector_stores.retrieve(checkpoint.vector_store_id)
+            except NotFoundError:
+                logger.warning(f"Interrupted build's vector store {checkpoint.vector_store_id} no longer exists")
+                checkpoint = None
+        existing = self.find_existing_store() if checkpoint is None else None
         if existing:
             logger.warning(f"Vector store already exists: {existing['id']}")
             logger.warning("Use 'npm run vectordb:update' to update or 'npm run vectordb:delete' to delete first.")
@@ -226,92 +812,76 @@ class OpenAIVectorStoreManager:
                 'error': 'No content files found'
             }
 
-        # Get existing files from OpenAI to avoid duplicates
-        logger.info("Checking for existing files in OpenAI storage...")
-        existing_files = self.get_existing_files_from_openai()
-
-        # Create vector store
-        logger.info("Creating vector store...")
-        vector_store = self.client.vector_stores.create(
-            name=self.store_name
-        )
-        logger.info(f"Created vector store: {vector_store.id}")
-
-        # Upload files and attach to vector store using create_and_poll
-        uploaded_files = []
-        reused_files = 0
-        new_uploads = 0
-
-        for file_path in files:
-            try:
-                # Check if file already exists in OpenAI storage
-                if file_path.name in existing_files:
-                    file_id = existing_files[file_path.name]
-                    logger.info(f"♻️  Reusing existing file: {file_path.name} ({file_id})")
-                    reused_files += 1
-                else:
-                    # Upload new file to OpenAI Files API with purpose="assistants"
-                    logger.info(f"📤 Uploading new file: {file_path.name}")
-                    with open(file_path, 'rb') as f:
-                        file_obj = self.client.files.create(
-                            file=f,
-                            purpose='assistants'  # Important: must be 'assistants' for vector stores
-                        )
-                    file_id = file_obj.id
-                    logger.info(f"Uploaded file: {file_id}")
-                    new_uploads += 1
-
-                # Attach file to vector store and poll until complete
-                logger.info(f"Attaching to vector store and polling...")
-                vs_file = self.client.vector_stores.files.create_and_poll(
-                    vector_store_id=vector_store.id,
-                    file_id=file_id
-                )
-
-                # Check status
-                if vs_file.status == 'completed':
-                    logger.info(f"✅ File attached successfully: {file_path.name}")
-                else:
-                    logger.warning(f"⚠️ File status: {vs_file.status}, error: {getattr(vs_file, 'last_error', None)}")
-
-                uploaded_files.append({
-                    'file_id': file_id,
-                    'vs_file_id': vs_file.id if hasattr(vs_file, 'id') else file_id,
-                    'filename': file_path.name,
-                    'filepath': str(file_path),
-                    'status': vs_file.status,
-                    'reused': file_path.name in existing_files,
-                    'uploaded_at': datetime.now().isoformat()
-                })
-
-            except Exception as e:
-                logger.error(f"Failed to upload/attach {file_path.name}: {e}")
+        resuming = checkpoint is not None
+        if resuming:
+            vector_store_id = checkpoint.vector_store_id
+            logger.info(f"Resuming interrupted build of vector store {vector_store_id}")
+        else:
+            logger.info("Creating vector store...")
+            vector_store = self.client.vector_stores.create(
+                name=self.store_name
+            )
+            vector_store_id = vector_store.id
+            logger.info(f"Created vector store: {vector_store_id}")
+            if self.checkpoint:
+                checkpoint = BuildCheckpoint.start(self.store_name, vector_store_id, self.db_vector_store_id, self.event_id)
+
+        # Files uploaded for an earlier store are reused by content hash
+        manifest = self.load_upload_manifest()
+        self.bind_upload_manifest(manifest, vector_store_id)
+        resumed_files = []
+        if resuming:
+            attached, to_attach = checkpoint.seed(manifest)
+            resumed_files = checkpoint.completed_records()
+            logger.info(f"Checkpoint: {attached} files already attached, {to_attach} uploaded but not attached")
+
+        # Upload files in parallel, then attach them in file batches; each step is checkpointed per file
+        try:
+            uploaded = self.upload_files(files, manifest,
+                                         on_uploaded=checkpoint.file_uploaded if checkpoint is not None else None)
+            uploaded_files = self.attach_files(vector_store_id, uploaded,
+                                               on_attached=checkpoint.files_attached if checkpoint is not None else None)
+        finally:
+            if checkpoint is not None:
+                checkpoint.flush()
+        for file_info in uploaded_files:
+            if file_info['status'] == 'completed':
+                manifest.record(file_info['content_hash'], file_info)
+        manifest.save()
+        self.save_bundle_map(manifest)
+        reused_files = sum(1 for f in uploaded_files if f['reused'])
+        new_uploads = len(uploaded_files) - reused_files
+        all_files = resumed_files + uploaded_files
 
         # Count successful uploads
-        successful_uploads = [f for f in uploaded_files if f.get('status') == 'completed']
-        logger.info(f"Successfully attached {len(successful_uploads)}/{len(uploaded_files)} files to vector store")
+        successful_uploads = [f for f in all_files if f.get('status') == 'completed']
+        logger.info(f"Successfully attached {len(successful_uploads)}/{len(all_files)} files to vector store")
         logger.info(f"  - New uploads: {new_uploads}")
         logger.info(f"  - Reused existing: {reused_files}")
+        if resuming:
+            logger.info(f"  - Attached before the interruption: {len(resumed_files)}")
 
         # Save configuration
         config = {
             'vector_store_name': self.store_name,
-            'vector_store_id': vector_store.id,
+            'vector_store_id': vector_store_id,
             'created_at': datetime.now().isoformat(),
             'updated_at': datetime.now().isoformat(),
             'datasets_directory': str(self.datasets_dir),
-            'total_files': len(uploaded_files),
+            'total_files': len(all_files),
             'new_uploads': new_uploads,
             'reused_files': reused_files,
-            'files': uploaded_files
+            'files': all_files
         }
 
         self.save_config(config)
+        if checkpoint is not None:
+            checkpoint.finish()
 
         logger.info("=" * 60)
         logger.info("Vector Store Creation Complete!")
-        logger.info(f"Store ID: {vector_store.id}")
-        logger.info(f"Total files: {len(uploaded_files)}")
+        logger.info(f"Store ID: {vector_store_id}")
+        logger.info(f"Total files: {len(all_files)}")
         logger.info(f"  - New uploads: {new_uploads}")
         logger.info(f"  - Reused existing: {reused_files}")
         logger.info(f"Config saved to: {self.config_file}")
@@ -319,12 +889,14 @@ class OpenAIVectorStoreManager:
 
         return {
             'success': True,
-            'vector_store_id': vector_store.id,
+            'vector_store_id': vector_store_id,
             'vector_store_name': self.store_name,
-            'files_uploaded': len(uploaded_files),
+            'files_uploaded': len(all_files),
             'new_uploads': new_uploads,
             'reused_files': reused_files,
-            'config_file': str(self.config_file)
+            'resumed_files': len(resumed_files),
+            'config_file': str(self.config_file),
+            'api': self.api_report()
         }
 
     def update_vector_store(self) -> Dict:
@@ -337,6 +909,7 @@ class OpenAIVectorStoreManager:
         logger.info("=" * 60)
         logger.info(f"Updating Vector Store: {self.store_name}")
         logger.info("=" * 60)
+        self.scheduler.reset_stats()
 
         config = self.load_config()
         if not config or 'vector_store_id' not in config:
@@ -359,9 +932,6 @@ class OpenAIVectorStoreManager:
                 'error': f'Vector store not found: {e}'
             }
 
-        # Get current files in store
-        existing_file_ids = set(f['file_id'] for f in config.get('files', []))
-
         # Get content files
         files = self.get_content_files()
         if not files:
@@ -370,67 +940,38 @@ class OpenAIVectorStoreManager:
                 'error': 'No content files found'
             }
 
-        # Get existing files from OpenAI to avoid duplicates
-        logger.info("Checking for existing files in OpenAI storage...")
-        openai_existing_files = self.get_existing_files_from_openai()
-
-        # Upload new files using create_and_poll
-        new_files = []
-        reused_files = 0
-        new_uploads = 0
+        # Content already in the store is found by hash, not filename
+        # A followed corpus is not re-read to re-key an earlier manifest
+        manifest = self.load_upload_manifest(config, None if self.follow else files)
+        self.bind_upload_manifest(manifest, vector_store_id)
 
-        # Map existing filenames to file_ids from config
-        existing_filenames = {f['filename']: f['file_id'] for f in config.get('files', [])}
+        file_log = self.open_file_log(vector_store_id, config)
 
-        for file_path in files:
-            # Check if file is already in the vector store (from config)
-            if file_path.name not in existing_filenames:
-                try:
-                    # Check if file already exists in OpenAI storage
-                    if file_path.name in openai_existing_files:
-                        file_id = openai_existing_files[file_path.name]
-                        logger.info(f"♻️  Reusing existing file: {file_path.name} ({file_id})")
-                        reused_files += 1
-                    else:
-                        # Upload file with purpose='assistants'
-                        logger.info(f"📤 Uploading new file: {file_path.name}")
-                        with open(file_path, 'rb') as f:
-                            file_obj = self.client.files.create(
-                                file=f,
-                                purpose='assistants'  # Important: must be 'assistants' for vector stores
-                            )
-                        file_id = file_obj.id
-                        logger.info(f"Uploaded file: {file_id}")
-                        new_uploads += 1
-
-                    # Attach to vector store and poll until complete
-                    logger.info(f"Attaching to vector store and polling...")
-                    vs_file = self.client.vector_stores.files.create_and_poll(
-                        vector_store_id=vector_store_id,
-                        file_id=file_id
-                    )
-
-                    # Check status
-                    if vs_file.status == 'completed':
-                        logger.info(f"✅ File attached successfully: {file_path.name}")
-                    else:
-                        logger.warning(f"⚠️ File status: {vs_file.status}, error: {getattr(vs_file, 'last_error', None)}")
-
-                    new_files.append({
-                        'file_id': file_id,
-                        'vs_file_id': vs_file.id if hasattr(vs_file, 'id') else file_id,
-                        'filename': file_path.name,
-                        'filepath': str(file_path),
-                        'status': vs_file.status,
-                        'reused': file_path.name in openai_existing_files,
-                        'uploaded_at': datetime.now().isoformat()
-                    })
-
-                except Exception as e:
-                    logger.error(f"Failed to upload {file_path.name}: {e}")
+        # Upload new and changed files in parallel, then attach them in file batches
+        try:
+            new_files = self.attach_files(
+                vector_store_id,
+                self.upload_files(files, manifest, on_uploaded=file_log.file_uploaded if file_log is not None else None),
+                on_attached=file_log.files_attached if file_log is not None else None
+            )
+        finally:
+            if file_log is not None:
+                file_log.flush()
+        for file_info in new_files:
+            if file_info['status'] == 'completed':
+                manifest.record(file_info['content_hash'], file_info)
+        detached = set(self.detach_stale_versions(vector_store_id, manifest, new_files))
+        manifest.save()
+        self.save_bundle_map(manifest)
+        if file_log is not None:
+            file_log.files_removed(f['content_hash'] for f in config.get('files', [])
+                                   if f['file_id'] in detached and f.get('content_hash'))
+            file_log.flush()
+        reused_files = sum(1 for f in new_files if f['reused'])
+        new_uploads = len(new_files) - reused_files
 
         # Update configuration
-        config['files'].extend(new_files)
+        config['files'] = [f for f in config.get('files', []) if f['file_id'] not in detached] + new_files
         config['updated_at'] = datetime.now().isoformat()
         config['total_files'] = len(config['files'])
 
@@ -444,6 +985,7 @@ class OpenAIVectorStoreManager:
         logger.info(f"New files added: {len(successful_uploads)}/{len(new_files)}")
         logger.info(f"  - New uploads: {new_uploads}")
         logger.info(f"  - Reused existing: {reused_files}")
+        logger.info(f"Previous versions detached: {len(detached)}")
         logger.info(f"Total files: {config['total_files']}")
         logger.info("=" * 60)
 
@@ -453,8 +995,218 @@ class OpenAIVectorStoreManager:
             'new_files_added': len(new_files),
             'new_uploads': new_uploads,
             'reused_files': reused_files,
-            'total_files': config['total_files']
+            'replaced_files': len(detached),
+            'total_files': config['total_files'],
+            'api': self.api_report()
+        }
+
+    def api_report(self) -> Dict:
+        """Log and return the OpenAI request stats since the last reset (one run)."""
+        self.scheduler.log_report()
+        return self.scheduler.report()
+
+    def _run_parallel(self, fn, items: List) -> List:
+        """Apply fn to items on upload_concurrency threads; returns the items it succeeded for."""
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=self.upload_concurrency, thread_name_prefix='sync') as pool:
+            outcomes = list(pool.map(fn, items))
+        return [item for item, ok in zip(items, outcomes) if ok]
+
+    def detach_files(self, vector_store_id: str, file_ids: List[str]) -> List[str]:
+        """Detach files from a vector store concurrently; returns the ids that were detached."""
+        def detach(file_id):
+            try:
+                self.client.vector_stores.files.delete(file_id, vector_store_id=vector_store_id)
+                return True
+            except NotFoundError:
+                return True
+            except Exception as e:
+                logger.warning(f"Could not detach {file_id}: {e}")
+                return False
+
+        return self._run_parallel(detach, file_ids)
+
+    def delete_file_objects(self, file_ids: List[str]) -> List[str]:
+        """Delete files from OpenAI storage concurrently; returns the ids that were deleted."""
+        def delete(file_id):
+            try:
+                self.client.files.delete(file_id)
+                return True
+            except NotFoundError:
+                return True
+            except Exception as e:
+                logger.warning(f"Could not delete file {file_id}: {e}")
+                return False
+
+        deleted = self._run_parallel(delete, file_ids)
+        self.inventory.forget(FILES, deleted)
+        return deleted
+
+    def sync_vector_store(self, dry_run: bool = False, verify: bool = False, delete_files: bool = True) -> Dict:
+        """
+        Bring the vector store in line with the local corpus.
+
+        Plans additions, replacements, renames and detachments in one pass
+        (see sync_planner), then executes them: uploads and file batches for
+        new content, concurrent detaches for removed and replaced content,
+        and deletion of the file objects nothing references any more.
+
+        Args:
+            dry_run: Only compute and report the plan
+            verify: Diff against the store's remote file listing as well as the
+                upload manifest (lists every attached file)
+            delete_files: Delete detached file objects from OpenAI storage
+
+        Returns:
+            Dictionary with the plan summary and sync results
+        """
+        logger.info("=" * 60)
+        logger.info(f"Syncing Vector Store: {self.store_name}{' (dry run)' if dry_run else ''}")
+        logger.info("=" * 60)
+        self.scheduler.reset_stats()
+
+        config = self.load_config()
+        if not config or 'vector_store_id' not in config:
+            logger.error("No existing vector store found. Please create one first.")
+            return {
+                'success': False,
+                'error': 'Vector store not found. Run npm run vectordb:create first.'
+            }
+        vector_store_id = config['vector_store_id']
+
+        try:
+            store = self.client.vector_stores.retrieve(vector_store_id)
+            logger.info(f"Found vector store: {store.id}")
+        except Exception as e:
+            logger.error(f"Vector store not found: {e}")
+            return {
+                'success': False,
+                'error': f'Vector store not found: {e}'
+            }
+
+        # An empty corpus would detach everything: treat it as a missing scrape
+        files = list(self.get_content_files())
+        if not files:
+            return {
+                'success': False,
+                'error': 'No content files found'
+            }
+
+        manifest = self.load_upload_manifest(config, files)
+        self.bind_upload_manifest(manifest, vector_store_id)
+        remote_file_ids = None
+        if verify:
+            remote_file_ids = {
+                vs_file.id for vs_file in self.client.vector_stores.files.list(vector_store_id=vector_store_id, limit=100)
+            }
+            logger.info(f"Vector store has {len(remote_file_ids)} attached files")
+
+        plan: SyncPlan = plan_sync(files, manifest, remote_file_ids)
+        plan_text = plan.format(manifest)
+        for line in plan_text.splitlines():
+            logger.info(line)
+        result = {
+            'success': True,
+            'dry_run': dry_run,
+            'vector_store_id': vector_store_id,
+            'plan': plan_text,
+            **plan.summary()
         }
+        if dry_run or plan.is_empty:
+            if plan.is_empty:
+                logger.info("✅ Vector store is in sync")
+            result['api'] = self.api_report()
+            return result
+
+        started = time.monotonic()
+        file_log = self.open_file_log(vector_store_id, config)
+        # Attached according to the manifest but not in the store: attach them again, by file id
+        # while the file is still in storage (a deleted file also leaves the store)
+        missing = {digest: manifest.remove(digest) for digest in plan.missing}
+        gone = {entry['file_id'] for entry in missing.values()}
+        if missing:
+            try:
+                stored = {f['id'] for f in self.inventory.files(full=True)}
+            except Exception as e:
+                logger.warning(f"Could not list files from OpenAI; re-uploading {len(missing)} missing files: {e}")
+                stored = set()
+            for digest, entry in missing.items():
+                if entry['file_id'] in stored:
+                    manifest.offer(digest, entry)
+        if file_log is not None:
+            file_log.files_removed(plan.missing)
+
+        # New and changed content: parallel uploads, then file batches
+        try:
+            new_files = self.attach_files(
+                vector_store_id,
+                self.upload_files((f for f, _ in plan.uploads), manifest,
+                                  on_uploaded=file_log.file_uploaded if file_log is not None else None),
+                on_attached=file_log.files_attached if file_log is not None else None
+            )
+        finally:
+            if file_log is not None:
+                file_log.flush()
+        attached_names = set()
+        for file_info in new_files:
+            if file_info['status'] == 'completed':
+                manifest.record(file_info['content_hash'], file_info)
+                attached_names.add(file_info['filename'])
+
+        for digest, _, new_name in plan.rename:
+            manifest.rename(digest, new_name)
+            if file_log is not None:
+                file_log.file_renamed(digest, new_name)
+
+        # Old versions are detached only once their replacement is attached
+        stale = [(old, manifest.get(old)) for file_path, _, old in plan.replace if file_path.name in attached_names]
+        stale += plan.detach
+        detached = set(self.detach_files(vector_store_id, [entry['file_id'] for _, entry in stale] + plan.untracked))
+        for digest, entry in stale:
+            if entry['file_id'] in detached:
+                manifest.remove(digest)
+        if file_log is not None:
+            file_log.files_removed(digest for digest, entry in stale if entry['file_id'] in detached)
+            file_log.flush()
+
+        deleted = []
+        if delete_files and detached:
+            # Untracked files may not be ours: detached, but left for garbage collection
+            protected = referenced_file_ids(self.config_dir, self.manifest_file)
+            protected.update(entry['file_id'] for entry in manifest.entries.values())
+            protected.update(plan.untracked)
+            deleted = self.delete_file_objects(sorted(detached - protected))
+        manifest.save()
+        self.save_bundle_map(manifest)
+
+        # Keep the config's file records in line with the store
+        renamed = {manifest.get(digest)['file_id']: new_name for digest, _, new_name in plan.rename}
+        config['files'] = [f for f in config.get('files', []) if f['file_id'] not in detached | gone] + new_files
+        for file_info in config['files']:
+            if file_info['file_id'] in renamed:
+                file_info['filename'] = renamed[file_info['file_id']]
+        config['updated_at'] = datetime.now().isoformat()
+        config['total_files'] = len(config['files'])
+        self.save_config(config)
+
+        failed = len(new_files) - len(attached_names)
+        logger.info("=" * 60)
+        logger.info("Vector Store Sync Complete!")
+        logger.info(f"Attached: {len(attached_names)} ({failed} failed)")
+        logger.info(f"Detached: {len(detached)}, file objects deleted: {len(deleted)}")
+        logger.info(f"Total files: {len(manifest)} in {time.monotonic() - started:.1f}s")
+        logger.info("=" * 60)
+
+        result.update({
+            'attached': len(attached_names),
+            'failed': failed,
+            'detached': len(detached),
+            'files_deleted': len(deleted),
+            'total_files': len(manifest),
+            'api': self.api_report()
+        })
+        return result
 
     def delete_vector_store(self, delete_all_duplicates: bool = True) -> Dict:
         """
@@ -501,18 +1253,27 @@ class OpenAIVectorStoreManager:
                 self.config_file.unlink()
                 logger.info(f"Removed config file: {self.config_file}")
 
+        if self.checkpoint:
+            BuildCheckpoint.discard(self.store_name, self.db_vector_store_id)
+
+        # The uploads it lists were deleted with the store
+        if self.manifest_file.exists():
+            UploadManifest(self.manifest_file).delete()
+            logger.info(f"Removed upload manifest: {self.manifest_file}")
+        if self.bundle_map_file.exists():
+            BundleMap(self.bundle_map_file).delete()
+            logger.info(f"Removed bundle map: {self.bundle_map_file}")
+
         # Also delete any other stores with the same name on OpenAI (cleanup duplicates)
         if delete_all_duplicates:
             logger.info(f"Checking for duplicate vector stores named '{self.store_name}'...")
             try:
-                stores = self.client.vector_stores.list()
-                for store in stores.data:
-                    if store.name == self.store_name and store.id not in deleted_stores:
+                for store in self.inventory.vector_stores(max_age=0):
+                    if store['name'] == self.store_name and store['id'] not in deleted_stores:
                         try:
                             # Delete files attached to this store
                             try:
-                                vs_files = self.client.vector_stores.files.list(vector_store_id=store.id)
-                                for vs_file in vs_files.data:
+                                for vs_file in self.client.vector_stores.files.list(vector_store_id=store['id'], limit=100):
                                     try:
                                         self.client.files.delete(vs_file.id)
                                         deleted_files.append(vs_file.id)
@@ -520,16 +1281,19 @@ class OpenAIVectorStoreManager:
                                     except Exception as e:
                                         logger.warning(f"Could not delete file {vs_file.id}: {e}")
                             except Exception as e:
-                                logger.warning(f"Could not list files for store {store.id}: {e}")
+                                logger.warning(f"Could not list files for store {store['id']}: {e}")
 
-                            self.client.vector_stores.delete(store.id)
-                            deleted_stores.append(store.id)
-                            logger.info(f"Deleted duplicate vector store: {store.id}")
+                            self.client.vector_stores.delete(store['id'])
+                            deleted_stores.append(store['id'])
+                            logger.info(f"Deleted duplicate vector store: {store['id']}")
                         except Exception as e:
-                            logger.warning(f"Could not delete duplicate store {store.id}: {e}")
+                            logger.warning(f"Could not delete duplicate store {store['id']}: {e}")
             except Exception as e:
                 logger.warning(f"Could not check for duplicates: {e}")
 
+        self.inventory.forget(FILES, deleted_files)
+        self.inventory.forget(VECTOR_STORES, deleted_stores)
+
         logger.info("=" * 60)
         logger.info("Vector Store Deletion Complete!")
         logger.info(f"Stores deleted: {len(deleted_stores)}")
@@ -589,26 +1353,80 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='OpenAI Vector Store Manager')
-    parser.add_argument('action', choices=['create', 'update', 'delete', 'status'],
+    parser.add_argument('action', choices=['create', 'update', 'sync', 'delete', 'status', 'resolve'],
                         help='Action to perform')
     parser.add_argument('--store-name', type=str, default=VECTOR_STORE_NAME,
                         help=f'Vector store name (default: {VECTOR_STORE_NAME})')
+    parser.add_argument('--from-store', action='store_true',
+                        help='Read scraped pages from the content store (scrapes run with --content-store)')
+    parser.add_argument('--content-store-path', type=str, default=str(CONTENT_STORE_DIR),
+                        help=f'Content store directory (default: {CONTENT_STORE_DIR})')
+    parser.add_argument('--follow', action='store_true',
+                        help='Upload pages as a running scrape records them (tails its pages.jsonl)')
+    parser.add_argument('--upload-concurrency', type=int, default=DEFAULT_UPLOAD_CONCURRENCY,
+                        help=f'Files uploaded in parallel (default: {DEFAULT_UPLOAD_CONCURRENCY})')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='sync: print the plan without changing the vector store')
+    parser.add_argument('--verify', action='store_true',
+                        help='sync: also diff against the files actually attached to the store')
+    parser.add_argument('--keep-files', action='store_true',
+                        help='sync: detach removed files but keep them in OpenAI storage')
+    parser.add_argument('--max-rps', type=float, default=DEFAULT_MAX_RATE,
+                        help=f'OpenAI API requests per second, at most (default: {DEFAULT_MAX_RATE})')
+    parser.add_argument('--no-checkpoint', action='store_true',
+                        help='do not record files in the database (create is not resumable)')
+    parser.add_argument('--db-store-id', type=int,
+                        help='event_vector_stores row to record the store under')
+    parser.add_argument('--event-id', type=int,
+                        help='Event to link the event_vector_stores row to (its files are listed with the event)')
+    parser.add_argument('--pack', action='store_true',
+                        help='Upload small pages packed into bundle files (far fewer files and API calls)')
+    parser.add_argument('--pack-pages', type=int, default=PACK_TARGET_PAGES,
+                        help=f'Average pages per bundle with --pack (default: {PACK_TARGET_PAGES})')
+    parser.add_argument('--file-id', type=str,
+                        help='resolve: bundle file id (or bundle name) cited by file search')
+    parser.add_argument('--offset', type=int,
+                        help='resolve: byte offset in the bundle (default: list all its pages)')
 
     args = parser.parse_args()
 
     try:
-        manager = OpenAIVectorStoreManager(store_name=args.store_name)
+        manager = OpenAIVectorStoreManager(
+            store_name=args.store_name,
+            from_content_store=args.from_store,
+            content_store_path=Path(args.content_store_path),
+            follow=args.follow,
+            upload_concurrency=args.upload_concurrency,
+            max_request_rate=args.max_rps,
+            checkpoint=not args.no_checkpoint,
+            db_vector_store_id=args.db_store_id,
+            event_id=args.event_id,
+            pack=args.pack,
+            pack_pages_per_bundle=args.pack_pages
+        )
 
         if args.action == 'create':
             result = manager.create_vector_store()
         elif args.action == 'update':
             result = manager.update_vector_store()
+        elif args.action == 'sync':
+            result = manager.sync_vector_store(dry_run=args.dry_run, verify=args.verify,
+                                               delete_files=not args.keep_files)
+            if result.get('success') and args.dry_run:
+                print(f"\n{result['plan']}")
+                return
         elif args.action == 'delete':
             result = manager.delete_vector_store()
         elif args.action == 'status':
             result = manager.get_status()
             print(json.dumps(result, indent=2))
             return
+        elif args.action == 'resolve':
+            if not args.file_id:
+                raise ValueError("resolve needs --file-id")
+            pages = BundleMap(manager.bundle_map_file).resolve(args.file_id, args.offset)
+            print(json.dumps(pages, indent=2))
+            return
 
         if result.get('success'):
             print(f"\n✅ {args.action.capitalize()} completed successfully!")
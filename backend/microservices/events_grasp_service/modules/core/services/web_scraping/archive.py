@@ -0,0 +1,255 @@
+"""
+Crawl Archive
+
+Append-only archive of HTTP responses in the WARC/1.0 record format, one
+gzip member per record (the usual .warc.gz layout, readable by standard
+WARC tools). Bodies are stored as the HTTP client decoded them, with the
+wire encoding headers renamed to match. Scrapers append every fetched page;
+replay runs read the latest record per URL back and re-run extraction
+without touching the network.
+
+A crash can leave a truncated record at the end of the file; readers stop at
+it with a warning, and the next writer cuts it off before appending.
+"""
+
+import gzip
+import uuid
+import zlib
+import logging
+from pathlib import Path
+from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = "archive"
+ARCHIVE_FILE = "crawl.warc.gz"
+
+WARC_VERSION = "WARC/1.0"
+DEPTH_HEADER = "WARC-X-Crawl-Depth"
+
+_READ_CHUNK = 1024 * 1024
+
+# The HTTP clients hand over decoded, de-chunked bodies; these headers describe the wire
+# form, so they are archived under an X-Crawler- prefix and Content-Length is recomputed
+_WIRE_HEADERS = ('content-encoding', 'transfer-encoding', 'content-length')
+
+
+@dataclass
+class ArchiveRecord:
+    """A WARC record read back from the archive."""
+    offset: int
+    record_type: str
+    url: Optional[str]
+    warc_headers: Dict[str, str]
+    status: int = 0
+    http_headers: Dict[str, str] = field(default_factory=dict)  # lower-cased names
+    body: bytes = b''
+
+    @property
+    def depth(self) -> int:
+        return int(self.warc_headers.get(DEPTH_HEADER, 0))
+
+
+def _warc_date() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _encode_headers(first_line: str, headers: Dict[str, str]) -> bytes:
+    lines = [first_line] + [f"{name}: {value}" for name, value in headers.items()]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+
+
+def _decoded_body_headers(headers: Dict[str, str], content: bytes) -> Dict[str, str]:
+    """Rewrite response headers to describe the decoded body they are archived with."""
+    rewritten = {}
+    for name, value in headers.items():
+        if name.lower() in _WIRE_HEADERS:
+            rewritten[f"X-Crawler-{name}"] = value
+        else:
+            rewritten[name] = value
+    rewritten['Content-Length'] = str(len(content))
+    return rewritten
+
+
+def _parse_headers(block: bytes) -> Tuple[str, Dict[str, str]]:
+    lines = block.decode('utf-8', errors='replace').split('\r\n')
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(':')
+        if sep:
+            headers[name.strip()] = value.strip()
+    return lines[0], headers
+
+
+class CrawlArchiveWriter:
+    """Appends response records to a .warc.gz archive."""
+
+    def __init__(self, path: Path, software: str = "events_grasp_service"):
+        """
+        Open (or create) the archive for appending.
+
+        Args:
+            path: Path to the .warc.gz file
+            software: Name written into the warcinfo record of a new archive
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.path.exists() or self.path.stat().st_size == 0
+        if not is_new:
+            self._truncate_torn_tail()
+        self.file: BinaryIO = open(self.path, 'ab')
+        self.records_written = 0
+        self.bytes_written = 0
+        if is_new:
+            info = f"software: {software}\r\nformat: WARC File Format 1.0\r\n".encode('utf-8')
+            self._append('warcinfo', None, 'application/warc-fields', info)
+
+    def _truncate_torn_tail(self):
+        """Drop a partially written last record left behind by a crash."""
+        size = self.path.stat().st_size
+        valid = CrawlArchiveReader(self.path).valid_length()
+        if valid < size:
+            logger.warning(f"Truncating {size - valid} bytes of incomplete records from {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid)
+
+    def _append(self, record_type: str, url: Optional[str], content_type: str,
+                block: bytes, extra_headers: Optional[Dict[str, str]] = None):
+        headers = {
+            'WARC-Type': record_type,
+            'WARC-Record-ID': f"<urn:uuid:{uuid.uuid4()}>",
+            'WARC-Date': _warc_date(),
+        }
+        if url:
+            headers['WARC-Target-URI'] = url
+        headers.update(extra_headers or {})
+        headers['Content-Type'] = content_type
+        headers['Content-Length'] = str(len(block))
+
+        record = _encode_headers(WARC_VERSION, headers) + block + b'\r\n\r\n'
+        member = gzip.compress(record, compresslevel=6)
+        self.file.write(member)
+        self.file.flush()
+        self.records_written += 1
+        self.bytes_written += len(member)
+
+    def write_response(self, url: str, status: int, headers: Dict[str, str],
+                       content: bytes, depth: int = 0):
+        """
+        Append an HTTP response.
+
+        The body is the one the HTTP client returned (already decompressed and
+        de-chunked), so the encoding headers are renamed and Content-Length is
+        set to the stored body's length.
+
+        Args:
+            url: Page URL
+            status: HTTP status code
+            headers: Response headers
+            content: Decoded response body
+            depth: Crawl depth the page was fetched at
+        """
+        try:
+            reason = HTTPStatus(status).phrase
+        except ValueError:
+            reason = ''
+        http_block = _encode_headers(f"HTTP/1.1 {status} {reason}".rstrip(),
+                                     _decoded_body_headers(headers, content)) + content
+        self._append('response', url, 'application/http; msgtype=response', http_block,
+                     {DEPTH_HEADER: str(depth)})
+
+    def close(self):
+        self.file.close()
+
+
+class CrawlArchiveReader:
+    """Streams records back out of a .warc.gz archive."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Crawl archive not found: {self.path}")
+
+    def _members(self) -> Iterator[Tuple[int, bytes, int]]:
+        """Yield (offset, decompressed bytes, compressed size) for each gzip member."""
+        with open(self.path, 'rb') as f:
+            offset = 0
+            pending = b''
+            while True:
+                data = pending or f.read(_READ_CHUNK)
+                if not data:
+                    return
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                parts = []
+                consumed = 0
+                while True:
+                    try:
+                        parts.append(decompressor.decompress(data))
+                    except zlib.error as e:
+                        logger.warning(f"Corrupt archive record at offset {offset} in {self.path}: {e}")
+                        return
+                    if decompressor.eof:
+                        consumed += len(data) - len(decompressor.unused_data)
+                        pending = decompressor.unused_data
+                        break
+                    consumed += len(data)
+                    data = f.read(_READ_CHUNK)
+                    if not data:
+                        logger.warning(f"Truncated archive record at offset {offset} in {self.path}")
+                        return
+                yield offset, b''.join(parts), consumed
+                offset += consumed
+
+    def valid_length(self) -> int:
+        """Return the byte length of the archive up to the last complete record."""
+        end = 0
+        for offset, _, size in self._members():
+            end = offset + size
+        return end
+
+    @staticmethod
+    def _parse(offset: int, raw: bytes) -> ArchiveRecord:
+        head, _, rest = raw.partition(b'\r\n\r\n')
+        _, warc_headers = _parse_headers(head)
+        block = rest[:int(warc_headers.get('Content-Length', len(rest)))]
+        record = ArchiveRecord(
+            offset=offset,
+            record_type=warc_headers.get('WARC-Type', ''),
+            url=warc_headers.get('WARC-Target-URI'),
+            warc_headers=warc_headers
+        )
+        if record.record_type == 'response':
+            http_head, _, body = block.partition(b'\r\n\r\n')
+            status_line, http_headers = _parse_headers(http_head)
+            parts = status_line.split(' ', 2)
+            record.status = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+            record.http_headers = {name.lower(): value for name, value in http_headers.items()}
+            record.body = body
+        return record
+
+    def records(self) -> Iterator[ArchiveRecord]:
+        """Yield every record in file order."""
+        for offset, raw, _ in self._members():
+            yield self._parse(offset, raw)
+
+    def latest_responses(self) -> Iterator[ArchiveRecord]:
+        """
+        Yield the most recent successful response per URL, in file order.
+
+        Two sequential passes: the first finds the latest record offset per
+        URL, the second streams those records, so the archive is never held
+        in memory.
+        """
+        latest: Dict[str, int] = {}
+        for offset, raw, _ in self._members():
+            record = self._parse(offset, raw)
+            if record.record_type == 'response' and record.url and 200 <= record.status < 300:
+                latest[record.url] = offset
+
+        keep = set(latest.values())
+        for offset, raw, _ in self._members():
+            if offset in keep:
+                yield self._parse(offset, raw)
@@ -0,0 +1,902 @@
+"""
+Base Scraper
+
+Shared fetch/clean/save pipeline for the web scrapers. Subclasses define the
+crawl scope (is_in_scope) and how the crawl is seeded; the base class takes
+care of text extraction, file output, incremental state, the crawl archive
+and replay, sitemap discovery, per-host rate control, link-graph capture
+and PageRank, event_scraping_logs bookkeeping and driving the CrawlEngine.
+"""
+
+import os
+import re
+import shutil
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+from pathlib import Path
+from datetime import datetime
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlparse
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+from bs4 import BeautifulSoup
+
+from .extraction import (
+    DEFAULT_BACKEND, EXTRACTION_BACKENDS, ExtractedPage, extract_page, normalize_link, soup_links, soup_text,
+    soup_title
+)
+from .dedup import DEFAULT_MAX_DISTANCE, DUPLICATE_ACTIONS, NearDuplicateIndex, extract_with_fingerprint, simhash
+from .content_store import CONTENT_STORE_DIR, ContentStore, content_key, render_document
+from .manifest import MANIFEST_FILE, METADATA_FILE, PageManifest, write_metadata
+from .url_set import CompactUrlSet
+from .archive import ARCHIVE_DIR, ARCHIVE_FILE, CrawlArchiveReader, CrawlArchiveWriter
+from .crawl_engine import CrawlEngine, FetchResult, DEFAULT_CONCURRENCY, DEFAULT_PER_HOST_LIMIT
+from .rate_control import DEFAULT_INITIAL_RATE, DEFAULT_MAX_RATE, RateController
+from .link_graph import GRAPH_FILE, LinkGraph
+from .sitemap import SitemapReader
+from .page_state import PageStateStore, STATE_FILE, content_hash
+from ...integrations.db import get_db_manager
+from ...integrations.migrator import apply_migrations
+from ...dao.impl.scraping_log_dao import ScrapingLogDAO
+
+logger = logging.getLogger(__name__)
+
+# Pages between files_scraped progress updates in event_scraping_logs
+PROGRESS_INTERVAL = 25
+
+# Parse worker processes, one per core (0 parses on the event loop; a single
+# worker on a single core only adds IPC overhead)
+DEFAULT_PARSE_WORKERS = os.cpu_count() if (os.cpu_count() or 1) > 1 else 0
+
+# Archived responses handed to the parse pool at a time during replay
+REPLAY_BATCH_SIZE = 64
+
+# Request headers to mimic a browser
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+
+class BaseScraper:
+    """Generic scraper: fetch, clean and save pages reachable from a root URL."""
+
+    display_name = "Web Scraper"
+
+    def __init__(self, output_dir: Path, root_url: str, max_depth: int = 1,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+                 incremental: bool = False, event_id: Optional[int] = None,
+                 parser: str = DEFAULT_BACKEND,
+                 site_extractors: bool = True,
+                 parse_workers: int = DEFAULT_PARSE_WORKERS,
+                 archive: bool = False, archive_path: Optional[Path] = None,
+                 content_store: bool = False, content_store_path: Optional[Path] = None,
+                 near_duplicates: Optional[str] = None,
+                 near_duplicate_distance: int = DEFAULT_MAX_DISTANCE,
+                 host_rate: float = DEFAULT_INITIAL_RATE,
+                 max_host_rate: Optional[float] = DEFAULT_MAX_RATE,
+                 link_graph: bool = False, max_pages: Optional[int] = None,
+                 sitemap: bool = False, sitemap_urls: Optional[List[str]] = None,
+                 on_page: Optional[Callable[[Dict], None]] = None):
+        """
+        Initialize the scraper.
+
+        Args:
+            output_dir: Directory to save scraped content
+            root_url: URL the crawl starts from
+            max_depth: Maximum depth for following links (1 = only links from root page)
+            concurrency: Number of concurrent fetch workers
+            per_host_limit: Maximum in-flight requests per host
+            incremental: Send conditional requests and skip unchanged pages
+            event_id: Optional event to record the run against in event_scraping_logs
+            parser: HTML extraction backend ('lxml' or 'bs4')
+            site_extractors: Use the site-specific extractor of a page's site when one is
+                registered (article body, author, date only); False applies the generic path everywhere
+            parse_workers: Processes for the parse/clean stage (0 = parse inline)
+            archive: Append every raw response to the crawl archive
+            archive_path: Crawl archive file (default: <output_dir>/../archive/crawl.warc.gz)
+            content_store: Save page text to the shared content store instead of loose .txt files
+            content_store_path: Content store directory (default: ~/runtime_data/datasets/content_store)
+            near_duplicates: What to do with near-duplicate pages: 'skip' (drop them) or
+                'link' (record them with duplicate_of, without saving text); None disables detection
+            near_duplicate_distance: Maximum SimHash Hamming distance (bits) for a near-duplicate
+            host_rate: Requests per second each host starts at (adapted during the crawl)
+            max_host_rate: Upper bound on requests per second per host; None disables rate control
+            link_graph: Capture the link graph, fetch pages in PageRank order and store each page's score
+            max_pages: Stop fetching after this many pages (crawl budget)
+            sitemap: Take the pages to fetch from the site's sitemaps instead of following links
+            sitemap_urls: Sitemap or sitemap index URLs (default: from robots.txt, else /sitemap.xml)
+            on_page: Called with every page record once its content is saved (e.g. to feed
+                an upload pipeline); it runs on the crawl's event loop and must not block
+                (set on_page_backpressure to slow the crawl down instead)
+        """
+        if parser not in EXTRACTION_BACKENDS:
+            raise ValueError(f"Unknown extraction backend: {parser}")
+        if near_duplicates is not None and near_duplicates not in DUPLICATE_ACTIONS:
+            raise ValueError(f"Unknown near-duplicate action: {near_duplicates}")
+        if host_rate <= 0 or (max_host_rate is not None and max_host_rate < 0):
+            raise ValueError("Host rates must be positive")
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+        self.output_dir = Path(output_dir)
+        self.max_depth = max_depth
+        self.root_url = root_url
+        self.concurrency = concurrency
+        self.per_host_limit = per_host_limit
+        self.incremental = incremental
+        self.event_id = event_id
+        self.parser = parser
+        self.site_extractors = site_extractors
+        self.parse_workers = max(0, parse_workers)
+        self.parse_pool: Optional[ProcessPoolExecutor] = None
+        self.archive = archive
+        self.archive_path = Path(archive_path) if archive_path else self.output_dir.parent / ARCHIVE_DIR / ARCHIVE_FILE
+        self.archive_writer: Optional[CrawlArchiveWriter] = None
+        self.replaying = False
+        self.use_content_store = content_store
+        self.content_store_path = Path(content_store_path) if content_store_path else CONTENT_STORE_DIR
+        self.content_store: Optional[ContentStore] = None
+        self.content_stats = {'stored': 0, 'deduplicated': 0}
+        self.near_duplicates = near_duplicates
+        self.near_duplicate_distance = near_duplicate_distance
+        self.near_duplicate_index: Optional[NearDuplicateIndex] = None
+        self.duplicates_skipped = 0
+        self.host_rate = host_rate
+        self.max_host_rate = max_host_rate
+        self.rate_controller: Optional[RateController] = None
+        self.capture_link_graph = link_graph
+        self.link_graph: Optional[LinkGraph] = None
+        self.max_pages = max_pages
+        self.sitemap = sitemap or bool(sitemap_urls)
+        self.sitemap_urls = list(sitemap_urls or [])
+        self.sitemap_stats = {'sitemaps': 0, 'requests': 0, 'urls': 0, 'skipped_unchanged': 0}
+        self.state: Optional[PageStateStore] = None
+        self.change_stats = {'new': 0, 'changed': 0, 'unchanged': 0}
+        self.log_dao: Optional[ScrapingLogDAO] = None
+        self.scraping_log_id: Optional[int] = None
+        self.visited_urls = CompactUrlSet()
+        self.manifest: Optional[PageManifest] = None
+        self.pages_recorded = 0
+        self.last_page: Optional[Dict] = None
+        self.on_page = on_page
+        # Async callable awaited after every page: lets the on_page consumer hold the crawl back
+        self.on_page_backpressure: Optional[Callable[[], Awaitable[None]]] = None
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+
+    def is_in_scope(self, parsed) -> bool:
+        """
+        Decide whether a link should be followed.
+
+        Args:
+            parsed: urlparse() result of an absolute link
+
+        Returns:
+            True if the link belongs to the crawl
+        """
+        return parsed.netloc == urlparse(self.root_url).netloc
+
+    def clean_text(self, soup: BeautifulSoup) -> str:
+        """
+        Extract and clean text content from HTML.
+
+        Args:
+            soup: BeautifulSoup object
+
+        Returns:
+            Cleaned text content
+        """
+        return soup_text(soup)
+
+    def extract_title(self, soup: BeautifulSoup) -> str:
+        """Extract page title from HTML."""
+        return soup_title(soup)
+
+    def filter_links(self, links: List[str], exclude_visited: bool = True) -> List[str]:
+        """
+        Keep the absolute links that belong to the crawl scope.
+
+        Args:
+            links: Absolute links (query and fragment already stripped)
+            exclude_visited: Drop links that were already visited in this run
+
+        Returns:
+            List of absolute URLs
+        """
+        return [
+            link for link in links
+            if self.is_in_scope(urlparse(link))
+            and (not exclude_visited or link not in self.visited_urls)
+        ]
+
+    def extract_links(self, soup: BeautifulSoup, base_url: str, exclude_visited: bool = True) -> List[str]:
+        """
+        Extract relevant links from the page.
+
+        Args:
+            soup: BeautifulSoup object
+            base_url: Base URL for resolving relative links
+            exclude_visited: Drop links that were already visited in this run
+
+        Returns:
+            List of absolute URLs
+        """
+        return self.filter_links(soup_links(soup, base_url), exclude_visited)
+
+    def generate_filename(self, url: str, title: str) -> str:
+        """
+        Generate a safe filename for the scraped content.
+
+        Args:
+            url: Page URL
+            title: Page title
+
+        Returns:
+            Safe filename
+        """
+        # Create a hash of the URL for uniqueness
+        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+
+        # Clean the title for use as filename
+        safe_title = re.sub(r'[^\w\s-]', '', title)
+        safe_title = re.sub(r'[-\s]+', '_', safe_title)
+        safe_title = safe_title[:50]  # Limit length
+
+        return f"{safe_title}_{url_hash}.txt"
+
+    def record_page(self, data: Dict):
+        """Append a page to the run's manifest and periodically report progress."""
+        self.manifest.append(data)
+        self.pages_recorded += 1
+        self.last_page = data
+        if self.on_page is not None:
+            self.on_page(data)
+        if self.log_dao and self.pages_recorded % PROGRESS_INTERVAL == 0:
+            self.log_dao.update_progress(self.scraping_log_id, self.pages_recorded)
+
+    def process_page(self, url: str, content: bytes, depth: int,
+                     page: Optional[ExtractedPage] = None) -> Tuple[Dict, List[str]]:
+        """
+        Parse a fetched page, save its text content and collect its links.
+
+        Args:
+            url: Page URL
+            content: Raw response body
+            depth: Current crawl depth
+            page: Extraction already done by the parse pool, if any
+
+        Returns:
+            Tuple of (scraped data, in-scope links found on the page)
+        """
+        # Extract content (links are collected before boilerplate is dropped)
+        if page is None:
+            page = self.extractor(content, url, self.parser, self.site_extractors)
+        title = page.title
+        text_content = page.text
+        links = self.filter_links(page.links, exclude_visited=False)
+
+        # Generate filename
+        filename = self.generate_filename(url, title)
+
+        # Prepare data
+        data = {
+            'url': url,
+            'title': title,
+            'filename': filename,
+            'scraped_at': datetime.now().isoformat(),
+            'depth': depth,
+            'content_length': len(text_content),
+            'content_key': content_key(text_content)
+        }
+        if page.extractor:
+            data['extractor'] = page.extractor
+            data['author'] = page.author
+            data['published'] = page.published
+
+        if self.near_duplicate_index is not None:
+            fingerprint = page.fingerprint if page.fingerprint is not None else simhash(text_content)
+            data['simhash'] = f"{fingerprint:016x}"
+            original = self.near_duplicate_index.check_and_add(fingerprint, url)
+            if original is not None:
+                self.skip_near_duplicate(data, original)
+                return data, links
+
+        self.write_document(data, text_content)
+
+        self.record_page(data)
+
+        return data, links
+
+    @property
+    def extractor(self):
+        """Extraction function for this run (module-level, so it can run in the parse pool)."""
+        return extract_with_fingerprint if self.near_duplicates else extract_page
+
+    def skip_near_duplicate(self, data: Dict, original: str):
+        """Drop a near-duplicate page, or record it as a link to the original."""
+        self.duplicates_skipped += 1
+        data['filename'] = None
+        data['duplicate_of'] = original
+        logger.info(f"Near-duplicate of {original}: {data['url']}")
+        if self.near_duplicates == 'link':
+            self.record_page(data)
+
+    def index_page(self, page: Dict):
+        """Add an already scraped page (e.g. from an interrupted run) to the near-duplicate index."""
+        if self.near_duplicate_index is not None and page.get('simhash') and not page.get('duplicate_of'):
+            self.near_duplicate_index.add(int(page['simhash'], 16), page['url'])
+
+    def write_document(self, data: Dict, text_content: str):
+        """Save a page's text to the content store or to a .txt file in the output directory."""
+        if self.content_store is not None:
+            _, is_new = self.content_store.put(text_content)
+            self.content_stats['stored' if is_new else 'deduplicated'] += 1
+            logger.info(f"Stored: {data['filename']} ({len(text_content)} chars"
+                        f"{'' if is_new else ', already in content store'})")
+            return
+
+        filepath = self.output_dir / data['filename']
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(render_document(data['url'], data['title'], data['scraped_at'], text_content,
+                                    data.get('author'), data.get('published')))
+
+        logger.info(f"Saved: {data['filename']} ({len(text_content)} chars)")
+
+    def document_exists(self, page: Dict) -> bool:
+        """Return True if the saved text of a previously scraped page is still available."""
+        if self.content_store is not None:
+            return bool(page.get('content_key')) and self.content_store.has(page['content_key'])
+        return bool(page.get('filename')) and (self.output_dir / page['filename']).exists()
+
+    def process_incremental(self, url: str, status: int, headers: Dict[str, str],
+                            content: bytes, depth: int,
+                            page: Optional[ExtractedPage] = None) -> List[str]:
+        """
+        Process a response against the stored page state.
+
+        Unchanged pages (304, or 200 with the same content hash) are neither
+        parsed nor rewritten; their links are taken from the stored state.
+
+        Args:
+            url: Page URL
+            status: HTTP status code
+            headers: Response headers (lower-cased names)
+            content: Raw response body
+            depth: Current crawl depth
+            page: Extraction already done by the parse pool, if any
+
+        Returns:
+            In-scope links found on the page
+        """
+        previous = self.state.get(url)
+        etag = headers.get('etag')
+        last_modified = headers.get('last-modified')
+
+        if previous and not self.document_exists(previous):
+            previous = None
+
+        if status == 304 and previous is None:
+            logger.warning(f"Got 304 for {url} without stored state; skipping")
+            return []
+
+        digest = content_hash(content) if status != 304 else None
+        if previous and (status == 304 or digest == previous['content_hash']):
+            self.state.touch_validators(url, etag, last_modified)
+            self.record_unchanged(url, previous, depth)
+            return previous['links']
+
+        data, links = self.process_page(url, content, depth, page)
+        if data.get('duplicate_of'):
+            # Not saved: the page's state and any earlier document are left as they were
+            return links
+        if self.content_store is None and previous and previous['filename'] != data['filename']:
+            (self.output_dir / previous['filename']).unlink(missing_ok=True)
+
+        change_status = 'changed' if previous else 'new'
+        self.change_stats[change_status] += 1
+        data['change_status'] = change_status
+
+        self.state.upsert(
+            url, etag, last_modified, digest,
+            data['title'], data['filename'], data['content_length'], links,
+            data['content_key'], data.get('extractor'), data.get('author'), data.get('published'),
+            data.get('simhash')
+        )
+        return links
+
+    def record_unchanged(self, url: str, previous: Dict, depth: int):
+        """Record a page whose stored state and document are still current."""
+        self.change_stats['unchanged'] += 1
+        record = {
+            'url': url,
+            'title': previous['title'],
+            'filename': previous['filename'],
+            'scraped_at': previous['updated_at'],
+            'depth': depth,
+            'content_length': previous['content_length'],
+            'content_key': previous['content_key'],
+            'change_status': 'unchanged',
+            **{k: previous[k] for k in ('extractor', 'author', 'published', 'simhash') if previous.get(k)}
+        }
+        self.record_page(record)
+        # Later pages are still compared against it
+        self.index_page(record)
+        logger.info(f"Unchanged: {url}")
+
+    def handle_response(self, url: str, status: int, headers: Dict[str, str],
+                        content: bytes, depth: int,
+                        page: Optional[ExtractedPage] = None) -> List[str]:
+        """
+        Process a fetched response and return the links to follow.
+
+        Args:
+            url: Page URL
+            status: HTTP status code
+            headers: Response headers (lower-cased names)
+            content: Raw response body
+            depth: Current crawl depth
+            page: Extraction already done by the parse pool, if any
+
+        Returns:
+            Unvisited links to follow (empty at max depth)
+        """
+        if self.archive_writer is not None and status != 304:
+            self.archive_writer.write_response(url, status, headers, content, depth)
+
+        if self.state is not None:
+            links = self.process_incremental(url, status, headers, content, depth, page)
+        else:
+            _, links = self.process_page(url, content, depth, page)
+        if self.link_graph is not None:
+            self.link_graph.add_page(url, links)
+
+        if depth >= self.max_depth:
+            return []
+
+        links = [link for link in links if link not in self.visited_urls]
+        logger.info(f"Found {len(links)} new links to follow")
+        return links
+
+    async def page_backpressure(self):
+        """CrawlEngine callback: wait until the on_page consumer can take more pages."""
+        if self.on_page_backpressure is not None:
+            await self.on_page_backpressure()
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """CrawlEngine callback: conditional-GET headers for incremental runs."""
+        if self.state is None:
+            return {}
+        previous = self.state.get(url)
+        # A 304 is only usable while the stored document still exists
+        if previous is None or not self.document_exists(previous):
+            return {}
+        return self.state.conditional_headers(url)
+
+    def parse_job(self, result: FetchResult) -> Optional[Tuple[Callable, bytes, str, str, bool]]:
+        """
+        CrawlEngine callback: the extraction to run in the parse pool.
+
+        Returns None for responses that will not be parsed (304s and, in
+        incremental mode, bodies whose hash matches the stored state).
+        """
+        if result.status == 304:
+            return None
+        if self.state is not None:
+            previous = self.state.get(result.url)
+            if previous and previous['content_hash'] == content_hash(result.content):
+                return None
+        return self.extractor, result.content, result.url, self.parser, self.site_extractors
+
+    def handle_page(self, result: FetchResult, depth: int,
+                    page: Optional[ExtractedPage] = None) -> List[str]:
+        """CrawlEngine callback: process a fetched page and return links to follow."""
+        return self.handle_response(result.url, result.status, result.headers, result.content, depth, page)
+
+    def scrape_page(self, url: str, depth: int = 0) -> Optional[Dict]:
+        """
+        Scrape a single page and recurse into its links (serial path).
+
+        Kept as the single-threaded baseline; run() uses the concurrent
+        CrawlEngine unless serial=True.
+
+        Args:
+            url: URL to scrape
+            depth: Current recursion depth
+
+        Returns:
+            Dictionary with scraped data or None if failed
+        """
+        if url in self.visited_urls:
+            return None
+        if self.max_pages is not None and len(self.visited_urls) >= self.max_pages:
+            return None
+
+        self.visited_urls.add(url)
+        logger.info(f"Scraping: {url} (depth: {depth})")
+
+        try:
+            response = self.session.get(url, timeout=30, headers=self.request_headers(url))
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return None
+
+        headers = {k.lower(): v for k, v in response.headers.items()}
+        links = self.handle_response(url, response.status_code, headers, response.content, depth)
+
+        for link in links:
+            self.scrape_page(link, depth + 1)
+
+        return self.last_page
+
+    def replay_archive(self):
+        """Re-run extraction over the latest archived response of every URL (no network I/O)."""
+        logger.info(f"Replaying from archive: {self.archive_path}")
+        reader = CrawlArchiveReader(self.archive_path)
+        batch = []
+        for record in reader.latest_responses():
+            self.visited_urls.add(record.url)
+            batch.append(record)
+            if len(batch) >= REPLAY_BATCH_SIZE:
+                self._replay_batch(batch)
+                batch = []
+        if batch:
+            self._replay_batch(batch)
+
+    def _replay_batch(self, records: List):
+        if self.parse_pool is not None:
+            pages = self.parse_pool.map(
+                self.extractor, [r.body for r in records], [r.url for r in records], repeat(self.parser),
+                repeat(self.site_extractors)
+            )
+        else:
+            pages = repeat(None)
+
+        for record, page in zip(records, pages):
+            try:
+                _, links = self.process_page(record.url, record.body, record.depth, page)
+                if self.link_graph is not None:
+                    self.link_graph.add_page(record.url, links)
+            except Exception as e:
+                logger.error(f"Failed to process {record.url}: {e}")
+
+    def clear_output_directory(self):
+        """Clear the output directory before scraping."""
+        if self.output_dir.exists():
+            logger.info(f"Clearing existing content in {self.output_dir}")
+            shutil.rmtree(self.output_dir)
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Created output directory: {self.output_dir}")
+
+    def clear_page_outputs(self):
+        """Remove the page documents, page manifest and metadata, keeping the rest of the output directory."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        removed = 0
+        for path in [*self.output_dir.glob('*.txt'), self.output_dir / MANIFEST_FILE, self.output_dir / METADATA_FILE]:
+            if path.exists():
+                path.unlink()
+                removed += 1
+        logger.info(f"Cleared {removed} page outputs in {self.output_dir}")
+
+    def save_metadata(self):
+        """Save scraping metadata to JSON file, streaming the page records from the manifest."""
+        metadata = {
+            'root_url': self.root_url,
+            'scraped_at': datetime.now().isoformat(),
+            'total_pages': self.pages_recorded,
+            'visited_urls': len(self.visited_urls),
+            'max_depth': self.max_depth,
+            'parser': self.parser,
+            'site_extractors': self.site_extractors,
+            'replayed': self.replaying,
+            'archive_path': str(self.archive_path) if (self.archive or self.replaying) else None,
+            'output_directory': str(self.output_dir),
+            'incremental': self.incremental,
+            'change_stats': self.change_stats,
+            'content_store': str(self.content_store_path) if self.use_content_store else None,
+            'content_stats': self.content_stats if self.use_content_store else None,
+            'near_duplicates': self.near_duplicates,
+            'duplicates_skipped': self.duplicates_skipped,
+            'host_rates': self.rate_controller.stats() if self.rate_controller else None,
+            'max_pages': self.max_pages,
+            'sitemap': self.sitemap_stats if self.sitemap else None,
+            'link_graph': GRAPH_FILE if self.link_graph is not None else None,
+            'manifest': MANIFEST_FILE
+        }
+
+        pages = PageManifest.iter_pages(self.output_dir / MANIFEST_FILE)
+        if self.link_graph is not None:
+            pages = self._with_pagerank(pages)
+        metadata_path = self.output_dir / METADATA_FILE
+        write_metadata(metadata_path, metadata, pages)
+
+        logger.info(f"Saved metadata to {metadata_path}")
+
+    def _with_pagerank(self, pages: Iterable[Dict]) -> Iterator[Dict]:
+        """Attach each page's PageRank score (for retrieval boosting) to its record."""
+        for page in pages:
+            score = self.link_graph.score(page['url'])
+            page['pagerank'] = float(f"{score:.6g}") if score is not None else None
+            yield page
+
+    def build_engine(self) -> CrawlEngine:
+        """Create the CrawlEngine used for concurrent runs."""
+        return CrawlEngine(
+            self,
+            max_depth=self.max_depth,
+            concurrency=self.concurrency,
+            per_host_limit=self.per_host_limit,
+            headers=HEADERS,
+            visited=self.visited_urls,
+            parse_pool=self.parse_pool,
+            rate_controller=self.rate_controller,
+            link_graph=self.link_graph,
+            max_pages=self.max_pages
+        )
+
+    def last_scrape_time(self) -> Optional[datetime]:
+        """Start time of the event's last completed run in event_scraping_logs, if any."""
+        if self.log_dao is None or self.event_id is None:
+            return None
+        return self.log_dao.last_completed_start(self.event_id)
+
+    def discover_from_sitemaps(self) -> List[str]:
+        """
+        Read the site's sitemaps and return the in-scope page URLs to fetch.
+
+        In incremental mode, pages whose <lastmod> is not newer than the last
+        completed run (or, without an event, than the page's own stored
+        state) are recorded as unchanged without being requested.
+
+        Returns:
+            Page URLs to fetch
+        """
+        reader = SitemapReader(self.session)
+        sitemap_urls = self.sitemap_urls or reader.default_sitemaps(self.root_url)
+        since = self.last_scrape_time() if self.state is not None else None
+        if since is not None:
+            logger.info(f"Skipping sitemap pages not modified since the last completed run ({since})")
+
+        urls = []
+        # Pages listed in several sitemaps are taken once
+        listed = set()
+        for entry in reader.entries(sitemap_urls):
+            url = normalize_link(entry.loc, entry.loc)
+            if url is None or url in listed or not self.is_in_scope(urlparse(url)) or url in self.visited_urls:
+                continue
+            listed.add(url)
+            self.sitemap_stats['urls'] += 1
+            previous = self.state.get(url) if self.state is not None and entry.lastmod else None
+            if previous and self.document_exists(previous):
+                threshold = since or datetime.fromisoformat(previous['updated_at'])
+                if entry.lastmod <= threshold:
+                    self.visited_urls.add(url)
+                    self.sitemap_stats['skipped_unchanged'] += 1
+                    self.record_unchanged(url, previous, self.max_depth)
+                    if self.link_graph is not None:
+                        self.link_graph.add_page(url, previous['links'])
+                    continue
+            urls.append(url)
+
+        self.sitemap_stats['sitemaps'] = reader.sitemaps_read
+        self.sitemap_stats['requests'] = reader.requests_made
+        logger.info(f"Sitemaps: {self.sitemap_stats['urls']} in-scope pages from {reader.sitemaps_read} sitemaps "
+                    f"({reader.requests_made} requests), {self.sitemap_stats['skipped_unchanged']} unchanged")
+        return urls
+
+    def seed_urls(self) -> Tuple[List[str], int]:
+        """
+        Return the crawl seeds and their depth.
+
+        In sitemap mode the seeds are the sitemap pages at max_depth, so
+        they are fetched without following their links.
+        """
+        if not self.sitemap:
+            return [self.root_url], 0
+        return self.discover_from_sitemaps(), self.max_depth
+
+    def crawl(self, serial: bool = False):
+        """
+        Crawl from the root URL (or the sitemap pages).
+
+        Args:
+            serial: Use the single-threaded recursive path instead of the CrawlEngine
+        """
+        logger.info(f"Starting from: {self.root_url}")
+        seeds, depth = self.seed_urls()
+        if serial:
+            for url in seeds:
+                self.scrape_page(url, depth=depth)
+        else:
+            asyncio.run(self.build_engine().crawl(seeds, seed_depth=depth))
+
+    def prepare_run(self):
+        """Reset per-run state and open persistent stores."""
+        self.visited_urls.clear()
+        self.manifest = PageManifest(self.output_dir / MANIFEST_FILE)
+        self.pages_recorded = 0
+        self.last_page = None
+        self.change_stats = {'new': 0, 'changed': 0, 'unchanged': 0}
+        self.content_stats = {'stored': 0, 'deduplicated': 0}
+        self.duplicates_skipped = 0
+        self.link_graph = LinkGraph() if self.capture_link_graph else None
+        self.sitemap_stats = {'sitemaps': 0, 'requests': 0, 'urls': 0, 'skipped_unchanged': 0}
+        self.rate_controller = None
+        if self.max_host_rate and not self.replaying:
+            self.rate_controller = RateController(self.host_rate, self.max_host_rate)
+        if self.near_duplicates:
+            self.near_duplicate_index = NearDuplicateIndex(self.near_duplicate_distance)
+        if self.use_content_store:
+            self.content_store = ContentStore(self.content_store_path)
+            logger.info(f"Saving page text to content store {self.content_store_path}")
+        if self.incremental:
+            self.state = PageStateStore(self.output_dir / STATE_FILE)
+            logger.info(f"Incremental mode: using page state {self.state.db_path}")
+        if self.parse_workers:
+            # Worker processes are started on first use. Spawned, not forked: an ingest run already has
+            # upload threads, and a forked worker can inherit a lock one of them held
+            self.parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers,
+                                                  mp_context=multiprocessing.get_context('spawn'))
+            logger.info(f"Parsing in {self.parse_workers} worker processes")
+        if self.archive and not self.replaying:
+            self.archive_writer = CrawlArchiveWriter(self.archive_path)
+            logger.info(f"Archiving responses to {self.archive_path}")
+
+    def close_run(self):
+        """Close persistent stores, the archive, the manifest and the parse pool opened by prepare_run."""
+        if self.manifest is not None:
+            self.manifest.close()
+            self.manifest = None
+        if self.link_graph is not None and len(self.link_graph):
+            self.link_graph.rank()
+            self.link_graph.save(self.output_dir / GRAPH_FILE)
+            logger.info(f"Saved link graph ({len(self.link_graph)} pages, "
+                        f"{self.link_graph.edge_count} links) to {self.output_dir / GRAPH_FILE}")
+        if self.archive_writer is not None:
+            self.archive_writer.close()
+            self.archive_writer = None
+        if self.content_store is not None:
+            self.content_store.close()
+            self.content_store = None
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown()
+            self.parse_pool = None
+        if self.state is not None:
+            self.state.close()
+            self.state = None
+
+    def run(self, clear_existing: bool = True, serial: bool = False, replay: bool = False) -> Dict:
+        """
+        Run the scraper.
+
+        Args:
+            clear_existing: Whether to clear existing content before scraping
+            serial: Use the single-threaded recursive path instead of the CrawlEngine
+            replay: Rebuild the output from the crawl archive instead of fetching
+
+        Returns:
+            Dictionary with scraping results
+        """
+        self.replaying = replay
+        if replay:
+            if not self.archive_path.exists():
+                raise FileNotFoundError(f"Crawl archive not found: {self.archive_path}")
+
+        logger.info("=" * 60)
+        logger.info(self.display_name)
+        logger.info("=" * 60)
+
+        if replay:
+            # Replay rebuilds the pages; the crawl's state databases and link graph are kept
+            self.clear_page_outputs()
+        elif clear_existing:
+            self.clear_output_directory()
+        else:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        started = datetime.now()
+        try:
+            self.prepare_run()
+            self.log_dao, self.scraping_log_id = self.start_scraping_log()
+            if self.replaying:
+                self.replay_archive()
+            else:
+                self.crawl(serial=serial)
+        except Exception as e:
+            if self.log_dao:
+                self.log_dao.finish_log(self.scraping_log_id, 'failed', self.pages_recorded,
+                                        error_message=str(e), **self._change_stats_columns())
+            raise
+        finally:
+            self.close_run()
+        elapsed = (datetime.now() - started).total_seconds()
+
+        # Save metadata
+        self.save_metadata()
+
+        if self.log_dao:
+            self.log_dao.finish_log(self.scraping_log_id, 'completed', self.pages_recorded,
+                                    **self._change_stats_columns())
+
+        # Summary
+        logger.info("=" * 60)
+        logger.info(f"Scraping complete!")
+        logger.info(f"Total pages scraped: {self.pages_recorded}")
+        if self.incremental:
+            logger.info(f"  - New: {self.change_stats['new']}")
+            logger.info(f"  - Changed: {self.change_stats['changed']}")
+            logger.info(f"  - Unchanged: {self.change_stats['unchanged']}")
+        if self.use_content_store:
+            logger.info(f"  - Stored: {self.content_stats['stored']}, "
+                        f"already in content store: {self.content_stats['deduplicated']}")
+        if self.near_duplicates:
+            logger.info(f"  - Near-duplicates skipped: {self.duplicates_skipped}")
+        if self.sitemap:
+            logger.info(f"  - Sitemap pages: {self.sitemap_stats['urls']} "
+                        f"({self.sitemap_stats['skipped_unchanged']} skipped by <lastmod>)")
+        if self.rate_controller:
+            for host, host_stats in self.rate_controller.stats().items():
+                logger.info(f"  - {host}: {host_stats['pages_per_second']} pages/s, "
+                            f"rate {host_stats['rate']}/s (peak {host_stats['peak_rate']}/s), "
+                            f"{host_stats['throttle_events']} throttle events")
+        logger.info(f"Elapsed: {elapsed:.2f}s")
+        logger.info(f"Output directory: {self.output_dir}")
+        logger.info("=" * 60)
+
+        return {
+            'success': True,
+            'total_pages': self.pages_recorded,
+            'pages_new': self.change_stats['new'],
+            'pages_changed': self.change_stats['changed'],
+            'pages_unchanged': self.change_stats['unchanged'],
+            'elapsed_seconds': round(elapsed, 3),
+            'replayed': self.replaying,
+            'pages_deduplicated': self.content_stats['deduplicated'],
+            'duplicates_skipped': self.duplicates_skipped,
+            'visited_urls': len(self.visited_urls),
+            'throttle_events': self.rate_controller.throttle_events if self.rate_controller else 0,
+            'sitemap': self.sitemap_stats if self.sitemap else None,
+            'host_rates': self.rate_controller.stats() if self.rate_controller else {},
+            'top_pages': [
+                {'url': url, 'pagerank': round(score, 6)} for url, score in self.link_graph.top(10)
+            ] if self.link_graph is not None else [],
+            'output_directory': str(self.output_dir),
+            'manifest': str(self.output_dir / MANIFEST_FILE)
+        }
+
+    def _change_stats_columns(self) -> Dict[str, int]:
+        """Map change statistics to event_scraping_logs columns."""
+        return {
+            'pages_new': self.change_stats['new'],
+            'pages_changed': self.change_stats['changed'],
+            'pages_unchanged': self.change_stats['unchanged']
+        }
+
+    def start_scraping_log(self) -> Tuple[Optional[ScrapingLogDAO], Optional[int]]:
+        """Create the event_scraping_logs row for this run when an event is set."""
+        if self.event_id is None:
+            return None, None
+
+        apply_migrations()
+        log_dao = ScrapingLogDAO(get_db_manager())
+        if self.replaying:
+            source_location, source_location_type = str(self.archive_path), 'archive'
+        elif self.sitemap:
+            source_location, source_location_type = self.root_url, 'sitemap'
+        else:
+            source_location, source_location_type = self.root_url, 'http_url'
+        scraping_log_id = log_dao.start_log(
+            event_id=self.event_id,
+            source_location=source_location,
+            source_location_type=source_location_type,
+            output_location=str(self.output_dir)
+        )
+        logger.info(f"Recording run in event_scraping_logs (id: {scraping_log_id})")
+        return log_dao, scraping_log_id
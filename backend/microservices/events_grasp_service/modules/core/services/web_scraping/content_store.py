@@ -0,0 +1,252 @@
+"""
+Content-Addressed Content Store
+
+Cleaned page text keyed by the sha256 of its UTF-8 bytes. Blobs are appended
+as individual gzip members to shard files (rolled over at SHARD_MAX_BYTES), so
+any blob can be read with one seek, and a SQLite index maps each key to its
+shard and offset. The store is shared by all scrapers and runs: a page whose
+text is identical to one stored before - in another event, or a previous
+crawl - is stored once.
+
+Scrape runs using the store keep per-page metadata (url, title, content_key)
+in their page manifest; iter_documents() joins the two for downstream
+consumers such as the vector store uploaders.
+"""
+
+import os
+import gzip
+import json
+import sqlite3
+import hashlib
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
+
+from .manifest import MANIFEST_FILE, METADATA_FILE, PageManifest
+
+CONTENT_STORE_DIR = Path.home() / "runtime_data" / "datasets" / "content_store"
+INDEX_FILE = "index.db"
+SHARDS_DIR = "shards"
+SHARD_MAX_BYTES = 64 * 1024 * 1024
+
+
+def content_key(text: str) -> str:
+    """Return the store key (sha256 hex digest) of a page's cleaned text."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def render_document(url: str, title: str, scraped_at: str, text: str,
+                    author: Optional[str] = None, published: Optional[str] = None) -> str:
+    """Render a page as the text document written to disk and uploaded."""
+    return (
+        f"URL: {url}\n"
+        f"Title: {title}\n"
+        + (f"Author: {author}\n" if author else "")
+        + (f"Published: {published}\n" if published else "")
+        + f"Scraped: {scraped_at}\n"
+        + "=" * 80 + "\n\n"
+        + text
+    )
+
+
+class ContentStore:
+    """Append-only, deduplicating store of compressed page text."""
+
+    def __init__(self, root: Path = CONTENT_STORE_DIR):
+        """
+        Open (or create) the store.
+
+        Args:
+            root: Store directory holding index.db and the shards/ directory
+        """
+        self.root = Path(root)
+        self.shards_dir = self.root / SHARDS_DIR
+        self.shards_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.root / INDEX_FILE))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('''CREATE TABLE IF NOT EXISTS blobs (
+            key TEXT PRIMARY KEY,
+            shard TEXT NOT NULL,
+            offset INTEGER NOT NULL,
+            stored_size INTEGER NOT NULL,
+            raw_size INTEGER NOT NULL,
+            created_at DATETIME
+        )''')
+        self.conn.commit()
+        self._shard_name: Optional[str] = None
+        self._shard_file: Optional[BinaryIO] = None
+        self._readers: Dict[str, BinaryIO] = {}
+
+    def _writable_shard(self) -> Tuple[str, BinaryIO]:
+        """Return the shard this writer appends to, rolling over when full."""
+        if self._shard_file is not None and self._shard_file.tell() >= SHARD_MAX_BYTES:
+            self._shard_file.close()
+            self._shard_file = None
+        if self._shard_file is None:
+            # One shard per writer, so concurrent scrapers never interleave appends
+            self._shard_name = f"{datetime.now().strftime('%Y%m%d%H%M%S%f')}-{os.getpid()}.gz"
+            self._shard_file = open(self.shards_dir / self._shard_name, 'ab')
+        return self._shard_name, self._shard_file
+
+    def has(self, key: str) -> bool:
+        """Return True if a blob with this key is stored."""
+        return self.conn.execute('SELECT 1 FROM blobs WHERE key = ?', (key,)).fetchone() is not None
+
+    def put(self, text: str) -> Tuple[str, bool]:
+        """
+        Store page text unless identical text is already stored.
+
+        Args:
+            text: Cleaned page text
+
+        Returns:
+            Tuple of (content key, True if the blob was newly written)
+        """
+        raw = text.encode('utf-8')
+        key = hashlib.sha256(raw).hexdigest()
+        if self.has(key):
+            return key, False
+
+        member = gzip.compress(raw, compresslevel=6)
+        shard, f = self._writable_shard()
+        offset = f.tell()
+        f.write(member)
+        f.flush()
+
+        # The index row is written only once the blob is on disk
+        self.conn.execute(
+            'INSERT OR IGNORE INTO blobs (key, shard, offset, stored_size, raw_size, created_at) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (key, shard, offset, len(member), len(raw), datetime.now().isoformat())
+        )
+        self.conn.commit()
+        return key, True
+
+    def _read(self, shard: str, offset: int, stored_size: int) -> str:
+        f = self._readers.get(shard)
+        if f is None:
+            f = open(self.shards_dir / shard, 'rb')
+            self._readers[shard] = f
+        f.seek(offset)
+        return gzip.decompress(f.read(stored_size)).decode('utf-8')
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored text for a key, or None."""
+        row = self.conn.execute(
+            'SELECT shard, offset, stored_size FROM blobs WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return self._read(*row)
+
+    def locate(self, keys: Iterable[str]) -> Dict[str, Tuple[str, int, int]]:
+        """Map stored keys to (shard, offset, stored_size); unknown keys are left out."""
+        wanted = list(dict.fromkeys(keys))
+        locations = {}
+        for i in range(0, len(wanted), 500):
+            chunk = wanted[i:i + 500]
+            for key, shard, offset, stored_size in self.conn.execute(
+                f"SELECT key, shard, offset, stored_size FROM blobs "
+                f"WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            ):
+                locations[key] = (shard, offset, stored_size)
+        return locations
+
+    def get_many(self, keys: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (key, text) for the stored keys, ordered by shard and offset
+        so reads are sequential. Unknown keys are skipped.
+        """
+        locations = self.locate(keys)
+        for key in sorted(locations, key=locations.get):
+            yield key, self._read(*locations[key])
+
+    def stats(self) -> Dict:
+        """Return blob count and raw/stored byte totals."""
+        blobs, raw_bytes, stored_bytes = self.conn.execute(
+            'SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(stored_size), 0) FROM blobs'
+        ).fetchone()
+        return {
+            'blobs': blobs,
+            'raw_bytes': raw_bytes,
+            'stored_bytes': stored_bytes,
+            'shards': len(list(self.shards_dir.glob('*.gz')))
+        }
+
+    def close(self):
+        if self._shard_file is not None:
+            self._shard_file.close()
+            self._shard_file = None
+        for f in self._readers.values():
+            f.close()
+        self._readers.clear()
+        self.conn.close()
+
+
+@dataclass
+class StoredDocument:
+    """A scraped page whose text lives in the content store (read on demand)."""
+    name: str
+    url: str
+    title: str
+    scraped_at: str
+    content_key: str
+    store: ContentStore = field(repr=False, compare=False)
+    author: Optional[str] = None
+    published: Optional[str] = None
+
+    def read_text(self) -> str:
+        text = self.store.get(self.content_key)
+        if text is None:
+            raise FileNotFoundError(f"Content not in store: {self.content_key}")
+        return text
+
+    def read_bytes(self) -> bytes:
+        """Render the page exactly as the loose .txt file would contain it."""
+        return render_document(self.url, self.title, self.scraped_at, self.read_text(),
+                               self.author, self.published).encode('utf-8')
+
+    def __str__(self) -> str:
+        return f"content-store:{self.content_key}"
+
+
+def iter_documents(output_dir: Path, store: ContentStore) -> Iterator[StoredDocument]:
+    """
+    List the pages of a scrape run whose text is in the content store.
+
+    Documents are yielded in shard/offset order so reading them back is
+    sequential; pages whose key is missing from the store are skipped.
+
+    Args:
+        output_dir: The run's output directory (holding pages.jsonl, or the
+            scrape_metadata.json of runs that predate the manifest)
+        store: Open ContentStore the documents read from
+
+    Returns:
+        Iterator of StoredDocument
+    """
+    output_dir = Path(output_dir)
+    fields = ('url', 'title', 'filename', 'scraped_at', 'content_key', 'author', 'published')
+    if (output_dir / MANIFEST_FILE).exists():
+        records = PageManifest.iter_pages(output_dir / MANIFEST_FILE)
+    else:
+        with open(output_dir / METADATA_FILE, 'r', encoding='utf-8') as f:
+            records = json.load(f).get('pages', [])
+    # Only the fields needed to build documents are kept per page
+    pages = [{k: p.get(k) for k in fields} for p in records if p.get('content_key')]
+
+    locations = store.locate(p['content_key'] for p in pages)
+    pages = sorted((p for p in pages if p['content_key'] in locations),
+                   key=lambda p: locations[p['content_key']])
+    for page in pages:
+        yield StoredDocument(
+            name=page['filename'],
+            url=page['url'],
+            title=page['title'],
+            scraped_at=page['scraped_at'],
+            content_key=page['content_key'],
+            store=store,
+            author=page['author'],
+            published=page['published']
+        )
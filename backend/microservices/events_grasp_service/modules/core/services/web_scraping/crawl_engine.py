@@ -0,0 +1,408 @@
+"""
+Concurrent Crawl Engine
+
+Asyncio-based crawl engine shared by the web scrapers. Pages are fetched by a
+bounded pool of workers with a per-host concurrency limit, and links are
+expanded through an iterative breadth-first frontier instead of recursion.
+
+Parsing and saving a page is delegated to a handler object exposing
+``handle_page(result, depth) -> List[str]`` which returns the links to follow.
+Handlers may also expose ``request_headers(url) -> Dict[str, str]`` to add
+per-request headers (e.g. conditional-GET validators); 304 responses are then
+passed to the handler like any other result. Handlers exposing an async
+``page_backpressure()`` have it awaited after every page, so a consumer of
+saved pages can hold the crawl back without blocking the event loop.
+
+CPU-bound parsing can be moved off the event loop by giving the engine a
+parse pool (e.g. a ProcessPoolExecutor): handlers exposing
+``parse_job(result) -> Optional[Tuple[callable, *args]]`` have that job run
+in the pool, and its return value is passed as
+``handle_page(result, depth, parsed)``. The raw response bytes are handed to
+the worker as-is.
+
+An optional FrontierStore makes the frontier durable: discovered URLs are
+written through before they are queued and marked done once handled.
+
+An optional RateController paces requests per host: each host's robots.txt
+is read once for a Crawl-delay, every request waits for a token from the
+host's bucket, and 429/503 responses are retried after Retry-After (or the
+backed-off interval) up to MAX_THROTTLE_RETRIES times.
+
+With a LinkGraph the frontier is a priority queue instead of FIFO: queued
+URLs are ordered by PageRank over the links seen so far, re-ranked on a
+geometric schedule as the graph grows. Combined with max_pages this fetches
+the best-linked pages first when the crawl budget is limited; URLs left
+over stay queued in the persistent frontier, if any.
+"""
+
+import time
+import asyncio
+import logging
+import itertools
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import aiohttp
+
+from .frontier_store import FrontierStore, STATUS_DONE, STATUS_FAILED
+from .link_graph import LinkGraph
+from .rate_control import MAX_RETRY_AFTER, RateController, THROTTLE_STATUSES, robots_crawl_delay
+
+logger = logging.getLogger(__name__)
+
+# Defaults
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST_LIMIT = 4
+DEFAULT_TIMEOUT = 30
+MAX_THROTTLE_RETRIES = 3
+ROBOTS_TIMEOUT = 10
+
+# Pages handled before the first PageRank re-ranking, and growth of the interval
+RERANK_FIRST = 10
+RERANK_GROWTH = 1.25
+
+
+@dataclass
+class FetchResult:
+    """Raw HTTP response for a fetched page."""
+    url: str
+    status: int
+    headers: Dict[str, str]  # lower-cased header names
+    content: bytes
+    elapsed: float
+
+
+@dataclass
+class CrawlStats:
+    """Counters collected during a crawl."""
+    pages_fetched: int = 0
+    pages_failed: int = 0
+    pages_not_modified: int = 0
+    bytes_downloaded: int = 0
+    throttle_retries: int = 0
+    pages_over_budget: int = 0
+    reranks: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.pages_fetched / self.elapsed_seconds
+
+    def to_dict(self) -> Dict:
+        return {
+            'pages_fetched': self.pages_fetched,
+            'pages_failed': self.pages_failed,
+            'pages_not_modified': self.pages_not_modified,
+            'bytes_downloaded': self.bytes_downloaded,
+            'throttle_retries': self.throttle_retries,
+            'pages_over_budget': self.pages_over_budget,
+            'reranks': self.reranks,
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+            'pages_per_second': round(self.pages_per_second, 2)
+        }
+
+
+class CrawlEngine:
+    """Bounded-concurrency BFS crawler."""
+
+    def __init__(self, handler, max_depth: int = 1,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+                 timeout: int = DEFAULT_TIMEOUT,
+                 headers: Optional[Dict[str, str]] = None,
+                 visited: Optional[Set[str]] = None,
+                 frontier: Optional[FrontierStore] = None,
+                 parse_pool: Optional[Executor] = None,
+                 rate_controller: Optional[RateController] = None,
+                 link_graph: Optional[LinkGraph] = None,
+                 max_pages: Optional[int] = None):
+        """
+        Initialize the crawl engine.
+
+        Args:
+            handler: Object implementing handle_page(result, depth) -> links
+            max_depth: Maximum depth for following links (0 = seeds only)
+            concurrency: Number of concurrent fetch workers
+            per_host_limit: Maximum in-flight requests per host
+            timeout: Total request timeout in seconds
+            headers: Default request headers
+            visited: Optional shared set of already visited URLs (a set or CompactUrlSet)
+            frontier: Optional persistent frontier to write through to
+            parse_pool: Optional executor running the handler's parse jobs
+            rate_controller: Optional adaptive per-host rate controller
+            link_graph: Optional link graph (filled by the handler) whose PageRank orders the frontier
+            max_pages: Optional cap on the number of pages fetched
+        """
+        self.handler = handler
+        self.max_depth = max_depth
+        self.concurrency = max(1, concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.visited_urls: Set[str] = visited if visited is not None else set()
+        self.frontier = frontier
+        self.parse_pool = parse_pool
+        self.rate_controller = rate_controller
+        self.link_graph = link_graph
+        self.max_pages = max_pages
+        self.stats = CrawlStats()
+        self._dispatched = 0
+        self._handled = 0
+        self._next_rerank = RERANK_FIRST
+        self._sequence = itertools.count()
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._robots: Dict[str, asyncio.Task] = {}
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent requests to the URL's host."""
+        host = urlparse(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.per_host_limit)
+            self._host_slots[host] = slot
+        return slot
+
+    def _enqueue_many(self, queue: asyncio.Queue, urls: Iterable[str], depth: int):
+        """Add URLs to the frontier, skipping those already seen."""
+        new_urls: List[str] = []
+        # A CompactUrlSet confirms hash matches against the frontier, which only has this batch after add_many
+        batch: Set[str] = set()
+        for url in urls:
+            if url in batch or url in self.visited_urls:
+                continue
+            batch.add(url)
+            self.visited_urls.add(url)
+            new_urls.append(url)
+
+        if self.frontier is not None and new_urls:
+            self.frontier.add_many((url, depth) for url in new_urls)
+
+        for url in new_urls:
+            self._put(queue, url, depth)
+
+    def _new_queue(self) -> asyncio.Queue:
+        return asyncio.PriorityQueue() if self.link_graph is not None else asyncio.Queue()
+
+    def _put(self, queue: asyncio.Queue, url: str, depth: int):
+        """Queue a URL; with a link graph, higher-ranked URLs come out first."""
+        if self.link_graph is None:
+            queue.put_nowait((url, depth))
+        else:
+            # The sequence number keeps equal priorities in discovery order
+            queue.put_nowait((-self.link_graph.priority(url), next(self._sequence), url, depth))
+
+    def _rerank(self, queue: asyncio.Queue):
+        """Recompute PageRank and re-order the queued URLs by it."""
+        started = time.perf_counter()
+        self.link_graph.rank()
+        queued = []
+        while not queue.empty():
+            queued.append(queue.get_nowait())
+            queue.task_done()
+        for item in queued:
+            self._put(queue, item[-2], item[-1])
+        self.stats.reranks += 1
+        logger.info(f"Re-ranked {len(queued)} queued URLs over {len(self.link_graph)} pages "
+                    f"in {time.perf_counter() - started:.2f}s")
+
+    def _page_handled(self, queue: asyncio.Queue):
+        self._handled += 1
+        if self.link_graph is not None and self._handled >= self._next_rerank:
+            self._next_rerank = int(self._handled * RERANK_GROWTH) + 1
+            self._rerank(queue)
+
+    async def _fetch_robots(self, session: aiohttp.ClientSession, url: str):
+        """Read the host's robots.txt and apply its Crawl-delay to the rate controller."""
+        parsed = urlparse(url)
+        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+        try:
+            async with session.get(robots_url, timeout=aiohttp.ClientTimeout(total=ROBOTS_TIMEOUT)) as response:
+                if response.status != 200:
+                    return
+                body = await response.text(errors='replace')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"Could not read {robots_url}: {e}")
+            return
+
+        delay = robots_crawl_delay(body.splitlines(), self.headers.get('User-Agent', '*'))
+        if delay:
+            logger.info(f"{parsed.netloc}: robots.txt Crawl-delay {delay}s")
+            self.rate_controller.set_crawl_delay(url, delay)
+
+    async def _pace(self, session: aiohttp.ClientSession, url: str):
+        """Wait until the rate controller lets a request to the URL's host go out."""
+        host = urlparse(url).netloc
+        robots = self._robots.get(host)
+        if robots is None:
+            robots = asyncio.ensure_future(self._fetch_robots(session, url))
+            self._robots[host] = robots
+        await robots
+
+        while True:
+            wait = self.rate_controller.try_acquire(url)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def _mark_done(self, url: str, status: str):
+        if self.frontier is not None:
+            self.frontier.mark_done(url, status)
+
+    async def fetch(self, session: aiohttp.ClientSession, url: str) -> Optional[FetchResult]:
+        """
+        Fetch a single URL.
+
+        Args:
+            session: Shared aiohttp session
+            url: URL to fetch
+
+        Returns:
+            FetchResult or None if the request failed
+        """
+        request_headers = None
+        if hasattr(self.handler, 'request_headers'):
+            request_headers = self.handler.request_headers(url)
+
+        rate = self.rate_controller
+        async with self._host_slot(url):
+            for attempt in range(MAX_THROTTLE_RETRIES + 1):
+                timeout = self.timeout
+                if rate is not None:
+                    await self._pace(session, url)
+                    timeout = rate.timeout(url, self.timeout)
+                started = time.perf_counter()
+                try:
+                    async with session.get(url, headers=request_headers,
+                                           timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                        content = await response.read()
+                        headers = {k.lower(): v for k, v in response.headers.items()}
+                        status = response.status
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if rate is not None:
+                        rate.record_error(url)
+                    logger.error(f"Failed to fetch {url}: {e}")
+                    self.stats.pages_failed += 1
+                    return None
+
+                elapsed = time.perf_counter() - started
+                if rate is not None:
+                    retry_after = rate.record(url, status, elapsed, headers)
+                    if (status in THROTTLE_STATUSES and attempt < MAX_THROTTLE_RETRIES
+                            and (retry_after is None or retry_after <= MAX_RETRY_AFTER)):
+                        pause = f", Retry-After {retry_after:.0f}s" if retry_after is not None else ""
+                        logger.warning(f"Throttled by {urlparse(url).netloc} (HTTP {status}{pause}), retrying {url}")
+                        self.stats.throttle_retries += 1
+                        continue
+                break
+
+            if status >= 400:
+                logger.error(f"Failed to fetch {url}: HTTP {status}")
+                self.stats.pages_failed += 1
+                return None
+            result = FetchResult(url=url, status=status, headers=headers, content=content, elapsed=elapsed)
+
+        self.stats.pages_fetched += 1
+        if result.status == 304:
+            self.stats.pages_not_modified += 1
+        self.stats.bytes_downloaded += len(content)
+        return result
+
+    async def parse(self, result: FetchResult) -> Any:
+        """
+        Run the handler's parse job for a fetched page in the parse pool.
+
+        Returns:
+            The job's return value, or None when there is no pool or no job
+        """
+        if self.parse_pool is None or not hasattr(self.handler, 'parse_job'):
+            return None
+        job = self.handler.parse_job(result)
+        if job is None:
+            return None
+        func, *args = job
+        return await asyncio.get_running_loop().run_in_executor(self.parse_pool, func, *args)
+
+    async def _worker(self, session: aiohttp.ClientSession, queue: asyncio.Queue):
+        """Pull URLs from the frontier until cancelled."""
+        while True:
+            *_, url, depth = await queue.get()
+            if self.max_pages is not None and self._dispatched >= self.max_pages:
+                # Budget spent: leave the URL queued in the persistent frontier
+                self.stats.pages_over_budget += 1
+                queue.task_done()
+                continue
+            self._dispatched += 1
+            try:
+                logger.info(f"Scraping: {url} (depth: {depth})")
+                result = await self.fetch(session, url)
+                if result is None:
+                    self._mark_done(url, STATUS_FAILED)
+                    continue
+
+                parsed = await self.parse(result)
+                if parsed is None:
+                    links = self.handler.handle_page(result, depth) or []
+                else:
+                    links = self.handler.handle_page(result, depth, parsed) or []
+                if hasattr(self.handler, 'page_backpressure'):
+                    await self.handler.page_backpressure()
+                if depth < self.max_depth:
+                    self._enqueue_many(queue, links, depth + 1)
+                self._mark_done(url, STATUS_DONE)
+                self._page_handled(queue)
+            except Exception as e:
+                logger.error(f"Failed to process {url}: {e}")
+                self._mark_done(url, STATUS_FAILED)
+            finally:
+                queue.task_done()
+
+    async def crawl(self, seeds: Iterable[str],
+                    resume: Iterable[Tuple[str, int]] = (),
+                    seed_depth: int = 0) -> CrawlStats:
+        """
+        Crawl breadth-first starting from the seed URLs.
+
+        Args:
+            seeds: Starting URLs
+            resume: (url, depth) pairs left queued by an interrupted crawl;
+                they must already be in the visited set
+            seed_depth: Depth assigned to the seeds (max_depth fetches them
+                without following their links, e.g. for sitemap seeds)
+
+        Returns:
+            CrawlStats for the run
+        """
+        self.stats = CrawlStats()
+        self._dispatched = 0
+        self._handled = 0
+        self._next_rerank = RERANK_FIRST
+        queue = self._new_queue()
+        if self.link_graph is not None and len(self.link_graph):
+            # Resuming with a saved graph: order the leftover URLs by it
+            self.link_graph.rank()
+        for url, depth in resume:
+            self._put(queue, url, depth)
+        self._enqueue_many(queue, seeds, seed_depth)
+
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        async with aiohttp.ClientSession(headers=self.headers, timeout=timeout,
+                                         connector=connector) as session:
+            workers = [
+                asyncio.create_task(self._worker(session, queue))
+                for _ in range(self.concurrency)
+            ]
+            await queue.join()
+
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        self.stats.elapsed_seconds = time.perf_counter() - self.stats.started_at
+        return self.stats
+
@@ -0,0 +1,129 @@
+"""
+Near-Duplicate Detection
+
+64-bit SimHash fingerprints of cleaned page text plus a banded LSH index for
+Hamming-distance lookups. Two pages whose fingerprints differ in at most
+``max_distance`` bits are near-duplicates (tag archives, pagination variants,
+reposts with a different header).
+
+The index splits each fingerprint into ``max_distance + 1`` bands; by the
+pigeonhole principle two fingerprints within the distance agree exactly on at
+least one band, so a lookup only compares against fingerprints sharing a band
+instead of scanning every page seen so far.
+"""
+
+import re
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .extraction import DEFAULT_BACKEND, ExtractedPage, extract_page
+
+FINGERPRINT_BITS = 64
+DEFAULT_MAX_DISTANCE = 3
+SHINGLE_SIZE = 3
+
+DUPLICATE_ACTIONS = ('skip', 'link')
+
+_TOKEN = re.compile(r'\w+')
+_BIT_SHIFTS = np.arange(FINGERPRINT_BITS, dtype=np.uint64)
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def simhash(text: str, shingle_size: int = SHINGLE_SIZE) -> int:
+    """
+    Compute the 64-bit SimHash of a text over word shingles.
+
+    Args:
+        text: Cleaned page text
+        shingle_size: Words per shingle
+
+    Returns:
+        Fingerprint as an unsigned 64-bit int (0 for empty text)
+    """
+    tokens = _TOKEN.findall(text.lower())
+    if len(tokens) >= shingle_size:
+        shingles = [' '.join(tokens[i:i + shingle_size]) for i in range(len(tokens) - shingle_size + 1)]
+    else:
+        shingles = [' '.join(tokens)] if tokens else []
+    if not shingles:
+        return 0
+
+    hashes = np.fromiter((_shingle_hash(s) for s in shingles), dtype=np.uint64, count=len(shingles))
+    # Per bit position: +1 for every shingle with the bit set, -1 otherwise
+    ones = ((hashes[:, None] >> _BIT_SHIFTS) & np.uint64(1)).sum(axis=0, dtype=np.int64)
+    bits = (2 * ones > len(shingles)).astype(np.uint64)
+    return int((bits << _BIT_SHIFTS).sum())
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def extract_with_fingerprint(content: bytes, base_url: str, backend: str = DEFAULT_BACKEND,
+                             site_extractors: bool = True) -> ExtractedPage:
+    """Extract a page and fingerprint its text (parse pool job)."""
+    page = extract_page(content, base_url, backend, site_extractors)
+    page.fingerprint = simhash(page.text)
+    return page
+
+
+class NearDuplicateIndex:
+    """In-memory banded LSH index over SimHash fingerprints."""
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        """
+        Args:
+            max_distance: Largest Hamming distance (in bits) treated as a near-duplicate
+        """
+        if not 0 <= max_distance < FINGERPRINT_BITS // 2:
+            raise ValueError(f"max_distance must be between 0 and {FINGERPRINT_BITS // 2 - 1}")
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        width = FINGERPRINT_BITS // bands
+        # The last band absorbs the remainder bits
+        self._bands: List[Tuple[int, int]] = [
+            (i * width, (width if i < bands - 1 else FINGERPRINT_BITS - i * width))
+            for i in range(bands)
+        ]
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in self._bands]
+        self._owners: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def _band_keys(self, fingerprint: int):
+        for table, (shift, width) in zip(self._tables, self._bands):
+            yield table, (fingerprint >> shift) & ((1 << width) - 1)
+
+    def find(self, fingerprint: int) -> Optional[str]:
+        """Return the URL of an indexed near-duplicate of the fingerprint, or None."""
+        for table, key in self._band_keys(fingerprint):
+            for candidate in table.get(key, ()):
+                if hamming_distance(candidate, fingerprint) <= self.max_distance:
+                    return self._owners[candidate]
+        return None
+
+    def add(self, fingerprint: int, url: str):
+        """Index a fingerprint; the first URL seen for an exact fingerprint is kept."""
+        if fingerprint in self._owners:
+            return
+        self._owners[fingerprint] = url
+        for table, key in self._band_keys(fingerprint):
+            table.setdefault(key, []).append(fingerprint)
+
+    def check_and_add(self, fingerprint: int, url: str) -> Optional[str]:
+        """
+        Look up a page and index it when it is not a near-duplicate.
+
+        Returns:
+            URL of the page it duplicates, or None if it was added
+        """
+        original = self.find(fingerprint)
+        if original is None:
+            self.add(fingerprint, url)
+        return original
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Event Scraper
+
+Generic scraper driven by an event row: the crawl starts at the event's
+source_url and its domain/path scope is derived from that URL. The frontier
+and visited set are persisted in SQLite next to the output, so an interrupted
+crawl resumes where it stopped. Progress is written to event_scraping_logs.
+
+Output is saved to ~/runtime_data/datasets/events/<event_id>/latest-content/
+"""
+
+import sys
+import asyncio
+import logging
+from pathlib import Path
+from dataclasses import dataclass
+from urllib.parse import urlparse
+from typing import Dict, Optional, Tuple
+
+try:
+    from .base_scraper import BaseScraper, DEFAULT_PARSE_WORKERS
+    from .crawl_engine import CrawlEngine, DEFAULT_CONCURRENCY, DEFAULT_PER_HOST_LIMIT
+    from .dedup import DEFAULT_MAX_DISTANCE, DUPLICATE_ACTIONS
+    from .extraction import DEFAULT_BACKEND, EXTRACTION_BACKENDS
+    from .rate_control import DEFAULT_INITIAL_RATE, DEFAULT_MAX_RATE
+    from .frontier_store import FRONTIER_FILE, FrontierStore
+    from .link_graph import GRAPH_FILE, LinkGraph
+    from ...integrations.db import get_db_manager
+    from ...models.event import create_event_model
+    from ...dao.impl.event_dao import EventDAO
+    from ...dao.impl.scraping_log_dao import ScrapingLogDAO
+except ImportError:
+    # Running as a script: resolve through the repository root on PYTHONPATH
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.base_scraper import (
+        BaseScraper, DEFAULT_PARSE_WORKERS
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.crawl_engine import (
+        CrawlEngine, DEFAULT_CONCURRENCY, DEFAULT_PER_HOST_LIMIT
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.dedup import (
+        DEFAULT_MAX_DISTANCE, DUPLICATE_ACTIONS
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.extraction import (
+        DEFAULT_BACKEND, EXTRACTION_BACKENDS
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.rate_control import (
+        DEFAULT_INITIAL_RATE, DEFAULT_MAX_RATE
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.frontier_store import (
+        FRONTIER_FILE, FrontierStore
+    )
+    from backend.microservices.events_grasp_service.modules.core.services.web_scraping.link_graph import (
+        GRAPH_FILE, LinkGraph
+    )
+    from backend.microservices.events_grasp_service.modules.core.integrations.db import get_db_manager
+    from backend.microservices.events_grasp_service.modules.core.models.event import create_event_model
+    from backend.microservices.events_grasp_service.modules.core.dao.impl.event_dao import EventDAO
+    from backend.microservices.events_grasp_service.modules.core.dao.impl.scraping_log_dao import ScrapingLogDAO
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Configuration
+EVENTS_DATASETS_DIR = Path.home() / "runtime_data" / "datasets" / "events"
+
+
+def event_output_dir(event_id: int) -> Path:
+    """Default output directory for an event's scraped content."""
+    return EVENTS_DATASETS_DIR / str(event_id) / "latest-content"
+
+
+@dataclass
+class CrawlScope:
+    """Domain and path-prefix rules for which links belong to a crawl."""
+    netloc: str
+    path_prefix: str = '/'
+
+    @staticmethod
+    def _host(netloc: str) -> str:
+        netloc = netloc.lower()
+        return netloc[4:] if netloc.startswith('www.') else netloc
+
+    @classmethod
+    def from_source_url(cls, source_url: str, path_prefix: Optional[str] = None) -> 'CrawlScope':
+        """
+        Derive the scope from an event's source URL.
+
+        The domain must match (ignoring a leading "www.") and the path must
+        start with the first path segment of the source URL, e.g.
+        https://aws.amazon.com/blogs/aws/some-post/ -> aws.amazon.com + /blogs/.
+
+        Args:
+            source_url: The event's source_url
+            path_prefix: Optional explicit path prefix overriding the derived one
+        """
+        parsed = urlparse(source_url)
+        if path_prefix is None:
+            segments = [s for s in parsed.path.split('/') if s]
+            # A trailing segment without a slash is a page, not a section
+            if segments and not parsed.path.endswith('/'):
+                segments = segments[:-1]
+            path_prefix = f"/{segments[0]}/" if segments else '/'
+        return cls(netloc=cls._host(parsed.netloc), path_prefix=path_prefix)
+
+    def contains(self, parsed) -> bool:
+        """Return True if a parsed URL is inside the scope."""
+        if parsed.scheme not in ('http', 'https'):
+            return False
+        if self._host(parsed.netloc) != self.netloc:
+            return False
+        return (parsed.path or '/').startswith(self.path_prefix)
+
+
+class EventScraper(BaseScraper):
+    """Resumable scraper for an event's source_url."""
+
+    display_name = "Event Web Scraper"
+
+    def __init__(self, event_id: int, source_url: str, output_dir: Optional[Path] = None,
+                 path_prefix: Optional[str] = None, **kwargs):
+        """
+        Initialize the scraper.
+
+        Args:
+            event_id: Event the crawl belongs to (used for event_scraping_logs)
+            source_url: The event's source_url (crawl root)
+            output_dir: Directory to save scraped content (default: per-event directory)
+            path_prefix: Optional explicit path prefix for the crawl scope
+            **kwargs: Passed through to BaseScraper (max_depth, concurrency, incremental, ...)
+        """
+        super().__init__(
+            output_dir=output_dir or event_output_dir(event_id),
+            root_url=source_url,
+            event_id=event_id,
+            **kwargs
+        )
+        self.scope = CrawlScope.from_source_url(source_url, path_prefix)
+        self.frontier: Optional[FrontierStore] = None
+        self.resuming = False
+
+    @classmethod
+    def from_event_id(cls, event_id: int, **kwargs) -> 'EventScraper':
+        """Load the event from the database and build a scraper for it."""
+        dbm = get_db_manager()
+        EventModel = create_event_model(dbm.Base)
+        event = EventDAO(dbm, EventModel).get_event(event_id)
+        if event is None:
+            raise ValueError(f"Event not found: {event_id}")
+        if not event.source_url:
+            raise ValueError(f"Event {event_id} has no source_url")
+        return cls(event_id=event.event_id, source_url=event.source_url, **kwargs)
+
+    @property
+    def frontier_path(self) -> Path:
+        # Outside the output directory (like the archive), which clear_existing removes
+        return self.output_dir.parent / FRONTIER_FILE
+
+    def is_in_scope(self, parsed) -> bool:
+        return self.scope.contains(parsed)
+
+    def record_page(self, data: Dict):
+        super().record_page(data)
+        if self.frontier is not None:
+            self.frontier.save_page(data['url'], data)
+
+    def prepare_run(self):
+        super().prepare_run()
+        if self.replaying:
+            # Replays never touch the crawl frontier
+            return
+        self.frontier = FrontierStore(self.frontier_path)
+        # Hash matches in the compact visited set are confirmed against the frontier
+        self.visited_urls.exact = self.frontier.contains
+        if self.resuming:
+            counts = self.frontier.counts()
+            logger.info(f"Resuming interrupted crawl: {counts}")
+            self.visited_urls.update(self.frontier.known_urls())
+            for page in self.frontier.completed_pages():
+                self.manifest.append(page)
+                self.index_page(page)
+            self.pages_recorded = self.manifest.count
+            if self.link_graph is not None and (self.output_dir / GRAPH_FILE).exists():
+                self.link_graph = LinkGraph.load(self.output_dir / GRAPH_FILE)
+                logger.info(f"Loaded link graph with {len(self.link_graph)} pages")
+        else:
+            self.frontier.reset()
+            self.frontier.set_meta('source_url', self.root_url)
+
+    def close_run(self):
+        if self.frontier is not None:
+            self.visited_urls.exact = None
+            self.frontier.close()
+            self.frontier = None
+        super().close_run()
+
+    def start_scraping_log(self) -> Tuple[Optional[ScrapingLogDAO], Optional[int]]:
+        """Reuse the interrupted run's event_scraping_logs row when resuming."""
+        previous_id = self.frontier.get_meta('scraping_log_id') if self.resuming else None
+        if previous_id is not None:
+            logger.info(f"Continuing event_scraping_logs row {previous_id}")
+            log_dao = ScrapingLogDAO(get_db_manager())
+            log_dao.update_progress(int(previous_id), self.pages_recorded)
+            return log_dao, int(previous_id)
+
+        log_dao, scraping_log_id = super().start_scraping_log()
+        if scraping_log_id is not None and self.frontier is not None:
+            self.frontier.set_meta('scraping_log_id', str(scraping_log_id))
+        return log_dao, scraping_log_id
+
+    def build_engine(self) -> CrawlEngine:
+        engine = super().build_engine()
+        engine.frontier = self.frontier
+        return engine
+
+    def crawl(self, serial: bool = False):
+        """Crawl from the source URL, or continue the persisted frontier."""
+        if serial:
+            logger.warning("Serial mode is not resumable; using the CrawlEngine")
+
+        engine = self.build_engine()
+        if self.resuming:
+            pending = self.frontier.pending()
+            logger.info(f"Continuing with {len(pending)} queued URLs")
+            asyncio.run(engine.crawl([], resume=pending))
+        else:
+            logger.info(f"Starting from: {self.root_url} (scope: {self.scope.netloc}{self.scope.path_prefix})")
+            seeds, depth = self.seed_urls()
+            asyncio.run(engine.crawl(seeds, seed_depth=depth))
+
+    def run(self, clear_existing: bool = True, serial: bool = False, resume: bool = True,
+            replay: bool = False) -> Dict:
+        """
+        Run the scraper, resuming an interrupted crawl when one is found.
+
+        Args:
+            clear_existing: Whether to clear existing content before a fresh crawl
+            serial: Ignored (event crawls always use the CrawlEngine)
+            resume: Continue an interrupted crawl instead of starting over
+            replay: Rebuild the output from the crawl archive instead of fetching
+
+        Returns:
+            Dictionary with scraping results
+        """
+        self.resuming = not replay and resume and FrontierStore.has_pending_at(self.frontier_path)
+        if self.resuming:
+            clear_existing = False
+        result = super().run(clear_existing=clear_existing, serial=serial, replay=replay)
+        result['event_id'] = self.event_id
+        result['resumed'] = self.resuming
+        return result
+
+
+def main():
+    """Main entry point for the event scraper."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Event Web Scraper (crawls events.source_url)')
+    parser.add_argument('--event-id', type=int, required=True,
+                        help='Event whose source_url should be crawled')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Discard any interrupted crawl, clear existing content and re-scrape')
+    parser.add_argument('--max-depth', type=int, default=2,
+                        help='Maximum depth for following links (default: 2)')
+    parser.add_argument('--output-dir', type=str,
+                        help='Output directory (default: ~/runtime_data/datasets/events/<event_id>/latest-content)')
+    parser.add_argument('--path-prefix', type=str,
+                        help='Override the path prefix derived from the source URL')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Number of concurrent fetch workers (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--per-host-limit', type=int, default=DEFAULT_PER_HOST_LIMIT,
+                        help=f'Maximum in-flight requests per host (default: {DEFAULT_PER_HOST_LIMIT})')
+    parser.add_argument('--host-rate', type=float, default=DEFAULT_INITIAL_RATE,
+                        help=f'Requests per second each host starts at, adapted during the crawl (default: {DEFAULT_INITIAL_RATE})')
+    parser.add_argument('--max-host-rate', type=float, default=DEFAULT_MAX_RATE,
+                        help=f'Upper bound on requests per second per host, 0 = no rate control (default: {DEFAULT_MAX_RATE})')
+    parser.add_argument('--link-graph', action='store_true',
+                        help='Capture the link graph and fetch the highest-PageRank pages first')
+    parser.add_argument('--max-pages', type=int,
+                        help='Stop after fetching this many pages (crawl budget)')
+    parser.add_argument('--sitemap', action='store_true',
+                        help="Take the pages from the site's sitemaps instead of following links")
+    parser.add_argument('--sitemap-url', action='append',
+                        help='Sitemap or sitemap index URL (repeatable; default: from robots.txt, else /sitemap.xml)')
+    parser.add_argument('--parser', choices=sorted(EXTRACTION_BACKENDS), default=DEFAULT_BACKEND,
+                        help=f'HTML extraction backend (default: {DEFAULT_BACKEND})')
+    parser.add_argument('--generic-extraction', action='store_true',
+                        help='Ignore site-specific extractors and keep all non-boilerplate page text')
+    parser.add_argument('--parse-workers', type=int, default=DEFAULT_PARSE_WORKERS,
+                        help=f'Processes for parsing/cleaning pages, 0 = inline (default: {DEFAULT_PARSE_WORKERS})')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only re-parse pages that changed since the last run (conditional GET)')
+    parser.add_argument('--archive', action='store_true',
+                        help='Append every raw response to the crawl archive (.warc.gz)')
+    parser.add_argument('--replay', action='store_true',
+                        help='Rebuild the output from the crawl archive without network access')
+    parser.add_argument('--archive-path', type=str,
+                        help='Crawl archive file (default: <output-dir>/../archive/crawl.warc.gz)')
+    parser.add_argument('--content-store', action='store_true',
+                        help='Save page text to the shared content-addressed store instead of .txt files')
+    parser.add_argument('--content-store-path', type=str,
+                        help='Content store directory (default: ~/runtime_data/datasets/content_store)')
+    parser.add_argument('--near-duplicates', choices=DUPLICATE_ACTIONS,
+                        help='Detect near-duplicate pages and skip them, or link them to the original')
+    parser.add_argument('--near-duplicate-distance', type=int, default=DEFAULT_MAX_DISTANCE,
+                        help=f'Maximum SimHash distance in bits for a near-duplicate (default: {DEFAULT_MAX_DISTANCE})')
+
+    args = parser.parse_args()
+
+    try:
+        scraper = EventScraper.from_event_id(
+            args.event_id,
+            output_dir=Path(args.output_dir) if args.output_dir else None,
+            path_prefix=args.path_prefix,
+            max_depth=args.max_depth,
+            concurrency=args.concurrency,
+            per_host_limit=args.per_host_limit,
+            host_rate=args.host_rate,
+            max_host_rate=args.max_host_rate or None,
+            link_graph=args.link_graph,
+            max_pages=args.max_pages,
+            sitemap=args.sitemap,
+            sitemap_urls=args.sitemap_url,
+            incremental=args.incremental,
+            parser=args.parser,
+            site_extractors=not args.generic_extraction,
+            parse_workers=args.parse_workers,
+            archive=args.archive,
+            archive_path=Path(args.archive_path) if args.archive_path else None,
+            content_store=args.content_store,
+            content_store_path=Path(args.content_store_path) if args.content_store_path else None,
+            near_duplicates=args.near_duplicates,
+            near_duplicate_distance=args.near_duplicate_distance
+        )
+        result = scraper.run(
+            clear_existing=args.refresh or not scraper.output_dir.exists(),
+            resume=not args.refresh,
+            replay=args.replay
+        )
+    except (ValueError, FileNotFoundError) as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+
+    if result['success']:
+        if result['replayed']:
+            action = 'Replayed'
+        elif result['resumed']:
+            action = 'Resumed and scraped'
+        else:
+            action = 'Successfully scraped'
+        print(f"\n✅ {action} {result['total_pages']} pages for event {result['event_id']}")
+        if result['throttle_events']:
+            print(f"⏳ Throttled {result['throttle_events']} times (see host_rates in scrape_metadata.json)")
+        print(f"📁 Output directory: {result['output_directory']}")
+    else:
+        print("\n❌ Scraping failed")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
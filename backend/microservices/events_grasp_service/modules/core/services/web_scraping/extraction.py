@@ -0,0 +1,403 @@
+"""
+HTML Extraction Backends
+
+Turns a raw HTML response into title, cleaned text and outbound links.
+
+- bs4:  BeautifulSoup with the pure-Python html.parser; the tree is walked
+        once per output (title, links, then boilerplate removal and text).
+- lxml: parses once with lxml and produces all three outputs in a single
+        iterwalk traversal, skipping boilerplate subtrees for the text while
+        still collecting the links inside them.
+
+Both backends are plain functions of (content, base_url) so they can run in
+worker processes.
+
+Pages of sites with a registered SiteExtractor (aws.amazon.com/blogs to
+start with) skip the generic path: precompiled XPath selectors pull only the
+article body, title, author and publication date, and the generic backend is
+used when a page does not have the expected structure.
+"""
+
+import re
+from dataclasses import dataclass, field
+from urllib.parse import urljoin, urlparse
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+
+# Elements whose text is dropped as boilerplate
+BOILERPLATE_TAGS = frozenset(['script', 'style', 'nav', 'footer', 'header', 'aside', 'noscript'])
+
+# Link prefixes that never point to crawlable pages
+SKIP_LINK_PREFIXES = ('#', 'javascript:', 'mailto:', 'tel:')
+
+_EXCESS_NEWLINES = re.compile(r'\n{3,}')
+
+DEFAULT_BACKEND = 'lxml'
+
+
+@dataclass
+class ExtractedPage:
+    """Title, cleaned text and absolute outbound links of a page."""
+    title: str
+    text: str
+    links: List[str] = field(default_factory=list)
+    fingerprint: Optional[int] = None  # SimHash of text, when near-duplicate detection is on
+    author: Optional[str] = None
+    published: Optional[str] = None
+    extractor: Optional[str] = None  # Name of the SiteExtractor used, None for the generic path
+
+
+def normalize_link(base_url: str, href: str):
+    """
+    Resolve a link against the page URL and strip its query and fragment.
+
+    Returns:
+        Absolute URL, or None for anchors/javascript/mailto/tel links
+    """
+    href = href.strip()
+    if not href or href.startswith(SKIP_LINK_PREFIXES):
+        return None
+    parsed = urlparse(urljoin(base_url, href))
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+
+
+def normalize_text(strings) -> str:
+    """Join text fragments one per line, dropping blank lines and padding."""
+    lines = []
+    for fragment in strings:
+        for line in fragment.split('\n'):
+            line = line.strip()
+            if line:
+                lines.append(line)
+    text = '\n'.join(lines)
+    return _EXCESS_NEWLINES.sub('\n\n', text).strip()
+
+
+# ---------------------------------------------------------------------------
+# BeautifulSoup backend
+# ---------------------------------------------------------------------------
+
+def soup_title(soup: BeautifulSoup) -> str:
+    """Extract page title from a BeautifulSoup tree."""
+    title_tag = soup.find('title')
+    if title_tag:
+        return title_tag.get_text().strip()
+
+    h1_tag = soup.find('h1')
+    if h1_tag:
+        return h1_tag.get_text().strip()
+
+    return "Untitled"
+
+
+def soup_links(soup: BeautifulSoup, base_url: str) -> List[str]:
+    """Extract absolute links (deduplicated, document order) from a BeautifulSoup tree."""
+    links = {}
+    for a_tag in soup.find_all('a', href=True):
+        link = normalize_link(base_url, a_tag['href'])
+        if link:
+            links[link] = None
+    return list(links)
+
+
+def soup_text(soup: BeautifulSoup) -> str:
+    """Remove boilerplate elements from a BeautifulSoup tree and return its cleaned text."""
+    # Remove script and style elements
+    for element in soup(list(BOILERPLATE_TAGS)):
+        element.decompose()
+
+    # Remove comments
+    for comment in soup.find_all(string=lambda text: isinstance(text, str) and text.strip().startswith('<!--')):
+        comment.extract()
+
+    return normalize_text([soup.get_text(separator='\n')])
+
+
+def extract_with_bs4(content: bytes, base_url: str) -> ExtractedPage:
+    """Extract a page with BeautifulSoup (links are collected before boilerplate removal)."""
+    soup = BeautifulSoup(content, 'html.parser')
+    title = soup_title(soup)
+    links = soup_links(soup, base_url)
+    text = soup_text(soup)
+    return ExtractedPage(title=title, text=text, links=links)
+
+
+# ---------------------------------------------------------------------------
+# lxml backend
+# ---------------------------------------------------------------------------
+
+_LXML_PARSER = lxml_html.HTMLParser(remove_comments=True, remove_pis=True)
+
+
+def parse_lxml(content: bytes):
+    """Parse raw HTML with lxml, returning the root element or None for empty/unparseable input."""
+    if not content or not content.strip():
+        return None
+    try:
+        return lxml_html.fromstring(content, parser=_LXML_PARSER)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def extract_with_lxml(content: bytes, base_url: str) -> ExtractedPage:
+    """Extract a page with lxml in a single traversal."""
+    root = parse_lxml(content)
+    if root is None:
+        return ExtractedPage(title="Untitled", text="")
+    return extract_lxml_tree(root, base_url)
+
+
+def extract_lxml_tree(root, base_url: str) -> ExtractedPage:
+    """Generic extraction from an already parsed lxml tree."""
+    title = None
+    first_h1 = None
+    links: Dict[str, None] = {}
+    strings: List[str] = []
+    skip_depth = 0
+
+    for event, element in etree.iterwalk(root, events=('start', 'end')):
+        tag = element.tag
+        if not isinstance(tag, str):
+            # Comments/PIs that survived parsing: only their tail is content
+            if event == 'end' and not skip_depth and element.tail:
+                strings.append(element.tail)
+            continue
+
+        if event == 'start':
+            if tag == 'a':
+                href = element.get('href')
+                if href:
+                    link = normalize_link(base_url, href)
+                    if link:
+                        links[link] = None
+            elif tag == 'title' and title is None:
+                title = element.text_content().strip()
+            elif tag == 'h1' and first_h1 is None:
+                first_h1 = element
+
+            if tag in BOILERPLATE_TAGS:
+                skip_depth += 1
+            elif not skip_depth and element.text:
+                strings.append(element.text)
+        else:
+            if tag in BOILERPLATE_TAGS:
+                skip_depth -= 1
+            if not skip_depth and element.tail:
+                strings.append(element.tail)
+
+    if not title and first_h1 is not None:
+        title = first_h1.text_content().strip()
+
+    return ExtractedPage(
+        title=title or "Untitled",
+        text=normalize_text(strings),
+        links=list(links)
+    )
+
+
+EXTRACTION_BACKENDS: Dict[str, Callable[[bytes, str], ExtractedPage]] = {
+    'bs4': extract_with_bs4,
+    'lxml': extract_with_lxml,
+}
+
+
+# ---------------------------------------------------------------------------
+# Site-specific extractors
+# ---------------------------------------------------------------------------
+
+_HREFS = etree.XPath('//a/@href', smart_strings=False)
+
+
+def _compile(expressions) -> List[etree.XPath]:
+    if isinstance(expressions, str):
+        expressions = [expressions]
+    return [etree.XPath(expression, smart_strings=False) for expression in expressions]
+
+
+def _element_text(element) -> str:
+    """Cleaned text of a subtree, skipping boilerplate elements inside it."""
+    strings: List[str] = []
+    skip_depth = 0
+    for event, node in etree.iterwalk(element, events=('start', 'end')):
+        tag = node.tag
+        if not isinstance(tag, str):
+            continue
+        if event == 'start':
+            if tag in BOILERPLATE_TAGS:
+                skip_depth += 1
+            elif not skip_depth and node.text:
+                strings.append(node.text)
+        else:
+            if tag in BOILERPLATE_TAGS:
+                skip_depth -= 1
+            # The tail of the subtree root lies outside it
+            if not skip_depth and node.tail and node is not element:
+                strings.append(node.tail)
+    return normalize_text(strings)
+
+
+class SiteExtractor:
+    """
+    Precompiled XPath rules that pull the article out of one site's pages.
+
+    Every field takes one expression or a list tried in order; the first
+    non-empty result wins. Pages whose body expressions match nothing are
+    left to the generic backend.
+    """
+
+    def __init__(self, name: str, domain: str, body: Sequence[str], path_prefix: str = '/',
+                 title: Sequence[str] = (), author: Sequence[str] = (), published: Sequence[str] = ()):
+        """
+        Args:
+            name: Extractor name recorded with every page it handles
+            domain: Host the extractor applies to (exact match)
+            body: Expressions selecting the article body element(s)
+            path_prefix: Only pages under this path are handled
+            title: Expressions returning the title (string or element)
+            author: Expressions returning author names (all matches are joined)
+            published: Expressions returning the publication date
+        """
+        self.name = name
+        self.domain = domain.lower()
+        self.path_prefix = path_prefix
+        self.body = _compile(body)
+        self.title = _compile(title)
+        self.author = _compile(author)
+        self.published = _compile(published)
+
+    def handles(self, path: str) -> bool:
+        return path.startswith(self.path_prefix)
+
+    @staticmethod
+    def _values(expressions: List[etree.XPath], root) -> List[str]:
+        for expression in expressions:
+            values = []
+            for result in expression(root):
+                value = result.text_content() if hasattr(result, 'text_content') else str(result)
+                value = ' '.join(value.split())
+                if value and value not in values:
+                    values.append(value)
+            if values:
+                return values
+        return []
+
+    def extract(self, root, base_url: str) -> Optional[ExtractedPage]:
+        """
+        Extract the article from a parsed page.
+
+        Returns:
+            ExtractedPage, or None when the page has no body matching the rules
+        """
+        body = []
+        for expression in self.body:
+            body = expression(root)
+            if body:
+                break
+        if not body:
+            return None
+
+        links: Dict[str, None] = {}
+        for href in _HREFS(root):
+            link = normalize_link(base_url, href)
+            if link:
+                links[link] = None
+
+        title = self._values(self.title, root)
+        author = self._values(self.author, root)
+        published = self._values(self.published, root)
+        return ExtractedPage(
+            title=title[0] if title else "Untitled",
+            text=normalize_text([_element_text(element) for element in body]),
+            links=list(links),
+            author=', '.join(author) or None,
+            published=published[0] if published else None,
+            extractor=self.name
+        )
+
+
+class SiteExtractorRegistry:
+    """Maps page URLs to the SiteExtractor of their site (longest path prefix wins)."""
+
+    def __init__(self, extractors: Iterable[SiteExtractor] = ()):
+        self._by_domain: Dict[str, List[SiteExtractor]] = {}
+        for extractor in extractors:
+            self.register(extractor)
+
+    def register(self, extractor: SiteExtractor):
+        """Add an extractor; it takes precedence over shorter path prefixes on its domain."""
+        extractors = self._by_domain.setdefault(extractor.domain, [])
+        extractors.append(extractor)
+        extractors.sort(key=lambda e: len(e.path_prefix), reverse=True)
+
+    def match(self, url: str) -> Optional[SiteExtractor]:
+        """Return the extractor for a URL, or None to use the generic path."""
+        parsed = urlparse(url)
+        for extractor in self._by_domain.get(parsed.netloc.lower(), ()):
+            if extractor.handles(parsed.path):
+                return extractor
+        return None
+
+    def __len__(self) -> int:
+        return sum(len(extractors) for extractors in self._by_domain.values())
+
+
+AWS_BLOG_EXTRACTOR = SiteExtractor(
+    name='aws-blogs',
+    domain='aws.amazon.com',
+    path_prefix='/blogs/',
+    body=[
+        "//section[@property='articleBody']",
+        "//article//*[contains(concat(' ', normalize-space(@class), ' '), ' blog-post-content ')]",
+    ],
+    title=[
+        "//article//h1[contains(@property, 'headline')]",
+        "//meta[@property='og:title']/@content",
+        "//h1",
+        "//title",
+    ],
+    author=[
+        "//article//*[@property='author']//*[@property='name']",
+        "//meta[@name='author']/@content",
+    ],
+    published=[
+        "//article//time[@property='datePublished']/@datetime",
+        "//meta[@property='article:published_time']/@content",
+    ],
+)
+
+SITE_EXTRACTORS = SiteExtractorRegistry([AWS_BLOG_EXTRACTOR])
+
+
+def extract_page(content: bytes, base_url: str, backend: str = DEFAULT_BACKEND,
+                 site_extractors: bool = True) -> ExtractedPage:
+    """
+    Extract title, cleaned text and links from raw HTML.
+
+    Args:
+        content: Raw response body
+        base_url: Page URL for resolving relative links
+        backend: 'lxml' (single pass) or 'bs4', for pages without a site extractor
+        site_extractors: Use the registered SiteExtractor of the page's site, if any
+
+    Returns:
+        ExtractedPage
+    """
+    try:
+        extractor = EXTRACTION_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown extraction backend: {backend}")
+
+    site_extractor = SITE_EXTRACTORS.match(base_url) if site_extractors else None
+    if site_extractor is not None:
+        root = parse_lxml(content)
+        if root is None:
+            return ExtractedPage(title="Untitled", text="")
+        page = site_extractor.extract(root, base_url)
+        if page is not None:
+            return page
+        if backend == 'lxml':
+            # Reuse the tree rather than parsing the page again
+            return extract_lxml_tree(root, base_url)
+    return extractor(content, base_url)
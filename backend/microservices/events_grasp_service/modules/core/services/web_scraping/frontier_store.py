@@ -0,0 +1,155 @@
+"""
+Persistent Crawl Frontier
+
+SQLite-backed frontier and visited set for long crawls. Every discovered URL
+is written through before it is queued, and marked done once processed, so a
+crawl interrupted by a crash or restart can resume from the queued rows
+instead of starting over.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Kept apart from the page state database so the two stores never share locks or journal mode
+FRONTIER_FILE = "crawl_frontier.db"
+
+STATUS_QUEUED = 'queued'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+
+class FrontierStore:
+    """Write-through store for the crawl frontier, visited set and page records."""
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the frontier database.
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('''CREATE TABLE IF NOT EXISTS frontier (
+            url TEXT PRIMARY KEY,
+            depth INTEGER NOT NULL,
+            status VARCHAR(20) NOT NULL DEFAULT 'queued',
+            page_json TEXT,
+            enqueued_at DATETIME,
+            updated_at DATETIME
+        )''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_frontier_status ON frontier(status)')
+        self.conn.execute('''CREATE TABLE IF NOT EXISTS crawl_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )''')
+        self.conn.commit()
+
+    @staticmethod
+    def has_pending_at(db_path: Path) -> bool:
+        """Return True if the frontier at db_path has unfinished URLs."""
+        db_path = Path(db_path)
+        if not db_path.exists():
+            return False
+        conn = sqlite3.connect(str(db_path))
+        try:
+            row = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'frontier'"
+            ).fetchone()
+            if row is None:
+                return False
+            return conn.execute(
+                'SELECT 1 FROM frontier WHERE status = ? LIMIT 1', (STATUS_QUEUED,)
+            ).fetchone() is not None
+        finally:
+            conn.close()
+
+    def reset(self):
+        """Forget the previous crawl (frontier and metadata)."""
+        self.conn.execute('DELETE FROM frontier')
+        self.conn.execute('DELETE FROM crawl_meta')
+        self.conn.commit()
+
+    def add_many(self, items: Iterable[Tuple[str, int]]):
+        """Persist newly discovered (url, depth) pairs; known URLs are ignored."""
+        now = datetime.now().isoformat()
+        self.conn.executemany(
+            'INSERT OR IGNORE INTO frontier (url, depth, status, enqueued_at) VALUES (?, ?, ?, ?)',
+            [(url, depth, STATUS_QUEUED, now) for url, depth in items]
+        )
+        self.conn.commit()
+
+    def mark_done(self, url: str, status: str = STATUS_DONE):
+        """Mark a URL as processed (done or failed)."""
+        self.conn.execute(
+            'UPDATE frontier SET status = ?, updated_at = ? WHERE url = ?',
+            (status, datetime.now().isoformat(), url)
+        )
+        self.conn.commit()
+
+    def save_page(self, url: str, page: Dict):
+        """
+        Store the metadata record of a scraped page.
+
+        A page recorded without being queued (a sitemap page skipped as
+        unchanged) is added as done, so it counts as visited.
+        """
+        now = datetime.now().isoformat()
+        self.conn.execute(
+            '''INSERT INTO frontier (url, depth, status, page_json, enqueued_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT(url) DO UPDATE SET page_json = excluded.page_json''',
+            (url, page.get('depth', 0), STATUS_DONE, json.dumps(page), now, now)
+        )
+        self.conn.commit()
+
+    def pending(self) -> List[Tuple[str, int]]:
+        """Return queued URLs in breadth-first order."""
+        return [
+            (row[0], row[1]) for row in self.conn.execute(
+                'SELECT url, depth FROM frontier WHERE status = ? ORDER BY depth, rowid',
+                (STATUS_QUEUED,)
+            )
+        ]
+
+    def contains(self, url: str) -> bool:
+        """Return True if the URL is in the frontier (exact visited check)."""
+        return self.conn.execute('SELECT 1 FROM frontier WHERE url = ?', (url,)).fetchone() is not None
+
+    def known_urls(self) -> Iterator[str]:
+        """Stream every URL already in the frontier (the visited set)."""
+        for row in self.conn.cursor().execute('SELECT url FROM frontier'):
+            yield row[0]
+
+    def completed_pages(self) -> Iterator[Dict]:
+        """Stream the page records of URLs finished before a resume."""
+        for row in self.conn.cursor().execute(
+            'SELECT page_json FROM frontier WHERE status = ? AND page_json IS NOT NULL ORDER BY rowid',
+            (STATUS_DONE,)
+        ):
+            yield json.loads(row[0])
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of URLs per status."""
+        return {
+            row[0]: row[1] for row in self.conn.execute(
+                'SELECT status, COUNT(*) FROM frontier GROUP BY status'
+            )
+        }
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute('SELECT value FROM crawl_meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        self.conn.execute('INSERT OR REPLACE INTO crawl_meta (key, value) VALUES (?, ?)', (key, value))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
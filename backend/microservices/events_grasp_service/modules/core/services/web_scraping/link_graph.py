@@ -0,0 +1,201 @@
+"""
+Link Graph
+
+The in-scope link structure of a crawl: page -> pages it links to. Edges
+are appended to flat uint32 arrays while crawling and compacted into CSR
+form (indptr/indices) for ranking and storage, so the graph costs 8 bytes
+per edge plus the URL table.
+
+PageRank is computed by NumPy power iteration over the CSR arrays (one
+weighted bincount per iteration); a 100k-node, 1M-edge graph ranks in well
+under a second. The crawl engine uses the scores to fetch the best-linked
+pages first, and they are stored per page for retrieval boosting.
+"""
+
+import logging
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+GRAPH_FILE = "link_graph.npz"
+
+DEFAULT_DAMPING = 0.85
+DEFAULT_TOLERANCE = 1e-8
+DEFAULT_MAX_ITERATIONS = 100
+
+
+def pagerank(indptr: np.ndarray, indices: np.ndarray, damping: float = DEFAULT_DAMPING,
+             tol: float = DEFAULT_TOLERANCE, max_iter: int = DEFAULT_MAX_ITERATIONS) -> np.ndarray:
+    """
+    PageRank by power iteration over a CSR adjacency (row = linking page).
+
+    Rank of pages without out-links (including discovered but unfetched
+    pages) is spread uniformly, so the scores always sum to 1.
+
+    Args:
+        indptr: CSR row pointers (length n + 1)
+        indices: CSR column indices (link targets)
+        damping: Probability of following a link rather than jumping
+        tol: Stop once the L1 change between iterations falls below this
+        max_iter: Iteration cap
+
+    Returns:
+        float64 array of n scores
+    """
+    n = len(indptr) - 1
+    if n <= 0:
+        return np.zeros(0)
+    out_degree = np.diff(indptr)
+    sources = np.repeat(np.arange(n), out_degree)
+    weights = 1.0 / out_degree[sources]
+    dangling = out_degree == 0
+
+    ranks = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        spread = np.bincount(indices, weights=ranks[sources] * weights, minlength=n)
+        updated = damping * (spread + ranks[dangling].sum() / n) + (1.0 - damping) / n
+        delta = np.abs(updated - ranks).sum()
+        ranks = updated
+        if delta < tol:
+            break
+    return ranks
+
+
+class LinkGraph:
+    """Append-only link graph with PageRank-based crawl priorities."""
+
+    def __init__(self, damping: float = DEFAULT_DAMPING):
+        self.damping = damping
+        self.ids: Dict[str, int] = {}
+        self.urls: List[str] = []
+        self._sources = array('I')
+        self._targets = array('I')
+        # Out-links recorded per node, and rank pushed to nodes created since the last ranking
+        self._out_links = array('I')
+        self._estimates = array('d')
+        self.ranks: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._sources)
+
+    def node(self, url: str) -> int:
+        """Return the node id of a URL, adding it if needed."""
+        node = self.ids.get(url)
+        if node is None:
+            node = len(self.urls)
+            self.ids[url] = node
+            self.urls.append(url)
+            self._out_links.append(0)
+            self._estimates.append(0.0)
+        return node
+
+    def _rank_of(self, node: int) -> float:
+        if self.ranks is not None and node < len(self.ranks):
+            return float(self.ranks[node])
+        return 1.0 / max(1, len(self.urls))
+
+    def add_page(self, url: str, links: Iterable[str]):
+        """
+        Record a page's out-links.
+
+        Args:
+            url: Page URL
+            links: In-scope links found on the page
+        """
+        source = self.node(url)
+        targets = {self.node(link) for link in links if link != url}
+        if not targets or self._out_links[source]:
+            # Pages are recorded once (a resumed or re-fetched page keeps its first links)
+            return
+        self._out_links[source] = len(targets)
+        self._sources.extend([source] * len(targets))
+        self._targets.extend(targets)
+
+        # One step of rank propagation for not-yet-ranked targets, so new
+        # frontier URLs get a comparable priority before the next ranking
+        ranked = len(self.ranks) if self.ranks is not None else 0
+        share = self.damping * self._rank_of(source) / len(targets)
+        for target in targets:
+            if target >= ranked:
+                self._estimates[target] += share
+
+    def csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the graph as (indptr, indices) with duplicate edges removed."""
+        n = len(self.urls)
+        sources = np.frombuffer(self._sources, dtype=np.uint32).astype(np.uint64)
+        targets = np.frombuffer(self._targets, dtype=np.uint32).astype(np.uint64)
+        keys = np.unique((sources << np.uint64(32)) | targets)
+        rows = (keys >> np.uint64(32)).astype(np.int64)
+        indices = (keys & np.uint64(0xFFFFFFFF)).astype(np.int64)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+        return indptr, indices
+
+    def rank(self, tol: float = DEFAULT_TOLERANCE, max_iter: int = DEFAULT_MAX_ITERATIONS) -> np.ndarray:
+        """Compute PageRank over the current graph and use it for priorities."""
+        indptr, indices = self.csr()
+        self.ranks = pagerank(indptr, indices, self.damping, tol, max_iter)
+        return self.ranks
+
+    def priority(self, url: str) -> float:
+        """Crawl priority of a URL: its last PageRank, or an estimate for newer URLs."""
+        node = self.ids.get(url)
+        if node is None:
+            return 0.0
+        if self.ranks is not None and node < len(self.ranks):
+            return float(self.ranks[node])
+        return (1.0 - self.damping) / len(self.urls) + self._estimates[node]
+
+    def score(self, url: str) -> Optional[float]:
+        """Return the PageRank of a URL from the last ranking, or None."""
+        node = self.ids.get(url)
+        if node is None or self.ranks is None or node >= len(self.ranks):
+            return None
+        return float(self.ranks[node])
+
+    def top(self, count: int = 10) -> Iterator[Tuple[str, float]]:
+        """Yield the highest-ranked (url, score) pairs."""
+        if self.ranks is None:
+            return
+        for node in np.argsort(self.ranks)[::-1][:count]:
+            yield self.urls[node], float(self.ranks[node])
+
+    def save(self, path: Path):
+        """Write the graph (CSR arrays, URL table and ranks) to a compressed .npz file."""
+        indptr, indices = self.csr()
+        ranks = self.ranks if self.ranks is not None and len(self.ranks) == len(self.urls) else \
+            pagerank(indptr, indices, self.damping)
+        urls = '\n'.join(self.urls).encode('utf-8')
+        np.savez_compressed(
+            path,
+            indptr=indptr,
+            indices=indices.astype(np.uint32),
+            ranks=ranks,
+            urls=np.frombuffer(urls, dtype=np.uint8),
+            damping=np.array(self.damping)
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> 'LinkGraph':
+        """Read a graph written by save()."""
+        with np.load(path) as data:
+            graph = cls(damping=float(data['damping']))
+            urls = data['urls'].tobytes().decode('utf-8')
+            graph.urls = urls.split('\n') if urls else []
+            graph.ids = {url: i for i, url in enumerate(graph.urls)}
+            indptr = data['indptr']
+            out_degree = np.diff(indptr)
+            graph._sources = array('I', np.repeat(np.arange(len(graph.urls)), out_degree).astype(np.uint32).tobytes())
+            graph._targets = array('I', data['indices'].astype(np.uint32).tobytes())
+            graph._out_links = array('I', out_degree.astype(np.uint32).tobytes())
+            graph._estimates = array('d', bytes(8 * len(graph.urls)))
+            graph.ranks = data['ranks']
+        return graph
@@ -0,0 +1,195 @@
+"""
+Page Manifest
+
+Per-page scrape records streamed to a JSON Lines file (pages.jsonl) in the
+output directory as pages are scraped, instead of accumulating in memory
+until the end of the run. scrape_metadata.json is derived from it at the
+end of a run by streaming the lines into its "pages" array.
+
+Every record is flushed as it is written and fsync'ed at most once per
+sync interval, so a crash loses at most the last second of pages. While a
+writer has the manifest open, a pages.jsonl.writing marker sits next to it;
+follow() tails the file until the marker goes away, so uploads can start
+while the crawl is still running.
+"""
+
+import os
+import json
+import time
+import socket
+import logging
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "pages.jsonl"
+METADATA_FILE = "scrape_metadata.json"
+WRITING_SUFFIX = ".writing"
+
+# Seconds between fsyncs of the manifest (records are flushed immediately)
+DEFAULT_SYNC_INTERVAL = 1.0
+DEFAULT_POLL_INTERVAL = 0.5
+
+
+def _writing_marker(path: Path) -> Path:
+    return path.with_name(path.name + WRITING_SUFFIX)
+
+
+class PageManifest:
+    """Append-only JSONL writer for page records."""
+
+    def __init__(self, path: Path, sync_interval: float = DEFAULT_SYNC_INTERVAL):
+        """
+        Start a new manifest (an existing file is truncated).
+
+        Args:
+            path: Path to the .jsonl file
+            sync_interval: Seconds between fsyncs (0 = fsync every record)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.sync_interval = sync_interval
+        self.marker = _writing_marker(self.path)
+        self.marker.write_text(json.dumps({
+            'pid': os.getpid(),
+            'host': socket.gethostname(),
+            'started_at': datetime.now().isoformat()
+        }))
+        self.file = open(self.path, 'w', encoding='utf-8')
+        self.count = 0
+        self._synced_at = time.monotonic()
+
+    def append(self, page: Dict):
+        """Write one page record."""
+        self.file.write(json.dumps(page) + '\n')
+        self.file.flush()
+        self.count += 1
+        now = time.monotonic()
+        if now - self._synced_at >= self.sync_interval:
+            os.fsync(self.file.fileno())
+            self._synced_at = now
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        self.marker.unlink(missing_ok=True)
+
+    @staticmethod
+    def writer(path: Path) -> Optional[Dict]:
+        """
+        Return the marker of the scraper that still has the manifest open, or None.
+
+        A marker left behind by a crashed writer on this host is ignored.
+        """
+        try:
+            writer = json.loads(_writing_marker(Path(path)).read_text())
+        except (OSError, ValueError):
+            return None
+        if writer.get('host') == socket.gethostname():
+            try:
+                os.kill(writer['pid'], 0)
+            except ProcessLookupError:
+                return None
+            except (PermissionError, KeyError, TypeError):
+                pass
+        return writer
+
+    @staticmethod
+    def follow(path: Path, poll_interval: float = DEFAULT_POLL_INTERVAL,
+               idle_timeout: Optional[float] = None) -> Iterator[Dict]:
+        """
+        Stream page records while the manifest is being written.
+
+        Complete lines are yielded as they are appended; the iterator ends
+        once no writer has the manifest open and every line is read. If a new
+        run restarts the file, reading starts again from its beginning.
+
+        Args:
+            path: Path to the .jsonl file
+            poll_interval: Seconds to wait for new lines
+            idle_timeout: Stop after this many seconds without new lines (None = wait for the writer)
+
+        Returns:
+            Iterator of page records
+        """
+        path = Path(path)
+        position = 0
+        pending = b''
+        run = None
+        idle_since = time.monotonic()
+        while True:
+            writer = PageManifest.writer(path)
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+
+            started_at = writer.get('started_at') if writer else run
+            if size < position or (run is not None and started_at != run):
+                logger.info(f"{path} was restarted by a new run; reading it from the beginning")
+                position, pending = 0, b''
+            run = started_at
+
+            if size > position:
+                with open(path, 'rb') as f:
+                    f.seek(position)
+                    chunk = f.read(size - position)
+                position += len(chunk)
+                lines = (pending + chunk).split(b'\n')
+                # The last element is an incomplete line (or empty)
+                pending = lines.pop()
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        logger.warning(f"Skipping unreadable manifest line in {path}")
+                idle_since = time.monotonic()
+                continue
+
+            if writer is None:
+                return
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                logger.warning(f"No new pages in {path} for {idle_timeout}s; stopping")
+                return
+            time.sleep(poll_interval)
+
+    @staticmethod
+    def iter_pages(path: Path) -> Iterator[Dict]:
+        """Stream the page records of a manifest, skipping a torn last line."""
+        path = Path(path)
+        if not path.exists():
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable manifest line {line_number} in {path}")
+
+
+def write_metadata(path: Path, metadata: Dict, pages: Iterable[Dict]):
+    """
+    Write scrape_metadata.json with the page records streamed into its "pages" array.
+
+    Args:
+        path: Output JSON path
+        metadata: Run-level fields
+        pages: Page records (e.g. PageManifest.iter_pages)
+    """
+    head = json.dumps(metadata, indent=2)
+    with open(path, 'w', encoding='utf-8') as f:
+        # Re-open the top-level object to append the pages array
+        f.write(head[:-2] if metadata else '{')
+        f.write(',\n  "pages": [' if metadata else '\n  "pages": [')
+        for i, page in enumerate(pages):
+            f.write(('\n    ' if i == 0 else ',\n    ') + json.dumps(page))
+        f.write('\n  ]\n}\n')
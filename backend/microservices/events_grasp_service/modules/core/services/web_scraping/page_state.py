@@ -0,0 +1,115 @@
+"""
+Page State Store
+
+Per-URL validators (ETag, Last-Modified, content hash) kept in a small SQLite
+file next to the scraped output. Incremental scrapes use them to send
+conditional requests and to skip parsing/rewriting pages that did not change.
+"""
+
+import json
+import sqlite3
+import hashlib
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+STATE_FILE = "scrape_state.db"
+
+
+def content_hash(content: bytes) -> str:
+    """Return the sha256 hex digest of a response body."""
+    return hashlib.sha256(content).hexdigest()
+
+
+class PageStateStore:
+    """SQLite-backed validator cache keyed by URL."""
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the state database.
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('''CREATE TABLE IF NOT EXISTS page_state (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            content_hash TEXT NOT NULL,
+            title TEXT,
+            filename TEXT,
+            content_length INTEGER,
+            links_json TEXT,
+            updated_at DATETIME,
+            content_key TEXT,
+            extractor TEXT,
+            author TEXT,
+            published TEXT,
+            simhash TEXT
+        )''')
+        columns = {row['name'] for row in self.conn.execute('PRAGMA table_info(page_state)')}
+        if 'content_key' not in columns:
+            # State files written before the content store existed
+            self.conn.execute('ALTER TABLE page_state ADD COLUMN content_key TEXT')
+        for column in ('extractor', 'author', 'published'):
+            if column not in columns:
+                # Article metadata of site-specific extractors
+                self.conn.execute(f'ALTER TABLE page_state ADD COLUMN {column} TEXT')
+        if 'simhash' not in columns:
+            # Near-duplicate fingerprint, so unchanged pages are indexed without parsing
+            self.conn.execute('ALTER TABLE page_state ADD COLUMN simhash TEXT')
+        self.conn.commit()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the stored state for a URL, or None."""
+        row = self.conn.execute('SELECT * FROM page_state WHERE url = ?', (url,)).fetchone()
+        if row is None:
+            return None
+        state = dict(row)
+        state['links'] = json.loads(state.pop('links_json') or '[]')
+        return state
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a URL."""
+        row = self.conn.execute(
+            'SELECT etag, last_modified FROM page_state WHERE url = ?', (url,)
+        ).fetchone()
+        headers = {}
+        if row is not None:
+            if row['etag']:
+                headers['If-None-Match'] = row['etag']
+            if row['last_modified']:
+                headers['If-Modified-Since'] = row['last_modified']
+        return headers
+
+    def upsert(self, url: str, etag: Optional[str], last_modified: Optional[str],
+               content_hash: str, title: str, filename: str, content_length: int,
+               links: List[str], content_key: Optional[str] = None, extractor: Optional[str] = None,
+               author: Optional[str] = None, published: Optional[str] = None,
+               simhash: Optional[str] = None):
+        """Insert or replace the state for a URL."""
+        self.conn.execute('''INSERT OR REPLACE INTO page_state
+            (url, etag, last_modified, content_hash, title, filename, content_length, links_json,
+             updated_at, content_key, extractor, author, published, simhash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''', (
+            url, etag, last_modified, content_hash, title, filename,
+            content_length, json.dumps(links), datetime.now().isoformat(), content_key,
+            extractor, author, published, simhash
+        ))
+        self.conn.commit()
+
+    def touch_validators(self, url: str, etag: Optional[str], last_modified: Optional[str]):
+        """Refresh the validators of an unchanged page, keeping existing ones when absent."""
+        self.conn.execute('''UPDATE page_state
+            SET etag = COALESCE(?, etag),
+                last_modified = COALESCE(?, last_modified),
+                updated_at = ?
+            WHERE url = ?''', (etag, last_modified, datetime.now().isoformat(), url))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,314 @@
+"""
+Adaptive Per-Host Rate Control
+
+One token bucket per host whose refill rate adapts AIMD-style: it grows while
+responses come back quickly (geometrically until the host first pushes back,
+additively after that), is halved on 429/503, and never exceeds the
+robots.txt Crawl-delay of the host. A Retry-After header blocks the host
+until the given time.
+
+The controller never sleeps itself: try_acquire() either takes a token or
+returns how long the caller should sleep before trying again, so it works
+for both the asyncio CrawlEngine and blocking callers. Waiters re-check after
+sleeping, so a rate increase takes effect for requests already waiting.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from datetime import timezone
+from urllib.parse import urlparse
+from typing import Deque, Dict, Iterable, Optional
+
+# Requests per second per host
+DEFAULT_INITIAL_RATE = 2.0
+DEFAULT_MAX_RATE = 20.0
+MIN_RATE = 0.05
+
+# Rate adjustments
+SLOW_START_FACTOR = 1.2
+ADDITIVE_STEP = 0.2
+BACKOFF_FACTOR = 0.5
+ERROR_BACKOFF_FACTOR = 0.75
+
+# A response is healthy when its latency stays below this multiple of the
+# fastest response seen from the host (with an absolute floor)
+HEALTHY_LATENCY_FACTOR = 3.0
+HEALTHY_LATENCY_FLOOR = 0.5
+
+# Longest Retry-After honored before the request is given up on
+MAX_RETRY_AFTER = 300.0
+
+# Request timeout derived from the host's latency once enough samples exist
+ADAPTIVE_TIMEOUT_FACTOR = 4.0
+ADAPTIVE_TIMEOUT_MIN = 5.0
+ADAPTIVE_TIMEOUT_SAMPLES = 20
+
+THROTTLE_STATUSES = (429, 503)
+
+LATENCY_WINDOW = 1024
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds to wait.
+
+    Args:
+        value: Header value (delta-seconds or an HTTP date)
+        now: Current UNIX time (default: time.time())
+
+    Returns:
+        Seconds to wait (>= 0), or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = time.time() if now is None else now
+    return max(0.0, when.timestamp() - now)
+
+
+def robots_crawl_delay(lines: Iterable[str], user_agent: str) -> Optional[float]:
+    """
+    Return the Crawl-delay robots.txt sets for a user agent.
+
+    urllib.robotparser only accepts whole seconds, while fractional delays
+    are common, so the groups are read here: the group naming the user
+    agent's product token (matched whole and case-insensitively, as RFC 9309
+    specifies) wins over the '*' group.
+
+    Args:
+        lines: robots.txt lines
+        user_agent: User-Agent the crawler sends
+
+    Returns:
+        Seconds between requests, or None if robots.txt sets no delay
+    """
+    product = user_agent.split('/')[0].strip().lower()
+    delays: Dict[str, float] = {}
+    agents: list = []
+    in_rules = False
+    for line in lines:
+        name, sep, value = line.split('#', 1)[0].partition(':')
+        if not sep:
+            continue
+        name, value = name.strip().lower(), value.strip()
+        if name == 'user-agent':
+            if in_rules:
+                agents, in_rules = [], False
+            # An empty name matches no crawler
+            if value:
+                agents.append(value.lower())
+            continue
+        in_rules = True
+        if name == 'crawl-delay':
+            try:
+                delay = float(value)
+            except ValueError:
+                continue
+            for agent in agents:
+                delays.setdefault(agent, delay)
+
+    if product and product != '*' and product in delays:
+        return delays[product]
+    return delays.get('*')
+
+
+def _percentile(ordered: list, q: float) -> float:
+    index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+@dataclass
+class HostRate:
+    """Token bucket and statistics for one host."""
+    host: str
+    rate: float
+    max_rate: float
+    tokens: float = 1.0
+    updated_at: float = field(default_factory=time.monotonic)
+    blocked_until: float = 0.0
+    slow_start: bool = True
+    crawl_delay: Optional[float] = None
+    fastest_latency: Optional[float] = None
+    requests: int = 0
+    throttle_events: int = 0
+    errors: int = 0
+    waited_seconds: float = 0.0
+    peak_rate: float = 0.0
+    first_request_at: Optional[float] = None
+    last_response_at: Optional[float] = None
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def _refill(self, now: float):
+        # Allow a burst of about one second's worth of requests
+        capacity = max(1.0, self.rate)
+        self.tokens = min(capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_acquire(self, now: float) -> float:
+        """Take a token if one is available; otherwise return the seconds until one will be."""
+        if now < self.blocked_until:
+            wait = self.blocked_until - now
+        else:
+            self._refill(now)
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                if self.first_request_at is None:
+                    self.first_request_at = now
+                return 0.0
+            wait = (1.0 - self.tokens) / self.rate
+        self.waited_seconds += wait
+        return wait
+
+    def _set_rate(self, rate: float, now: float):
+        self._refill(now)
+        self.rate = min(self.max_rate, max(MIN_RATE, rate))
+        self.peak_rate = max(self.peak_rate, self.rate)
+
+    def on_response(self, status: int, latency: float, retry_after: Optional[float], now: float):
+        """Adapt the rate to a response."""
+        self.requests += 1
+        self.last_response_at = now
+        self.latencies.append(latency)
+
+        if status in THROTTLE_STATUSES:
+            self.throttle_events += 1
+            self.slow_start = False
+            self._set_rate(self.rate * BACKOFF_FACTOR, now)
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self.blocked_until = max(self.blocked_until, now + min(pause, MAX_RETRY_AFTER))
+            # No burst right after the pause
+            self.tokens = min(self.tokens, 0.0)
+            return
+
+        if self.fastest_latency is None or latency < self.fastest_latency:
+            self.fastest_latency = latency
+        if latency <= max(HEALTHY_LATENCY_FLOOR, self.fastest_latency * HEALTHY_LATENCY_FACTOR):
+            if self.slow_start:
+                self._set_rate(self.rate * SLOW_START_FACTOR, now)
+            else:
+                self._set_rate(self.rate + ADDITIVE_STEP, now)
+
+    def on_error(self, now: float):
+        """Slow down after a timeout or connection error."""
+        self.errors += 1
+        self.slow_start = False
+        self._set_rate(self.rate * ERROR_BACKOFF_FACTOR, now)
+
+    def timeout(self, default: float) -> float:
+        """Request timeout for the host: a multiple of its p99 latency, capped at the default."""
+        if len(self.latencies) < ADAPTIVE_TIMEOUT_SAMPLES:
+            return default
+        p99 = _percentile(sorted(self.latencies), 0.99)
+        return min(default, max(ADAPTIVE_TIMEOUT_MIN, p99 * ADAPTIVE_TIMEOUT_FACTOR))
+
+    def to_dict(self) -> Dict:
+        ordered = sorted(self.latencies)
+        elapsed = (self.last_response_at or 0.0) - (self.first_request_at or 0.0)
+        return {
+            'rate': round(self.rate, 2),
+            'peak_rate': round(self.peak_rate, 2),
+            'max_rate': round(self.max_rate, 2),
+            'crawl_delay': self.crawl_delay,
+            'requests': self.requests,
+            'pages_per_second': round(self.requests / elapsed, 2) if elapsed > 0 else 0.0,
+            'throttle_events': self.throttle_events,
+            'errors': self.errors,
+            'waited_seconds': round(self.waited_seconds, 3),
+            'latency_ms': {
+                'p50': round(_percentile(ordered, 0.50) * 1000, 1),
+                'p90': round(_percentile(ordered, 0.90) * 1000, 1),
+                'p99': round(_percentile(ordered, 0.99) * 1000, 1)
+            } if ordered else None
+        }
+
+
+class RateController:
+    """Registry of per-host token buckets."""
+
+    def __init__(self, initial_rate: float = DEFAULT_INITIAL_RATE,
+                 max_rate: float = DEFAULT_MAX_RATE):
+        """
+        Args:
+            initial_rate: Requests per second a host starts at
+            max_rate: Upper bound on requests per second per host
+        """
+        if initial_rate <= 0 or max_rate <= 0:
+            raise ValueError("Host rates must be positive")
+        self.initial_rate = min(initial_rate, max_rate)
+        self.max_rate = max_rate
+        self.hosts: Dict[str, HostRate] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(url).netloc
+
+    def host(self, url: str) -> HostRate:
+        """Return the bucket for the URL's host, creating it on first use."""
+        host = self.host_of(url)
+        bucket = self.hosts.get(host)
+        if bucket is None:
+            bucket = HostRate(host=host, rate=self.initial_rate, max_rate=self.max_rate,
+                              peak_rate=self.initial_rate)
+            self.hosts[host] = bucket
+        return bucket
+
+    def set_crawl_delay(self, url: str, delay: Optional[float]):
+        """Cap a host's rate at one request per robots.txt Crawl-delay."""
+        if not delay or delay <= 0:
+            return
+        bucket = self.host(url)
+        bucket.crawl_delay = delay
+        bucket.max_rate = min(bucket.max_rate, 1.0 / delay)
+        bucket.rate = min(bucket.rate, bucket.max_rate)
+
+    def try_acquire(self, url: str) -> float:
+        """
+        Take a request token for the URL's host.
+
+        Returns:
+            0 if the request may be sent now, else seconds to sleep before retrying
+        """
+        return self.host(url).try_acquire(time.monotonic())
+
+    def record(self, url: str, status: int, latency: float, headers: Optional[Dict[str, str]] = None) -> Optional[float]:
+        """
+        Feed a response back into the host's rate.
+
+        Args:
+            url: Requested URL
+            status: HTTP status code
+            latency: Seconds from sending the request to the response
+            headers: Response headers (lower-cased names)
+
+        Returns:
+            Seconds the host asked us to back off for (429/503), else None
+        """
+        retry_after = None
+        if status in THROTTLE_STATUSES:
+            retry_after = parse_retry_after((headers or {}).get('retry-after'))
+        self.host(url).on_response(status, latency, retry_after, time.monotonic())
+        return retry_after
+
+    def record_error(self, url: str):
+        self.host(url).on_error(time.monotonic())
+
+    def timeout(self, url: str, default: float) -> float:
+        return self.host(url).timeout(default)
+
+    @property
+    def throttle_events(self) -> int:
+        return sum(bucket.throttle_events for bucket in self.hosts.values())
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per-host rate, throughput, latency percentiles and throttle counts."""
+        return {host: bucket.to_dict() for host, bucket in self.hosts.items()}
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Crawl frontier regression tests.
+
+Event crawls keep the visited set as a CompactUrlSet whose hash matches are
+confirmed against the persistent frontier. A URL must be queued once even
+when it repeats within a batch (sitemaps listing the same page), and a
+sitemap page recorded as unchanged without being fetched must count as
+visited when another page links to it.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/tests/test_crawl_frontier.py
+"""
+
+import sys
+import asyncio
+import tempfile
+from pathlib import Path
+
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.crawl_engine import CrawlEngine
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.frontier_store import (
+    FRONTIER_FILE, FrontierStore, STATUS_DONE
+)
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.url_set import CompactUrlSet
+
+
+def make_engine(frontier: FrontierStore) -> CrawlEngine:
+    visited = CompactUrlSet(exact=frontier.contains)
+    return CrawlEngine(handler=None, visited=visited, frontier=frontier)
+
+
+def queued_urls(queue: asyncio.Queue):
+    return [queue.get_nowait()[0] for _ in range(queue.qsize())]
+
+
+def test_url_repeated_in_batch_is_queued_once():
+    with tempfile.TemporaryDirectory() as tmp:
+        frontier = FrontierStore(Path(tmp) / FRONTIER_FILE)
+        engine = make_engine(frontier)
+        queue = asyncio.Queue()
+        page = "https://example.com/sessions/keynote"
+
+        engine._enqueue_many(queue, [page, "https://example.com/sessions/a", page], depth=1)
+        engine._enqueue_many(queue, [page], depth=2)
+
+        assert queued_urls(queue) == [page, "https://example.com/sessions/a"]
+        assert frontier.counts() == {'queued': 2}
+        frontier.close()
+
+
+def test_page_recorded_without_fetch_counts_as_visited():
+    with tempfile.TemporaryDirectory() as tmp:
+        frontier = FrontierStore(Path(tmp) / FRONTIER_FILE)
+        engine = make_engine(frontier)
+        queue = asyncio.Queue()
+        page = "https://example.com/sessions/unchanged"
+
+        # What discover_from_sitemaps does for a page skipped by lastmod
+        engine.visited_urls.add(page)
+        frontier.save_page(page, {'url': page, 'depth': 1, 'change_status': 'unchanged'})
+        engine._enqueue_many(queue, [page], depth=2)
+
+        assert queued_urls(queue) == []
+        assert frontier.counts() == {STATUS_DONE: 1}
+        assert [p['url'] for p in frontier.completed_pages()] == [page]
+        frontier.close()
+
+
+def test_save_page_keeps_status_of_queued_url():
+    with tempfile.TemporaryDirectory() as tmp:
+        frontier = FrontierStore(Path(tmp) / FRONTIER_FILE)
+        page = "https://example.com/sessions/b"
+        frontier.add_many([(page, 1)])
+        frontier.save_page(page, {'url': page, 'depth': 1})
+
+        assert frontier.counts() == {'queued': 1}
+        assert frontier.pending() == [(page, 1)]
+        frontier.close()
+
+
+if __name__ == '__main__':
+    tests = [(name, test) for name, test in sorted(globals().items()) if name.startswith('test_')]
+    failed = 0
+    for name, test in tests:
+        try:
+            test()
+            print(f"✅ {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {name}: {e}")
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(1 if failed else 0)
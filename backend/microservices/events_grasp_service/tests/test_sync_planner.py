@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Sync planner regression tests.
+
+A re-scrape rewrites every page with a new "Scraped:" timestamp; pages whose
+text did not change must still plan as unchanged, and manifests keyed by
+the earlier raw-bytes hash must be re-keyed rather than re-uploaded.
+
+Usage (from repository root):
+    python backend/microservices/events_grasp_service/tests/test_sync_planner.py
+"""
+
+import sys
+import hashlib
+import tempfile
+from pathlib import Path
+
+from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.sync_planner import plan_sync
+from backend.microservices.events_grasp_service.modules.core.services.vector_dbs.openai.upload_manifest import (
+    HASH_VERSION, UploadManifest, content_hash
+)
+from backend.microservices.events_grasp_service.modules.core.services.web_scraping.content_store import (
+    render_document
+)
+
+PAGE_TEXT = "Keynote with the latest announcements.\n\nSpeakers: Jane Doe"
+
+
+def write_page(datasets_dir: Path, scraped_at: str, text: str = PAGE_TEXT) -> Path:
+    page = datasets_dir / "keynote.txt"
+    page.write_text(render_document("https://example.com/keynote", "Keynote", scraped_at, text,
+                                    author="Jane Doe"), encoding='utf-8')
+    return page
+
+
+def test_rescrape_with_new_timestamp_plans_nothing():
+    with tempfile.TemporaryDirectory() as tmp:
+        datasets_dir = Path(tmp)
+        page = write_page(datasets_dir, "2025-12-01T10:00:00")
+        manifest = UploadManifest(datasets_dir / "store.uploads.json")
+        manifest.bind("vs_test")
+        manifest.record(content_hash(page.read_bytes()), {'file_id': 'file-1', 'filename': page.name})
+
+        write_page(datasets_dir, "2025-12-02T08:30:00")
+        plan = plan_sync([page], manifest)
+
+        assert plan.is_empty
+        assert plan.unchanged == 1
+        assert not (plan.add or plan.replace or plan.detach or plan.rename)
+
+
+def test_changed_text_is_replaced():
+    with tempfile.TemporaryDirectory() as tmp:
+        datasets_dir = Path(tmp)
+        page = write_page(datasets_dir, "2025-12-01T10:00:00")
+        manifest = UploadManifest(datasets_dir / "store.uploads.json")
+        manifest.bind("vs_test")
+        manifest.record(content_hash(page.read_bytes()), {'file_id': 'file-1', 'filename': page.name})
+
+        write_page(datasets_dir, "2025-12-02T08:30:00", PAGE_TEXT + "\nRoom: Venetian A")
+        plan = plan_sync([page], manifest)
+
+        assert len(plan.replace) == 1
+        assert plan.unchanged == 0
+
+
+def test_page_text_mentioning_scraped_is_hashed():
+    first = render_document("https://example.com/a", "A", "t1", "Scraped: yesterday\nbody")
+    second = render_document("https://example.com/a", "A", "t2", "Scraped: today\nbody")
+    assert content_hash(first.encode('utf-8')) != content_hash(second.encode('utf-8'))
+
+
+def test_legacy_manifest_is_rekeyed():
+    with tempfile.TemporaryDirectory() as tmp:
+        datasets_dir = Path(tmp)
+        page = write_page(datasets_dir, "2025-12-01T10:00:00")
+        legacy = hashlib.sha256(page.read_bytes()).hexdigest()
+        manifest_path = datasets_dir / "store.uploads.json"
+        manifest_path.write_text(
+            '{"vector_store_id": "vs_test", "files": {"%s": '
+            '{"file_id": "file-1", "vs_file_id": "file-1", "filename": "%s"}}}' % (legacy, page.name)
+        )
+
+        manifest = UploadManifest(manifest_path)
+        assert manifest.hash_version == 1
+        moved = manifest.upgrade([page])
+
+        assert moved == {legacy: content_hash(page.read_bytes())}
+        assert manifest.hash_version == HASH_VERSION
+        assert plan_sync([page], manifest).is_empty
+
+
+if __name__ == '__main__':
+    tests = [(name, test) for name, test in sorted(globals().items()) if name.startswith('test_')]
+    failed = 0
+    for name, test in tests:
+        try:
+            test()
+            print(f"✅ {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {name}: {e}")
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(1 if failed else 0)